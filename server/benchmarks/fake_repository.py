@@ -0,0 +1,202 @@
+"""
+In-memory IUserRepository for benchmarking the use-case layer
+without a database. Users are listed newest first, like the real one.
+"""
+
+import itertools
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from domain.entities.user import (
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    ProjectionPage,
+    ChangePage,
+    UserSearchCriteria
+)
+from domain.repositories.user_repository import IUserRepository
+
+UPDATABLE_FIELDS = ('name', 'email', 'username', 'phone', 'website')
+
+
+class InMemoryUserRepository(IUserRepository):
+    """Dict-backed user repository; cursors are plain user IDs"""
+
+    def __init__(self):
+        self._users: Dict[int, User] = {}
+        self._modified: Dict[int, datetime] = {}
+        self._by_email: Dict[str, int] = {}
+        self._by_username: Dict[str, int] = {}
+        self._deleted_at: Dict[int, datetime] = {}
+        self._ids = itertools.count(1)
+
+    def _newest_first(self, after_cursor: Optional[str]) -> Iterator[User]:
+        start = int(after_cursor) - 1 if after_cursor else max(self._users, default=0)
+        for user_id in range(start, 0, -1):
+            user = self._users.get(user_id)
+            if user is not None:
+                yield user
+
+    def _page(self, users: Iterator, limit: int, key) -> Tuple[list, Optional[str]]:
+        items = list(itertools.islice(users, limit + 1))
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, str(key(items[-1]))
+
+    def get_all(self) -> List[User]:
+        return list(self._newest_first(None))
+
+    def list_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        items, next_cursor = self._page(self._newest_first(after_cursor), limit, lambda user: user.id)
+        return UserPage(items=items, next_cursor=next_cursor)
+
+    def list_page_projection(
+        self,
+        after_cursor: Optional[str],
+        limit: int,
+        fields: Sequence[str]
+    ) -> ProjectionPage:
+        page = self.list_page(after_cursor, limit)
+        return ProjectionPage(
+            items=[{field: getattr(user, field) for field in fields} for user in page.items],
+            next_cursor=page.next_cursor
+        )
+
+    def search(self, criteria: UserSearchCriteria, after_cursor: Optional[str], limit: int) -> UserPage:
+        def matches(user):
+            if criteria.text:
+                text = criteria.text.lower()
+                if not any(text in value.lower() for value in (user.name, user.email, user.username)):
+                    return False
+            if criteria.email and not user.email.lower().startswith(criteria.email.lower()):
+                return False
+            if criteria.username and not user.username.lower().startswith(criteria.username.lower()):
+                return False
+            return True
+
+        users = (user for user in self._newest_first(after_cursor) if matches(user))
+        items, next_cursor = self._page(users, limit, lambda user: user.id)
+        return UserPage(items=items, next_cursor=next_cursor)
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[User]:
+        return iter([self._users[user_id] for user_id in sorted(self._users)])
+
+    def list_after_id(self, after_id: Optional[int], limit: int) -> List[User]:
+        ids = [user_id for user_id in sorted(self._users) if after_id is None or user_id > after_id]
+        return [self._users[user_id] for user_id in ids[:limit]]
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        return self._users.get(user_id)
+
+    def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        return {user_id: self._users[user_id] for user_id in user_ids if user_id in self._users}
+
+    def get_projection_by_id(self, user_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        user = self._users.get(user_id)
+        return {field: getattr(user, field) for field in fields} if user else None
+
+    def list_changes(self, after_watermark: Optional[str], limit: int, until: datetime) -> ChangePage:
+        # Watermarks are "<timestamp>|<kind>|<id>"; kind 0 = changed, 1 = deleted
+        after = None
+        if after_watermark:
+            timestamp, kind, user_id = after_watermark.split('|')
+            after = (datetime.fromisoformat(timestamp), int(kind), int(user_id))
+        events = sorted(
+            [(stamp, 0, user_id) for user_id, stamp in self._modified.items()]
+            + [(stamp, 1, user_id) for user_id, stamp in self._deleted_at.items()]
+        )
+        events = [event for event in events if event[0] <= until and (after is None or event > after)]
+        page = events[:limit]
+        if not page:
+            return ChangePage(changed=[], deleted=[], watermark=after_watermark)
+        stamp, kind, user_id = page[-1]
+        return ChangePage(
+            changed=[self._users[event[2]] for event in page if event[1] == 0],
+            deleted=[event[2] for event in page if event[1] == 1],
+            watermark=f"{stamp.isoformat()}|{kind}|{user_id}",
+            has_more=len(events) > limit
+        )
+
+    def get_last_modified(self, user_id: int) -> Optional[datetime]:
+        return self._modified.get(user_id)
+
+    def get_table_stamp(self) -> Tuple[Optional[datetime], int]:
+        return max(self._modified.values(), default=None), len(self._users)
+
+    def create(self, user_data: CreateUserDTO) -> User:
+        if user_data.email in self._by_email:
+            raise ValueError("User with this email already exists")
+        if user_data.username in self._by_username:
+            raise ValueError("User with this username already exists")
+        user = User(
+            id=next(self._ids),
+            name=user_data.name,
+            email=user_data.email,
+            username=user_data.username,
+            phone=user_data.phone,
+            website=user_data.website
+        )
+        self._users[user.id] = user
+        self._modified[user.id] = datetime.now(timezone.utc)
+        self._by_email[user.email] = user.id
+        self._by_username[user.username] = user.id
+        return user
+
+    def create_many(self, users_data: List[CreateUserDTO]) -> List[User]:
+        return [self.create(user_data) for user_data in users_data]
+
+    def update(self, user_data: UpdateUserDTO) -> Optional[User]:
+        user = self._users.get(user_data.id)
+        if user is None:
+            return None
+        changes = {
+            field: getattr(user_data, field)
+            for field in UPDATABLE_FIELDS
+            if getattr(user_data, field) is not None
+        }
+        owner = self._by_email.get(changes.get('email'))
+        if owner is not None and owner != user.id:
+            raise ValueError("User with this email already exists")
+        owner = self._by_username.get(changes.get('username'))
+        if owner is not None and owner != user.id:
+            raise ValueError("User with this username already exists")
+
+        updated = replace(user, **changes)
+        del self._by_email[user.email], self._by_username[user.username]
+        self._by_email[updated.email] = user.id
+        self._by_username[updated.username] = user.id
+        self._users[user.id] = updated
+        self._modified[user.id] = datetime.now(timezone.utc)
+        return updated
+
+    def update_many(self, users_data: List[UpdateUserDTO]) -> List[Optional[User]]:
+        return [self.update(user_data) for user_data in users_data]
+
+    def delete(self, user_id: int) -> bool:
+        user = self._users.pop(user_id, None)
+        if user is None:
+            return False
+        del self._modified[user_id], self._by_email[user.email], self._by_username[user.username]
+        self._deleted_at[user_id] = datetime.now(timezone.utc)
+        return True
+
+    def delete_many(self, user_ids: List[int]) -> Set[int]:
+        return {user_id for user_id in user_ids if self.delete(user_id)}
+
+    def exists_by_email(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        owner = self._by_email.get(email)
+        return owner is not None and owner != exclude_id
+
+    def exists_by_username(self, username: str, exclude_id: Optional[int] = None) -> bool:
+        owner = self._by_username.get(username)
+        return owner is not None and owner != exclude_id
+
+    def find_taken(self, emails: List[str], usernames: List[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        return (
+            {email: self._by_email[email] for email in emails if email in self._by_email},
+            {username: self._by_username[username] for username in usernames if username in self._by_username}
+        )
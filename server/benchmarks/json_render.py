@@ -0,0 +1,73 @@
+"""
+Microbenchmark: DRF serializer read path vs fast read path
+
+Run from the server directory:
+    python -m benchmarks.json_render [rows] [repeat]
+
+No database is needed; users are built in memory.
+"""
+
+import os
+import sys
+import timeit
+from dataclasses import asdict
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from domain.entities.user import User  # noqa: E402
+from presentation.renderers import json_renderers  # noqa: E402
+from presentation.renderers.json_renderers import FastJSONRenderer  # noqa: E402
+from presentation.serializers.user_serializers import (  # noqa: E402
+    UserSerializer,
+    users_to_representation
+)
+
+
+def make_users(count):
+    return [
+        User(
+            id=i,
+            name=f"User {i} \u00e9\u2028",
+            email=f"user{i}@example.com",
+            username=f"user{i}",
+            phone="+1 234 567 8900" if i % 2 else None,
+            website=f"https://example.com/{i}" if i % 3 else None
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def serializer_path(users):
+    data = UserSerializer([asdict(user) for user in users], many=True).data
+    return JSONRenderer().render(data)
+
+
+def fast_path(users):
+    return FastJSONRenderer().render(users_to_representation(users))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    users = make_users(rows)
+
+    expected = serializer_path(users)
+    assert fast_path(users) == expected, "fast path output differs from UserSerializer"
+
+    encoder = 'orjson' if json_renderers.orjson is not None else 'stdlib json'
+    print(f"{rows} users x {repeat} runs (encoder: {encoder}, {len(expected)} bytes)")
+
+    baseline = min(timeit.repeat(lambda: serializer_path(users), number=1, repeat=repeat))
+    fast = min(timeit.repeat(lambda: fast_path(users), number=1, repeat=repeat))
+    print(f"  UserSerializer + JSONRenderer: {baseline * 1000:8.2f} ms")
+    print(f"  fast path + FastJSONRenderer:  {fast * 1000:8.2f} ms")
+    print(f"  speedup: {baseline / fast:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
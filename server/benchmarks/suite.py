@@ -0,0 +1,314 @@
+"""
+Benchmark suite: throughput, latency percentiles and queries per operation
+for list, detail, create, update and delete.
+
+Two layers are measured:
+  usecase - UserUseCases over an in-memory repository (no database)
+  http    - the /api/v1/users/ endpoints through Django's test client
+
+Run from the server directory:
+    python -m benchmarks.suite --users 10000 --iterations 200 --output results.json
+    python -m benchmarks.suite --baseline old.json --output new.json
+
+Without DATABASE_URL the HTTP layer runs against a throwaway SQLite
+database. With DATABASE_URL set (e.g. Postgres) the suite seeds its own
+uniquely named users and deletes them again when it finishes.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import django
+
+SEED_BATCH_SIZE = 5000
+READ_WARMUP = 10
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+def summarize(timings, query_counts):
+    """Reduce per-operation timings (seconds) to the figures written to JSON"""
+    ordered = sorted(timings)
+    total = sum(timings)
+    result = {
+        "iterations": len(timings),
+        "total_s": round(total, 6),
+        "ops_per_s": round(len(timings) / total, 2) if total else None,
+        "latency_ms": {
+            "min": round(ordered[0] * 1000, 4),
+            "mean": round(statistics.fmean(ordered) * 1000, 4),
+            "p50": round(percentile(ordered, 50) * 1000, 4),
+            "p95": round(percentile(ordered, 95) * 1000, 4),
+            "p99": round(percentile(ordered, 99) * 1000, 4),
+            "max": round(ordered[-1] * 1000, 4),
+        },
+    }
+    if query_counts is not None:
+        result["queries_per_op"] = {
+            "mean": round(statistics.fmean(query_counts), 2),
+            "max": max(query_counts),
+        }
+    return result
+
+
+def measure(operation, iterations, count_queries=False, warmup=0):
+    """Call operation(i) for each iteration and summarize the timings"""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    for i in range(warmup):
+        operation(i)
+
+    timings = []
+    query_counts = [] if count_queries else None
+    for i in range(iterations):
+        if count_queries:
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                operation(i)
+                timings.append(time.perf_counter() - start)
+            query_counts.append(len(queries.captured_queries))
+        else:
+            start = time.perf_counter()
+            operation(i)
+            timings.append(time.perf_counter() - start)
+    return summarize(timings, query_counts)
+
+
+class PageWalker:
+    """Walks a paginated listing, starting over after the last page"""
+
+    def __init__(self, fetch):
+        self.fetch = fetch
+        self.cursor = None
+
+    def __call__(self, _):
+        self.cursor = self.fetch(self.cursor)
+
+
+def bench_usecases(users, iterations, rng):
+    """Measure UserUseCases against InMemoryUserRepository"""
+    from benchmarks.fake_repository import InMemoryUserRepository
+    from domain.entities.user import CreateUserDTO, UpdateUserDTO
+    from domain.usecases.user_usecases import UserUseCases
+
+    repository = InMemoryUserRepository()
+    for i in range(users):
+        repository.create(CreateUserDTO(
+            name=f"Bench User {i}",
+            email=f"bench{i}@example.com",
+            username=f"bench_{i}"
+        ))
+    usecases = UserUseCases(repository)
+    seeded_ids = list(range(1, users + 1))
+    created_ids = []
+
+    def create(i):
+        user = usecases.create_user(CreateUserDTO(
+            name=f"New User {i}",
+            email=f"new{i}@example.com",
+            username=f"new_{i}"
+        ))
+        created_ids.append(user.id)
+
+    return {
+        "list": measure(PageWalker(
+            lambda cursor: usecases.list_users_page(cursor=cursor).next_cursor
+        ), iterations, warmup=READ_WARMUP),
+        "detail": measure(
+            lambda i: usecases.get_user_by_id(rng.choice(seeded_ids)),
+            iterations, warmup=READ_WARMUP
+        ),
+        "create": measure(create, iterations),
+        "update": measure(
+            lambda i: usecases.update_user(UpdateUserDTO(id=created_ids[i], name=f"Renamed {i}")),
+            iterations
+        ),
+        "delete": measure(lambda i: usecases.delete_user(created_ids[i]), iterations),
+    }
+
+
+def seed_database(users, prefix):
+    """Bulk insert benchmark users; returns their IDs"""
+    from infrastructure.database.models import UserModel
+
+    for start in range(0, users, SEED_BATCH_SIZE):
+        UserModel.objects.bulk_create([
+            UserModel(
+                name=f"Bench User {i}",
+                email=f"{prefix}{i}@example.com",
+                username=f"{prefix}{i}"
+            )
+            for i in range(start, min(start + SEED_BATCH_SIZE, users))
+        ])
+    return list(
+        UserModel.objects.filter(username__startswith=prefix).order_by().values_list('id', flat=True)
+    )
+
+
+def bench_http(users, iterations, rng, prefix):
+    """Measure the REST endpoints through Django's test client"""
+    from django.test import Client
+
+    client = Client(SERVER_NAME='localhost')
+    seeded_ids = seed_database(users, prefix)
+    created_ids = []
+
+    def expect(response, status_code):
+        if response.status_code != status_code:
+            raise RuntimeError(
+                f"{response.request['REQUEST_METHOD']} {response.request['PATH_INFO']} "
+                f"returned {response.status_code}: {response.content[:200]!r}"
+            )
+        return response
+
+    def list_page(cursor):
+        params = {'limit': 50}
+        if cursor:
+            params['cursor'] = cursor
+        return expect(client.get('/api/v1/users/', params), 200).json()['next_cursor']
+
+    def create(i):
+        response = client.post('/api/v1/users/', {
+            'name': f"New User {i}",
+            'email': f"{prefix}new{i}@example.com",
+            'username': f"{prefix}new{i}",
+        }, content_type='application/json')
+        created_ids.append(expect(response, 201).json()['id'])
+
+    return {
+        "list": measure(PageWalker(list_page), iterations, count_queries=True, warmup=READ_WARMUP),
+        "detail": measure(
+            lambda i: expect(client.get(f'/api/v1/users/{rng.choice(seeded_ids)}/'), 200),
+            iterations, count_queries=True, warmup=READ_WARMUP
+        ),
+        "create": measure(create, iterations, count_queries=True),
+        "update": measure(
+            lambda i: expect(client.patch(
+                f'/api/v1/users/{created_ids[i]}/',
+                {'name': f"Renamed {i}"},
+                content_type='application/json'
+            ), 200),
+            iterations, count_queries=True
+        ),
+        "delete": measure(
+            lambda i: expect(client.delete(f'/api/v1/users/{created_ids[i]}/'), 204),
+            iterations, count_queries=True
+        ),
+    }
+
+
+def compare(results, baseline_path):
+    """Print the change in throughput and p95 latency against a previous run"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    print(f"\nCompared with {baseline_path}:")
+    for layer, operations in results.items():
+        for name, current in operations.items():
+            previous = baseline.get(layer, {}).get(name)
+            if not previous or not previous.get("ops_per_s"):
+                continue
+            throughput = (current["ops_per_s"] / previous["ops_per_s"] - 1) * 100
+            p95 = (current["latency_ms"]["p95"] / previous["latency_ms"]["p95"] - 1) * 100
+            print(f"  {layer:8} {name:7} ops/s {throughput:+7.1f}%   p95 {p95:+7.1f}%")
+
+
+def print_results(results):
+    for layer, operations in results.items():
+        print(f"\n[{layer}]")
+        print(f"  {'operation':9} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8}")
+        for name, result in operations.items():
+            latency = result["latency_ms"]
+            queries = result.get("queries_per_op", {}).get("mean", "-")
+            print(
+                f"  {name:9} {result['ops_per_s']:>10} {latency['p50']:>9} "
+                f"{latency['p95']:>9} {latency['p99']:>9} {queries:>8}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="User API benchmark suite")
+    parser.add_argument('--users', type=int, default=10000, help="users to seed (default 10000)")
+    parser.add_argument('--iterations', type=int, default=200, help="operations per benchmark (default 200)")
+    parser.add_argument('--layers', default='usecase,http', help="comma-separated: usecase, http")
+    parser.add_argument('--seed', type=int, default=0, help="random seed for ID selection")
+    parser.add_argument('--no-cache', action='store_true', help="disable the user read-through and list page caches")
+    parser.add_argument('--output', default='benchmark-results.json', help="JSON results file")
+    parser.add_argument('--baseline', help="previous results file to compare against")
+    args = parser.parse_args()
+    layers = [layer.strip() for layer in args.layers.split(',') if layer.strip()]
+
+    # Settings are read at import time, so configure the environment first
+    sqlite_dir = None
+    if not os.getenv('DATABASE_URL'):
+        sqlite_dir = tempfile.mkdtemp(prefix='user-bench-')
+        os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(sqlite_dir, 'bench.sqlite3')}"
+    os.environ.setdefault('DEBUG', 'False')
+    if args.no_cache:
+        os.environ['USER_CACHE_ENABLED'] = 'False'
+        os.environ['USER_LIST_CACHE_ENABLED'] = 'False'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+    django.setup()
+
+    from django.conf import settings
+    from django.core.management import call_command
+    from django.db import connection
+
+    prefix = f"bench{int(time.time())}_"
+    results = {}
+    try:
+        if 'usecase' in layers:
+            print(f"usecase: {args.users} users, {args.iterations} iterations", file=sys.stderr)
+            results['usecase'] = bench_usecases(args.users, args.iterations, random.Random(args.seed))
+        if 'http' in layers:
+            print(f"http: migrating and seeding {args.users} users on {connection.vendor}", file=sys.stderr)
+            call_command('migrate', verbosity=0)
+            results['http'] = bench_http(args.users, args.iterations, random.Random(args.seed), prefix)
+    finally:
+        if 'http' in layers and sqlite_dir is None:
+            from infrastructure.database.models import UserModel
+            UserModel.objects.filter(username__startswith=prefix).delete()
+        connection.close()
+        if sqlite_dir is not None:
+            shutil.rmtree(sqlite_dir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "platform": platform.platform(),
+            "database": connection.vendor,
+            "users": args.users,
+            "iterations": args.iterations,
+            "seed": args.seed,
+            "user_cache_enabled": settings.USER_CACHE_ENABLED,
+            "user_list_cache_enabled": settings.USER_LIST_CACHE_ENABLED,
+        },
+        "results": results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print_results(results)
+    print(f"\nWrote {args.output}")
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,7 @@
 """
 ASGI config for user management project.
+Serves the native async endpoints, including the long-lived
+/api/v1/async/users/events/ stream.
 """
 
 import os
@@ -0,0 +1,44 @@
+"""
+Dependency wiring for the user stack
+Builds the repositories and use cases once per process. The sync views,
+the async views and the admin all share them, so a write through any of
+them is published on the same event bus. The user cache needs no help
+from writers: it is keyed by the users table version.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+
+from domain.usecases.async_user_usecases import AsyncUserUseCases
+from domain.usecases.user_usecases import UserUseCases
+from infrastructure.events.user_event_bus import get_user_event_bus
+from infrastructure.database.table_version import users_table_version
+from infrastructure.repositories.caching_user_repository import CachingUserRepository
+from infrastructure.repositories.django_user_repository import AsyncDjangoUserRepository, DjangoUserRepository
+from infrastructure.repositories.single_flight_user_repository import (
+    AsyncSingleFlightUserRepository,
+    SingleFlightUserRepository
+)
+
+user_events = get_user_event_bus()
+
+# Sync stack
+user_repository = DjangoUserRepository()
+if settings.USER_CACHE_ENABLED:
+    user_repository = CachingUserRepository(
+        user_repository,
+        version=users_table_version,
+        max_entries=settings.USER_CACHE_MAX_ENTRIES,
+        ttl=settings.USER_CACHE_TTL,
+        shared_cache=caches[settings.USER_CACHE_SHARED_ALIAS] if settings.USER_CACHE_SHARED_ALIAS else None
+    )
+if settings.USER_SINGLE_FLIGHT_ENABLED:
+    # Outside the cache, so concurrent lookups also share the version check
+    user_repository = SingleFlightUserRepository(user_repository)
+user_usecases = UserUseCases(user_repository, user_events)
+
+# Async stack
+async_user_repository = AsyncDjangoUserRepository()
+if settings.USER_SINGLE_FLIGHT_ENABLED:
+    async_user_repository = AsyncSingleFlightUserRepository(async_user_repository)
+async_user_usecases = AsyncUserUseCases(async_user_repository, user_events)
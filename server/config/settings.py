@@ -37,6 +37,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'presentation.middleware.request_metrics.RequestMetricsMiddleware',  # First, so it times the whole stack
+    'presentation.middleware.database_routing.PrimaryPinMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',  # CORS middleware
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -81,6 +83,19 @@ DATABASES = {
     )
 }
 
+# Read replicas: comma-separated URLs, exposed as aliases replica_0, replica_1, ...
+DATABASE_REPLICAS = []
+for _index, _url in enumerate(filter(None, map(str.strip, os.getenv('DATABASE_REPLICA_URLS', '').split(',')))):
+    _alias = f'replica_{_index}'
+    DATABASES[_alias] = dj_database_url.parse(_url, conn_max_age=600, conn_health_checks=True)
+    DATABASES[_alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(_alias)
+
+# Route reads of the user tables to replicas; writes always go to the primary
+DATABASE_ROUTERS = ['infrastructure.database.routers.PrimaryReplicaRouter'] if DATABASE_REPLICAS else []
+# Seconds a failed replica is skipped before reads are routed to it again
+DATABASE_REPLICA_RETRY_SECONDS = float(os.getenv('DATABASE_REPLICA_RETRY_SECONDS', '30'))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -120,6 +135,82 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cache framework; LocMem by default, set CACHE_BACKEND/CACHE_LOCATION for Redis or Memcached
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'user-api'),
+    }
+}
+
+# Read-through cache for user lookups by ID, keyed by the users table version
+# (see USER_LIST_CACHE_ENABLED below) so writes from any worker retire it at once
+USER_CACHE_ENABLED = os.getenv('USER_CACHE_ENABLED', 'True') == 'True'
+USER_CACHE_MAX_ENTRIES = int(os.getenv('USER_CACHE_MAX_ENTRIES', '10000'))
+USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', '30'))
+# Alias in CACHES shared across workers; leave empty for in-process only
+USER_CACHE_SHARED_ALIAS = os.getenv('USER_CACHE_SHARED_ALIAS', '')
+
+# Pre-rendered list and search responses, keyed by the users table version that
+# database triggers bump with every write, so any cache alias stays consistent.
+USER_LIST_CACHE_ENABLED = os.getenv('USER_LIST_CACHE_ENABLED', 'True') == 'True'
+USER_LIST_CACHE_ALIAS = os.getenv('USER_LIST_CACHE_ALIAS', 'default')
+USER_LIST_CACHE_TTL = float(os.getenv('USER_LIST_CACHE_TTL', '300'))
+# Larger responses (e.g. the unpaginated list of a big table) are not cached
+USER_LIST_CACHE_MAX_BYTES = int(os.getenv('USER_LIST_CACHE_MAX_BYTES', str(1024 * 1024)))
+
+# Most users a plain GET /api/v1/users/ returns; larger tables must be paged
+USER_LIST_ALL_MAX = int(os.getenv('USER_LIST_ALL_MAX', '10000'))
+
+# Concurrent identical user reads share one in-flight query
+USER_SINGLE_FLIGHT_ENABLED = os.getenv('USER_SINGLE_FLIGHT_ENABLED', 'True') == 'True'
+
+# Rows per INSERT/lookup chunk for bulk user endpoints
+USER_BULK_CHUNK_SIZE = int(os.getenv('USER_BULK_CHUNK_SIZE', '500'))
+
+# Per-request query counting, phase timing and /api/v1/metrics/
+REQUEST_METRICS_ENABLED = os.getenv('REQUEST_METRICS_ENABLED', 'True') == 'True'
+# Expose the timings to clients in a Server-Timing response header
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'True') == 'True'
+
+# Readiness probe: reuse a database check for this many seconds
+HEALTH_READY_CACHE_SECONDS = float(os.getenv('HEALTH_READY_CACHE_SECONDS', '5'))
+# Readiness probe: fail the check if SELECT 1 takes longer than this (seconds)
+HEALTH_DB_TIMEOUT = float(os.getenv('HEALTH_DB_TIMEOUT', '1'))
+
+# Idempotency-Key on user writes: keys and responses are kept in the database
+# (idempotency_keys), so retries coalesce across workers.
+# Seconds a stored response is replayed for
+IDEMPOTENCY_TTL = float(os.getenv('IDEMPOTENCY_TTL', '86400'))
+# Seconds a request may hold a key before another can take it over
+IDEMPOTENCY_LOCK_SECONDS = float(os.getenv('IDEMPOTENCY_LOCK_SECONDS', '30'))
+# Seconds a concurrent request with the same key waits before answering 409
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv('IDEMPOTENCY_WAIT_SECONDS', '10'))
+
+# Server-sent events stream of user changes (/api/v1/async/users/events/).
+# 'memory' fans out within one process; 'postgres' relays through LISTEN/NOTIFY
+# so every worker sees every write.
+USER_EVENTS_BACKEND = os.getenv('USER_EVENTS_BACKEND', 'memory')
+USER_EVENTS_CHANNEL = os.getenv('USER_EVENTS_CHANNEL', 'user_events')
+# Recent events kept per process for Last-Event-ID resume
+USER_EVENTS_BUFFER_SIZE = int(os.getenv('USER_EVENTS_BUFFER_SIZE', '1000'))
+# Events a slow client may fall behind by before it is disconnected to resume
+USER_EVENTS_QUEUE_SIZE = int(os.getenv('USER_EVENTS_QUEUE_SIZE', '256'))
+USER_EVENTS_HEARTBEAT_SECONDS = float(os.getenv('USER_EVENTS_HEARTBEAT_SECONDS', '15'))
+# Reconnect delay suggested to clients (milliseconds)
+USER_EVENTS_RETRY_MS = int(os.getenv('USER_EVENTS_RETRY_MS', '3000'))
+
+# Worker processes serving the app (Gunicorn reads the same variable)
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', '1'))
+if USER_EVENTS_BACKEND == 'memory' and WEB_CONCURRENCY > 1:
+    from django.core.exceptions import ImproperlyConfigured
+
+    # Each worker would only stream the writes it handled itself
+    raise ImproperlyConfigured(
+        f"USER_EVENTS_BACKEND='memory' cannot serve {WEB_CONCURRENCY} workers; "
+        "set USER_EVENTS_BACKEND=postgres or WEB_CONCURRENCY=1"
+    )
+
 # Logging configuration
 LOGGING = {
     'version': 1,
@@ -153,8 +244,17 @@ CORS_ALLOW_HEADERS = [
     'authorization',
     'content-type',
     'dnt',
+    'idempotency-key',
     'origin',
     'user-agent',
     'x-csrftoken',
     'x-requested-with',
 ]
+
+# Let browser clients see that the unpaginated user list is deprecated or cut off
+CORS_EXPOSE_HEADERS = [
+    'deprecation',
+    'link',
+    'x-total-count',
+    'x-truncated',
+]
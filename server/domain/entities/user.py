@@ -4,10 +4,16 @@ No framework dependencies
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 
+from domain.validation.user_validation import validate_user_fields
 
-@dataclass
+# Public fields of a user, in representation order
+USER_FIELDS = ('id', 'name', 'email', 'username', 'phone', 'website')
+
+
+@dataclass(slots=True)
 class User:
     """User entity - represents a user in the system"""
     id: Optional[int]
@@ -16,22 +22,28 @@ class User:
     username: str
     phone: Optional[str] = None
     website: Optional[str] = None
+    # When the stored row last changed; not part of USER_FIELDS
+    updated_at: Optional[datetime] = None
 
     def __post_init__(self):
         """Validate user data"""
-        if not self.name:
-            raise ValueError("Name is required")
-        if not self.email:
-            raise ValueError("Email is required")
-        if not self.username:
-            raise ValueError("Username is required")
-        
-        # Email validation
-        if '@' not in self.email:
-            raise ValueError("Invalid email format")
-
-
-@dataclass
+        validate_user_fields(self)
+
+    @classmethod
+    def from_row(cls, row: Tuple) -> 'User':
+        """
+        Build a User from trusted storage values, skipping validation.
+        Row order is (id, name, email, username, phone, website[, updated_at]).
+        Only for data read back from the database; user input must go
+        through the regular constructor.
+        """
+        user = cls.__new__(cls)
+        user.id, user.name, user.email, user.username, user.phone, user.website = row[:6]
+        user.updated_at = row[6] if len(row) > 6 else None
+        return user
+
+
+@dataclass(slots=True)
 class CreateUserDTO:
     """Data Transfer Object for creating a user"""
     name: str
@@ -41,7 +53,7 @@ class CreateUserDTO:
     website: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserDTO:
     """Data Transfer Object for updating a user"""
     id: int
@@ -50,3 +62,62 @@ class UpdateUserDTO:
     username: Optional[str] = None
     phone: Optional[str] = None
     website: Optional[str] = None
+
+
+@dataclass(slots=True)
+class UserSearchCriteria:
+    """Search filters: text is a substring match, email/username are prefixes"""
+    text: Optional[str] = None
+    email: Optional[str] = None
+    username: Optional[str] = None
+
+
+@dataclass(slots=True)
+class UserPage:
+    """A single page of users from a keyset-paginated listing"""
+    items: List[User]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ProjectionPage:
+    """A page of users reduced to a subset of USER_FIELDS"""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ChangePage:
+    """
+    Users changed and IDs deleted after a watermark, oldest change first.
+    Pass watermark back to get the next changes; has_more means another
+    page is already waiting.
+    """
+    changed: List[User]
+    deleted: List[int]
+    watermark: Optional[str] = None
+    has_more: bool = False
+
+
+# Kinds of UserEvent
+USER_CREATED = 'created'
+USER_UPDATED = 'updated'
+USER_DELETED = 'deleted'
+
+
+@dataclass(slots=True)
+class UserEvent:
+    """A user was created, updated or deleted; user is None for deletions"""
+    type: str
+    user_id: int
+    user: Optional[User] = None
+
+
+@dataclass(slots=True)
+class BulkItemResult:
+    """Outcome of a single item in a bulk operation"""
+    index: int
+    id: Optional[int] = None
+    user: Optional[User] = None
+    error: Optional[str] = None
+    not_found: bool = False
@@ -0,0 +1,43 @@
+"""
+Async Repository Interface - Non-blocking contract for data operations
+Mirrors IUserRepository for use from async views under ASGI
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from domain.entities.user import User, CreateUserDTO, UpdateUserDTO, UserPage
+
+
+class IAsyncUserRepository(ABC):
+    """Interface for async User repository operations"""
+
+    @abstractmethod
+    async def alist_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        """Get one page of users ordered newest first"""
+        pass
+
+    @abstractmethod
+    async def aget_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID"""
+        pass
+
+    @abstractmethod
+    async def acreate(self, user_data: CreateUserDTO) -> User:
+        """
+        Create a new user.
+        Raises ValueError if the email or username is already taken.
+        """
+        pass
+
+    @abstractmethod
+    async def aupdate(self, user_data: UpdateUserDTO) -> Optional[User]:
+        """
+        Update an existing user.
+        Raises ValueError if the new email or username is already taken.
+        """
+        pass
+
+    @abstractmethod
+    async def adelete(self, user_id: int) -> bool:
+        """Delete a user by ID"""
+        pass
@@ -0,0 +1,23 @@
+"""
+Event Publisher Interface - Contract for announcing user changes
+Use cases publish after a successful write; implementations fan the
+events out to subscribers (e.g. server-sent event streams).
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+from domain.entities.user import UserEvent
+
+
+class IUserEventPublisher(ABC):
+    """Interface for publishing user change events"""
+
+    @abstractmethod
+    def publish(self, events: List[UserEvent]) -> None:
+        """Publish events in order; must not block on slow subscribers"""
+        pass
+
+    @abstractmethod
+    async def apublish(self, events: List[UserEvent]) -> None:
+        """Async variant of publish() for the async use cases"""
+        pass
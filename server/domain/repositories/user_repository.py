@@ -4,8 +4,17 @@ Following Dependency Inversion Principle
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
-from domain.entities.user import User, CreateUserDTO, UpdateUserDTO
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from domain.entities.user import (
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    ProjectionPage,
+    ChangePage,
+    UserSearchCriteria
+)
 
 
 class IUserRepository(ABC):
@@ -16,24 +25,117 @@ class IUserRepository(ABC):
         """Get all users"""
         pass
 
+    @abstractmethod
+    def list_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        """
+        Get one page of users ordered newest first.
+        The cursor is opaque to callers; pass back the previous page's next_cursor.
+        """
+        pass
+
+    @abstractmethod
+    def list_page_projection(
+        self,
+        after_cursor: Optional[str],
+        limit: int,
+        fields: Sequence[str]
+    ) -> ProjectionPage:
+        """Like list_page, but only loads and returns the given fields"""
+        pass
+
+    @abstractmethod
+    def search(self, criteria: UserSearchCriteria, after_cursor: Optional[str], limit: int) -> UserPage:
+        """
+        Get one page of users matching the criteria, best matches first.
+        The cursor is opaque to callers; pass back the previous page's next_cursor.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[User]:
+        """Iterate over all users without loading them into memory at once"""
+        pass
+
+    @abstractmethod
+    def list_after_id(self, after_id: Optional[int], limit: int) -> List[User]:
+        """Get up to limit users with an ID above after_id, ordered by ID"""
+        pass
+
     @abstractmethod
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
         pass
 
+    @abstractmethod
+    def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        """Get the users with the given IDs, keyed by ID; missing IDs are left out"""
+        pass
+
+    @abstractmethod
+    def get_projection_by_id(self, user_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """Get only the given fields of a user"""
+        pass
+
+    @abstractmethod
+    def list_changes(self, after_watermark: Optional[str], limit: int, until: datetime) -> ChangePage:
+        """
+        Get up to limit changes (updates and deletions) after the watermark
+        and no later than until, oldest first. Deletions come from tombstones
+        written by delete/delete_many.
+        """
+        pass
+
+    @abstractmethod
+    def get_last_modified(self, user_id: int) -> Optional[datetime]:
+        """Get when a user was last modified, without loading the user"""
+        pass
+
+    @abstractmethod
+    def get_table_stamp(self) -> Tuple[Optional[datetime], int]:
+        """Get the latest modification or deletion time across all users and the user count"""
+        pass
+
     @abstractmethod
     def create(self, user_data: CreateUserDTO) -> User:
-        """Create a new user"""
+        """
+        Create a new user.
+        Raises ValueError if the email or username is already taken.
+        """
+        pass
+
+    @abstractmethod
+    def create_many(self, users_data: List[CreateUserDTO]) -> List[User]:
+        """
+        Create many users in one batch, returned in input order.
+        Raises ValueError if any email or username is already taken.
+        """
         pass
 
     @abstractmethod
     def update(self, user_data: UpdateUserDTO) -> Optional[User]:
-        """Update an existing user"""
+        """
+        Update an existing user.
+        Raises ValueError if the new email or username is already taken.
+        """
+        pass
+
+    @abstractmethod
+    def update_many(self, users_data: List[UpdateUserDTO]) -> List[Optional[User]]:
+        """
+        Apply partial updates to many users in one batch.
+        Returns the updated users in input order, None where the ID does not exist.
+        Raises ValueError if any email or username is already taken.
+        """
         pass
 
     @abstractmethod
     def delete(self, user_id: int) -> bool:
-        """Delete a user by ID"""
+        """Delete a user by ID, leaving a tombstone for the change feed"""
+        pass
+
+    @abstractmethod
+    def delete_many(self, user_ids: List[int]) -> Set[int]:
+        """Delete users by ID in one batch, leaving tombstones; returns the IDs that existed"""
         pass
 
     @abstractmethod
@@ -45,3 +147,11 @@ class IUserRepository(ABC):
     def exists_by_username(self, username: str, exclude_id: Optional[int] = None) -> bool:
         """Check if user exists by username"""
         pass
+
+    @abstractmethod
+    def find_taken(self, emails: List[str], usernames: List[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        Find which of the given emails and usernames already belong to a user.
+        Returns two mappings of taken value to the owning user ID.
+        """
+        pass
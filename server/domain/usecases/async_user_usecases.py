@@ -0,0 +1,71 @@
+"""
+Async Use Cases - Business Logic Layer for the async stack
+Applies the same rules as UserUseCases over an IAsyncUserRepository
+"""
+
+from typing import List, Optional
+from domain.entities.user import (
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    UserEvent,
+    USER_CREATED,
+    USER_UPDATED,
+    USER_DELETED
+)
+from domain.repositories.async_user_repository import IAsyncUserRepository
+from domain.repositories.user_event_publisher import IUserEventPublisher
+from domain.usecases.user_usecases import (
+    normalize_page_size,
+    validate_new_user,
+    validate_user_changes
+)
+
+
+class AsyncUserUseCases:
+    """Async user business logic use cases"""
+
+    def __init__(self, user_repository: IAsyncUserRepository, events: Optional[IUserEventPublisher] = None):
+        self.user_repository = user_repository
+        self.events = events
+
+    async def _publish(self, events: List[UserEvent]) -> None:
+        if self.events is not None and events:
+            await self.events.apublish(events)
+
+    async def alist_users_page(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> UserPage:
+        """Get one page of users using keyset pagination"""
+        return await self.user_repository.alist_page(cursor or None, normalize_page_size(limit))
+
+    async def aget_user_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID"""
+        if user_id <= 0:
+            raise ValueError("Invalid user ID")
+        return await self.user_repository.aget_by_id(user_id)
+
+    async def acreate_user(self, user_data: CreateUserDTO) -> User:
+        """Create a new user with business validation"""
+        validate_new_user(user_data)
+        user = await self.user_repository.acreate(user_data)
+        await self._publish([UserEvent(USER_CREATED, user.id, user)])
+        return user
+
+    async def aupdate_user(self, user_data: UpdateUserDTO) -> Optional[User]:
+        """Update an existing user with business validation"""
+        if user_data.id <= 0:
+            raise ValueError("Invalid user ID")
+        validate_user_changes(user_data)
+        user = await self.user_repository.aupdate(user_data)
+        if user:
+            await self._publish([UserEvent(USER_UPDATED, user.id, user)])
+        return user
+
+    async def adelete_user(self, user_id: int) -> bool:
+        """Delete a user"""
+        if user_id <= 0:
+            raise ValueError("Invalid user ID")
+        deleted = await self.user_repository.adelete(user_id)
+        if deleted:
+            await self._publish([UserEvent(USER_DELETED, user_id)])
+        return deleted
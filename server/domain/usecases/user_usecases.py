@@ -3,21 +3,124 @@ Use Cases - Business Logic Layer
 Contains all business rules and validation
 """
 
-import re
-from typing import List, Optional
-from domain.entities.user import User, CreateUserDTO, UpdateUserDTO
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from domain.entities.user import (
+    USER_FIELDS,
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    ProjectionPage,
+    ChangePage,
+    UserSearchCriteria,
+    BulkItemResult,
+    UserEvent,
+    USER_CREATED,
+    USER_UPDATED,
+    USER_DELETED
+)
 from domain.repositories.user_repository import IUserRepository
+from domain.repositories.user_event_publisher import IUserEventPublisher
+from domain.validation.user_validation import validate_user_batch, validate_user_fields
+
+# Page size bounds for paginated listings
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Bulk operation bounds
+BULK_CHUNK_SIZE = 500
+MAX_BULK_SIZE = 10000
+
+# Upper bound on IDs per batch lookup
+MAX_BATCH_GET_SIZE = 1000
+
+# The change feed only reports changes at least this old, so a write whose
+# timestamp was taken just before a slow commit cannot slip behind a watermark
+CHANGE_FEED_SETTLE = timedelta(seconds=1)
 
 
 class UserUseCases:
     """User business logic use cases"""
 
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, events: Optional[IUserEventPublisher] = None):
         self.user_repository = user_repository
+        self.events = events
+
+    def _publish(self, events: List[UserEvent]) -> None:
+        if self.events is not None and events:
+            self.events.publish(events)
+
+    def get_all_users(self, limit: Optional[int] = None) -> List[User]:
+        """Get all users, or the first limit of them in list order"""
+        if limit is None:
+            return self.user_repository.get_all()
+        if limit <= 0:
+            raise ValueError("Limit must be a positive integer")
+        return self.user_repository.list_page(None, limit).items
+
+    def list_users_page(self, cursor: Optional[str] = None, limit: Optional[int] = None) -> UserPage:
+        """
+        Get one page of users using keyset pagination.
+        Limit is capped at MAX_PAGE_SIZE so every page costs the same.
+        """
+        return self.user_repository.list_page(cursor or None, normalize_page_size(limit))
+
+    def list_user_fields_page(
+        self,
+        fields: Iterable[str],
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> ProjectionPage:
+        """Get one page of users reduced to the requested fields"""
+        return self.user_repository.list_page_projection(
+            cursor or None,
+            normalize_page_size(limit),
+            normalize_fields(fields)
+        )
+
+    def search_users(
+        self,
+        criteria: UserSearchCriteria,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> UserPage:
+        """
+        Search users by text (substring of name, email or username) and by
+        email/username prefix. Results are ranked and keyset-paginated.
+        """
+        criteria = UserSearchCriteria(
+            text=(criteria.text or '').strip() or None,
+            email=(criteria.email or '').strip() or None,
+            username=(criteria.username or '').strip() or None
+        )
+        if not (criteria.text or criteria.email or criteria.username):
+            raise ValueError("Provide at least one of q, email or username")
+        return self.user_repository.search(criteria, cursor or None, normalize_page_size(limit))
+
+    def list_changes(self, watermark: Optional[str] = None, limit: Optional[int] = None) -> ChangePage:
+        """
+        Get users changed and deleted since a watermark, for delta sync.
+        Without a watermark the feed starts from the beginning.
+        """
+        return self.user_repository.list_changes(
+            watermark or None,
+            normalize_page_size(limit),
+            datetime.now(timezone.utc) - CHANGE_FEED_SETTLE
+        )
 
-    def get_all_users(self) -> List[User]:
-        """Get all users"""
-        return self.user_repository.get_all()
+    def export_users(self) -> Iterator[User]:
+        """Stream every user, ordered by ID"""
+        return self.user_repository.iter_all()
+
+    def export_users_after(self, after_id: Optional[int], limit: int) -> List[User]:
+        """
+        One chunk of the export: up to limit users after after_id, ordered by ID.
+        For callers that fetch the export piecemeal (e.g. from async code).
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be a positive integer")
+        return self.user_repository.list_after_id(after_id, limit)
 
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
@@ -25,100 +128,307 @@ class UserUseCases:
             raise ValueError("Invalid user ID")
         return self.user_repository.get_by_id(user_id)
 
+    def get_users_by_ids(
+        self,
+        user_ids: List[int],
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> Tuple[List[User], List[int]]:
+        """
+        Get many users by ID with one query per chunk.
+        Returns the found users in request order and the IDs that were not found.
+        Repeated IDs are looked up and returned once.
+        """
+        if not user_ids:
+            raise ValueError("Provide at least one user ID")
+        if any(user_id <= 0 for user_id in user_ids):
+            raise ValueError("Invalid user ID")
+        user_ids = list(dict.fromkeys(user_ids))
+        if len(user_ids) > MAX_BATCH_GET_SIZE:
+            raise ValueError(f"Batch must contain at most {MAX_BATCH_GET_SIZE} IDs")
+
+        found = {}
+        for start in range(0, len(user_ids), chunk_size):
+            found.update(self.user_repository.get_many(user_ids[start:start + chunk_size]))
+
+        users = [found[user_id] for user_id in user_ids if user_id in found]
+        missing = [user_id for user_id in user_ids if user_id not in found]
+        return users, missing
+
+    def get_user_fields(self, user_id: int, fields: Iterable[str]) -> Optional[Dict[str, Any]]:
+        """Get only the requested fields of a user"""
+        if user_id <= 0:
+            raise ValueError("Invalid user ID")
+        return self.user_repository.get_projection_by_id(user_id, normalize_fields(fields))
+
+    def get_user_last_modified(self, user_id: int) -> Optional[datetime]:
+        """Get when a user was last modified, or None if the user does not exist"""
+        if user_id <= 0:
+            raise ValueError("Invalid user ID")
+        return self.user_repository.get_last_modified(user_id)
+
+    def get_users_stamp(self) -> Tuple[Optional[datetime], int]:
+        """Get the latest modification or deletion time across all users and the user count"""
+        return self.user_repository.get_table_stamp()
+
     def create_user(self, user_data: CreateUserDTO) -> User:
         """
         Create a new user with business validation
         """
-        # Validate required fields
-        if not user_data.name or not user_data.name.strip():
-            raise ValueError("Name is required")
-        
-        if not user_data.email or not user_data.email.strip():
-            raise ValueError("Email is required")
-        
-        if not user_data.username or not user_data.username.strip():
-            raise ValueError("Username is required")
+        validate_new_user(user_data)
 
-        # Validate email format
-        email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_regex, user_data.email):
-            raise ValueError("Invalid email format")
+        # Uniqueness is enforced by the repository's single INSERT, which
+        # raises the duplicate email/username ValueError itself
+        user = self.user_repository.create(user_data)
+        self._publish([UserEvent(USER_CREATED, user.id, user)])
+        return user
 
-        # Check for duplicate email
-        if self.user_repository.exists_by_email(user_data.email):
-            raise ValueError("User with this email already exists")
+    def create_many(
+        self,
+        users_data: List[CreateUserDTO],
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> List[BulkItemResult]:
+        """
+        Create many users at once.
+        The batch is validated in memory, duplicates are checked with one
+        query per chunk and rows are inserted with a single bulk insert per chunk.
+        Returns one result per input item, in input order.
+        """
+        if len(users_data) > MAX_BULK_SIZE:
+            raise ValueError(f"Batch must contain at most {MAX_BULK_SIZE} users")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
 
-        # Check for duplicate username
-        if self.user_repository.exists_by_username(user_data.username):
-            raise ValueError("User with this username already exists")
+        results = [BulkItemResult(index=index) for index in range(len(users_data))]
 
-        # Validate name length
-        if len(user_data.name) > 255:
-            raise ValueError("Name must be less than 255 characters")
+        # Validate fields and reject duplicates inside the batch itself
+        failures = validate_user_batch(users_data)
+        pending = []
+        seen_emails = set()
+        seen_usernames = set()
+        for result, user_data in zip(results, users_data):
+            if result.index in failures:
+                result.error = str(failures[result.index])
+                continue
+            if user_data.email in seen_emails:
+                result.error = "Duplicate email in batch"
+                continue
+            if user_data.username in seen_usernames:
+                result.error = "Duplicate username in batch"
+                continue
+            seen_emails.add(user_data.email)
+            seen_usernames.add(user_data.username)
+            pending.append((result, user_data))
 
-        # Validate username length
-        if len(user_data.username) > 150:
-            raise ValueError("Username must be less than 150 characters")
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
 
-        # Validate phone if provided
-        if user_data.phone and len(user_data.phone) > 20:
-            raise ValueError("Phone must be less than 20 characters")
+            # Check the whole chunk against existing users in one query
+            taken_emails, taken_usernames = self.user_repository.find_taken(
+                [user_data.email for _, user_data in chunk],
+                [user_data.username for _, user_data in chunk]
+            )
+            to_create = []
+            for result, user_data in chunk:
+                if user_data.email in taken_emails:
+                    result.error = "User with this email already exists"
+                elif user_data.username in taken_usernames:
+                    result.error = "User with this username already exists"
+                else:
+                    to_create.append((result, user_data))
 
-        # Validate website if provided
-        if user_data.website and len(user_data.website) > 200:
-            raise ValueError("Website must be less than 200 characters")
+            if not to_create:
+                continue
+            try:
+                created = self.user_repository.create_many(
+                    [user_data for _, user_data in to_create]
+                )
+            except ValueError as e:
+                # A concurrent writer took one of the values; fail this chunk only
+                for result, _ in to_create:
+                    result.error = str(e)
+                continue
+            for (result, _), user in zip(to_create, created):
+                result.user = user
+            self._publish([UserEvent(USER_CREATED, user.id, user) for user in created])
 
-        return self.user_repository.create(user_data)
+        return results
 
     def update_user(self, user_data: UpdateUserDTO) -> Optional[User]:
         """
         Update an existing user with business validation
         """
-        # Check if user exists
-        existing_user = self.user_repository.get_by_id(user_data.id)
-        if not existing_user:
-            return None
-
-        # Validate email if provided
-        if user_data.email:
-            email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_regex, user_data.email):
-                raise ValueError("Invalid email format")
-            
-            # Check for duplicate email (excluding current user)
-            if self.user_repository.exists_by_email(user_data.email, exclude_id=user_data.id):
-                raise ValueError("User with this email already exists")
-
-        # Validate username if provided
-        if user_data.username:
-            if self.user_repository.exists_by_username(user_data.username, exclude_id=user_data.id):
-                raise ValueError("User with this username already exists")
-            
-            if len(user_data.username) > 150:
-                raise ValueError("Username must be less than 150 characters")
-
-        # Validate name if provided
-        if user_data.name and len(user_data.name) > 255:
-            raise ValueError("Name must be less than 255 characters")
-
-        # Validate phone if provided
-        if user_data.phone and len(user_data.phone) > 20:
-            raise ValueError("Phone must be less than 20 characters")
-
-        # Validate website if provided
-        if user_data.website and len(user_data.website) > 200:
-            raise ValueError("Website must be less than 200 characters")
-
-        return self.user_repository.update(user_data)
+        if user_data.id <= 0:
+            raise ValueError("Invalid user ID")
+
+        validate_user_changes(user_data)
+
+        # Existence and uniqueness are settled by the repository's single
+        # UPDATE: None for a missing user, ValueError for a duplicate
+        user = self.user_repository.update(user_data)
+        if user:
+            self._publish([UserEvent(USER_UPDATED, user.id, user)])
+        return user
+
+    def update_many(
+        self,
+        users_data: List[UpdateUserDTO],
+        chunk_size: int = BULK_CHUNK_SIZE
+    ) -> List[BulkItemResult]:
+        """
+        Apply partial updates to many users at once.
+        Uniqueness is checked with one query per chunk and each chunk is
+        written with a single bulk UPDATE.
+        Returns one result per input item, in input order.
+        """
+        if len(users_data) > MAX_BULK_SIZE:
+            raise ValueError(f"Batch must contain at most {MAX_BULK_SIZE} users")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+
+        results = [
+            BulkItemResult(index=index, id=user_data.id)
+            for index, user_data in enumerate(users_data)
+        ]
+
+        # Validate fields and reject conflicting changes inside the batch itself
+        failures = validate_user_batch(users_data, partial=True)
+        pending = []
+        seen_ids = set()
+        seen_emails = set()
+        seen_usernames = set()
+        for result, user_data in zip(results, users_data):
+            if user_data.id <= 0:
+                result.error = "Invalid user ID"
+                continue
+            if result.index in failures:
+                result.error = str(failures[result.index])
+                continue
+            if user_data.id in seen_ids:
+                result.error = "Duplicate ID in batch"
+                continue
+            if user_data.email and user_data.email in seen_emails:
+                result.error = "Duplicate email in batch"
+                continue
+            if user_data.username and user_data.username in seen_usernames:
+                result.error = "Duplicate username in batch"
+                continue
+            seen_ids.add(user_data.id)
+            if user_data.email:
+                seen_emails.add(user_data.email)
+            if user_data.username:
+                seen_usernames.add(user_data.username)
+            pending.append((result, user_data))
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+
+            # Check the whole chunk against other users in one query
+            taken_emails, taken_usernames = self.user_repository.find_taken(
+                [user_data.email for _, user_data in chunk if user_data.email],
+                [user_data.username for _, user_data in chunk if user_data.username]
+            )
+            to_update = []
+            for result, user_data in chunk:
+                if taken_emails.get(user_data.email, user_data.id) != user_data.id:
+                    result.error = "User with this email already exists"
+                elif taken_usernames.get(user_data.username, user_data.id) != user_data.id:
+                    result.error = "User with this username already exists"
+                else:
+                    to_update.append((result, user_data))
+
+            if not to_update:
+                continue
+            try:
+                updated = self.user_repository.update_many(
+                    [user_data for _, user_data in to_update]
+                )
+            except ValueError as e:
+                # A concurrent writer took one of the values; fail this chunk only
+                for result, _ in to_update:
+                    result.error = str(e)
+                continue
+            for (result, _), user in zip(to_update, updated):
+                if user:
+                    result.user = user
+                else:
+                    result.not_found = True
+            self._publish([UserEvent(USER_UPDATED, user.id, user) for user in updated if user])
+
+        return results
 
     def delete_user(self, user_id: int) -> bool:
         """Delete a user"""
         if user_id <= 0:
             raise ValueError("Invalid user ID")
-        
-        # Check if user exists
-        existing_user = self.user_repository.get_by_id(user_id)
-        if not existing_user:
-            return False
 
-        return self.user_repository.delete(user_id)
+        # The repository's DELETE reports whether the user existed
+        deleted = self.user_repository.delete(user_id)
+        if deleted:
+            self._publish([UserEvent(USER_DELETED, user_id)])
+        return deleted
+
+    def delete_many(self, user_ids: List[int], chunk_size: int = BULK_CHUNK_SIZE) -> List[BulkItemResult]:
+        """
+        Delete many users at once with a single DELETE per chunk.
+        Returns one result per input ID, in input order.
+        """
+        if len(user_ids) > MAX_BULK_SIZE:
+            raise ValueError(f"Batch must contain at most {MAX_BULK_SIZE} users")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be a positive integer")
+
+        results = [
+            BulkItemResult(index=index, id=user_id)
+            for index, user_id in enumerate(user_ids)
+        ]
+
+        pending = []
+        seen_ids = set()
+        for result in results:
+            if result.id <= 0:
+                result.error = "Invalid user ID"
+            elif result.id in seen_ids:
+                result.error = "Duplicate ID in batch"
+            else:
+                seen_ids.add(result.id)
+                pending.append(result)
+
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            deleted = self.user_repository.delete_many([result.id for result in chunk])
+            for result in chunk:
+                result.not_found = result.id not in deleted
+            self._publish([UserEvent(USER_DELETED, result.id) for result in chunk if not result.not_found])
+
+        return results
+
+
+def normalize_page_size(limit: Optional[int]) -> int:
+    """Apply the default page size and cap it at MAX_PAGE_SIZE"""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    if limit <= 0:
+        raise ValueError("Limit must be a positive integer")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def normalize_fields(fields: Iterable[str]) -> Tuple[str, ...]:
+    """Validate a sparse fieldset and put it in representation order"""
+    requested = {field.strip() for field in fields if field.strip()}
+    if not requested:
+        raise ValueError("Fields must not be empty")
+    unknown = requested.difference(USER_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(sorted(unknown))}")
+    return tuple(field for field in USER_FIELDS if field in requested)
+
+
+def validate_new_user(user_data: CreateUserDTO) -> None:
+    """Validate the fields of a user about to be created"""
+    validate_user_fields(user_data)
+
+
+def validate_user_changes(user_data: UpdateUserDTO) -> None:
+    """Validate the provided fields of a user update"""
+    validate_user_fields(user_data, partial=True)
+
@@ -0,0 +1 @@
+"""Domain validation package"""
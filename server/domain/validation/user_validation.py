@@ -0,0 +1,175 @@
+"""
+User field validation
+A single pass over the fields collects every error, so callers can report
+them all at once. The API serializers, the use cases and the User entity
+all check with this module, so every entry point accepts the same values.
+Email and URL formats follow the rules of Django's EmailValidator and
+URLValidator without depending on Django. UserModel takes its column
+lengths from the constants below, keeping storage and validation in step.
+"""
+
+import ipaddress
+import re
+from typing import Any, Dict, Iterable
+from urllib.parse import urlsplit, urlunsplit
+
+# Column lengths; UserModel's field definitions use these
+NAME_MAX_LENGTH = 255
+EMAIL_MAX_LENGTH = 255
+USERNAME_MAX_LENGTH = 150
+PHONE_MAX_LENGTH = 20
+WEBSITE_MAX_LENGTH = 200
+
+# Email: dot-atom or quoted-string local part; hostname, IP literal or localhost domain
+_EMAIL_USER = re.compile(
+    r"(^[-!#$%&'*+/=?^_`{}|~0-9A-Z]+(\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*\Z"
+    r'|^"([\001-\010\013\014\016-\037!#-\[\]-\177]|\\[\001-\011\013\014\016-\177])*"\Z)',
+    re.IGNORECASE
+)
+_EMAIL_DOMAIN = re.compile(
+    r"((?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+)(?:[A-Z0-9-]{2,63}(?<!-))\Z",
+    re.IGNORECASE
+)
+_EMAIL_LITERAL = re.compile(r"\[([A-F0-9:.]+)\]\Z", re.IGNORECASE)
+
+# URL: http(s)/ftp(s) with an IPv4, bracketed IPv6 or host name, optional port and path
+_UL = "\u00a1-\uffff"
+_IPV4 = (
+    r"(?:0|25[0-5]|2[0-4][0-9]|1[0-9]?[0-9]?|[1-9][0-9]?)"
+    r"(?:\.(?:0|25[0-5]|2[0-4][0-9]|1[0-9]?[0-9]?|[1-9][0-9]?)){3}"
+)
+_HOST = (
+    r"([a-z" + _UL + r"0-9](?:[a-z" + _UL + r"0-9-]{0,61}[a-z" + _UL + r"0-9])?"
+    r"(?:\.(?!-)[a-z" + _UL + r"0-9-]{1,63}(?<!-))*"
+    r"\.(?!-)(?:[a-z" + _UL + r"-]{2,63}|xn--[a-z0-9]{1,59})(?<!-)\.?"
+    r"|localhost)"
+)
+_URL = re.compile(
+    r"^(?:[a-z0-9.+-]*)://"
+    r"(?:[^\s:@/]+(?::[^\s:@/]*)?@)?"
+    r"(?:" + _IPV4 + r"|\[[0-9a-f:.]+\]|" + _HOST + r")"
+    r"(?::[0-9]{1,5})?"
+    r"(?:[/?#][^\s]*)?"
+    r"\Z",
+    re.IGNORECASE
+)
+_URL_IPV6_HOST = re.compile(r"^\[(.+)\](?::[0-9]{1,5})?$")
+_URL_SCHEMES = frozenset(('http', 'https', 'ftp', 'ftps'))
+_URL_UNSAFE = frozenset('\t\r\n')
+
+
+def _punycode(domain: str) -> str:
+    return domain.encode('idna').decode('ascii')
+
+
+def _is_ip_address(value: str, version=ipaddress.ip_address) -> bool:
+    try:
+        version(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_valid_email_domain(domain: str) -> bool:
+    if _EMAIL_DOMAIN.match(domain):
+        return True
+    literal = _EMAIL_LITERAL.match(domain)
+    return bool(literal) and _is_ip_address(literal[1])
+
+
+def is_valid_email(value: str) -> bool:
+    """Whether value is an email address EmailValidator would accept"""
+    if not value or '@' not in value or len(value) > 320:
+        return False
+    user, domain = value.rsplit('@', 1)
+    if not _EMAIL_USER.match(user):
+        return False
+    if domain == 'localhost' or _is_valid_email_domain(domain):
+        return True
+    try:
+        return _is_valid_email_domain(_punycode(domain))
+    except UnicodeError:
+        return False
+
+
+def is_valid_url(value: str) -> bool:
+    """Whether value is an http(s) or ftp(s) URL URLValidator would accept"""
+    if not isinstance(value, str) or len(value) > 2048 or _URL_UNSAFE.intersection(value):
+        return False
+    if value.split('://')[0].lower() not in _URL_SCHEMES:
+        return False
+    try:
+        parts = urlsplit(value)
+    except ValueError:
+        return False
+    if _URL.match(value):
+        ipv6 = _URL_IPV6_HOST.search(parts.netloc)
+        if ipv6 and not _is_ip_address(ipv6[1], ipaddress.IPv6Address):
+            return False
+    else:
+        # Possibly an internationalized domain name
+        try:
+            netloc = _punycode(parts.netloc)
+        except UnicodeError:
+            return False
+        if not _URL.match(urlunsplit(parts._replace(netloc=netloc))):
+            return False
+    return parts.hostname is not None and len(parts.hostname) <= 253
+
+
+# (field, label, required, max length, format check, format error), in report order
+_RULES = (
+    ('name', 'Name', True, NAME_MAX_LENGTH, None, None),
+    ('email', 'Email', True, EMAIL_MAX_LENGTH, is_valid_email, "Invalid email format"),
+    ('username', 'Username', True, USERNAME_MAX_LENGTH, None, None),
+    ('phone', 'Phone', False, PHONE_MAX_LENGTH, None, None),
+    ('website', 'Website', False, WEBSITE_MAX_LENGTH, is_valid_url, "Invalid website URL"),
+)
+
+
+class UserValidationError(ValueError):
+    """Invalid user fields; errors maps each field to its message"""
+
+    def __init__(self, errors: Dict[str, str]):
+        self.errors = errors
+        super().__init__('; '.join(errors.values()))
+
+
+def user_field_errors(values: Any, partial: bool = False) -> Dict[str, str]:
+    """
+    Check user fields in one pass and return {field: message} for each failure.
+    values is a dict or any object with the field attributes (DTO, entity).
+    With partial=True, fields that are None are treated as not provided.
+    """
+    get = values.get if isinstance(values, dict) else lambda field: getattr(values, field, None)
+    errors = {}
+    for field, label, required, max_length, is_valid, format_error in _RULES:
+        value = get(field)
+        if value is None or value == '':
+            if required and not (partial and value is None):
+                errors[field] = f"{label} is required"
+            continue
+        if required and not value.strip():
+            errors[field] = f"{label} is required"
+        elif len(value) > max_length:
+            errors[field] = f"{label} must be less than {max_length} characters"
+        elif is_valid is not None and not is_valid(value):
+            errors[field] = format_error
+    return errors
+
+
+def validate_user_fields(values: Any, partial: bool = False) -> None:
+    """Raise UserValidationError listing every invalid field"""
+    errors = user_field_errors(values, partial)
+    if errors:
+        raise UserValidationError(errors)
+
+
+def validate_user_batch(items: Iterable[Any], partial: bool = False) -> Dict[int, UserValidationError]:
+    """Validate many users in one pass; returns the error of each failing index"""
+    failures = {}
+    for index, values in enumerate(items):
+        errors = user_field_errors(values, partial)
+        if errors:
+            failures[index] = UserValidationError(errors)
+    return failures
@@ -11,7 +11,6 @@ fi
 
 # Run migrations
 echo "Running migrations..."
-python manage.py makemigrations
 python manage.py migrate
 
 # Collect static files
@@ -31,5 +30,9 @@ else:
 END
 
 # Start server
+# Metrics are per worker process, so /metrics/ only adds up with one worker.
+# Several workers need the LISTEN/NOTIFY bus for the event stream.
+export WEB_CONCURRENCY=${WEB_CONCURRENCY:-3}
+export USER_EVENTS_BACKEND=${USER_EVENTS_BACKEND:-postgres}
 echo "Starting server..."
-exec gunicorn config.wsgi:application --bind 0.0.0.0:8000 --workers 3
+exec gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker --bind 0.0.0.0:8000 --workers $WEB_CONCURRENCY
@@ -3,8 +3,14 @@ Django Admin configuration
 """
 
 from django.contrib import admin
+from config.dependencies import user_usecases
+from domain.entities.user import CreateUserDTO, UpdateUserDTO
+from domain.usecases.user_usecases import MAX_BULK_SIZE
 from infrastructure.database.models import UserModel
 
+# Fields the admin form can change, in UpdateUserDTO order
+EDITABLE_FIELDS = ('name', 'email', 'username', 'phone', 'website')
+
 
 @admin.register(UserModel)
 class UserAdmin(admin.ModelAdmin):
@@ -13,3 +19,43 @@ class UserAdmin(admin.ModelAdmin):
     search_fields = ('username', 'email', 'name')
     ordering = ('-created_at',)
     readonly_fields = ('created_at', 'updated_at')
+
+    def get_search_results(self, request, queryset, search_term):
+        """Search through the indexed lower(...) lookups instead of raw icontains scans"""
+        if not search_term:
+            return queryset, False
+        return queryset.search(text=search_term.strip()), False
+
+    def save_model(self, request, obj, form, change):
+        """Save through the same use cases as the API, so the change is published"""
+        if not change:
+            user = user_usecases.create_user(CreateUserDTO(
+                name=obj.name,
+                email=obj.email,
+                username=obj.username,
+                phone=obj.phone,
+                website=obj.website
+            ))
+            obj.pk = user.id
+            obj.updated_at = user.updated_at
+            return
+
+        # A partial update leaves None fields untouched, so a cleared
+        # optional field is written as blank, as the API does
+        changes = {
+            field: '' if getattr(obj, field) is None else getattr(obj, field)
+            for field in EDITABLE_FIELDS
+            if field in form.changed_data
+        }
+        user = user_usecases.update_user(UpdateUserDTO(id=obj.pk, **changes))
+        if user:
+            obj.updated_at = user.updated_at
+
+    def delete_model(self, request, obj):
+        """Delete through the use cases so the change feed and the event stream see it"""
+        user_usecases.delete_user(obj.pk)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = list(queryset.values_list('id', flat=True))
+        for start in range(0, len(user_ids), MAX_BULK_SIZE):
+            user_usecases.delete_many(user_ids[start:start + MAX_BULK_SIZE])
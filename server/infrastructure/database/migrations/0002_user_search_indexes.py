@@ -0,0 +1,47 @@
+"""
+Indexes backing the user search endpoint.
+
+PostgreSQL gets pg_trgm GIN indexes on lower(name|email|username), which serve
+both prefix (LIKE 'abc%') and substring (LIKE '%abc%') matches. Other backends
+get plain expression indexes on lower(...), which cover exact and ranking
+lookups; substring scans there stay unindexed.
+"""
+
+from django.db import migrations
+
+SEARCH_COLUMNS = ('name', 'email', 'username')
+
+
+def create_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        for column in SEARCH_COLUMNS:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS users_{column}_trgm '
+                f'ON users USING gin (lower({column}) gin_trgm_ops)'
+            )
+    elif vendor == 'sqlite':
+        for column in SEARCH_COLUMNS:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS users_{column}_lower ON users (lower({column}))'
+            )
+
+
+def drop_search_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    suffix = 'trgm' if vendor == 'postgresql' else 'lower'
+    if vendor in ('postgresql', 'sqlite'):
+        for column in SEARCH_COLUMNS:
+            schema_editor.execute(f'DROP INDEX IF EXISTS users_{column}_{suffix}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0002_user_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserTombstoneModel',
+            fields=[
+                ('user_id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('deleted_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'user_tombstones',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='usermodel',
+            index=models.Index(fields=['updated_at', 'id'], name='users_updated_24fe0d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='usertombstonemodel',
+            index=models.Index(fields=['deleted_at', 'user_id'], name='user_tombst_deleted_bb0a21_idx'),
+        ),
+    ]
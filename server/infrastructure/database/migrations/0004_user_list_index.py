@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-17 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('database', '0003_user_change_feed'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='usermodel',
+            options={'ordering': ['-created_at', '-id']},
+        ),
+        migrations.RemoveIndex(
+            model_name='usermodel',
+            name='users_email_4b85f2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='usermodel',
+            name='users_usernam_baeb4b_idx',
+        ),
+        migrations.AddIndex(
+            model_name='usermodel',
+            index=models.Index(fields=['-created_at', '-id'], name='users_created_desc_idx'),
+        ),
+    ]
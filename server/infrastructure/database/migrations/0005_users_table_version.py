@@ -0,0 +1,82 @@
+"""
+Users table version counter, kept by triggers.
+
+The counter row is incremented in the same transaction as the write, so every
+worker sees the new version exactly when it sees the new rows, without a
+listener or a shared cache. PostgreSQL uses one statement trigger; SQLite
+only has row triggers.
+
+Squashes the earlier NOTIFY trigger migration, which this one replaced.
+"""
+
+from django.db import migrations, models
+
+TRIGGER_EVENTS = ('INSERT', 'UPDATE', 'DELETE')
+
+BUMP = 'UPDATE users_table_version SET version = version + 1 WHERE id = 1'
+
+
+def create_version_row(apps, schema_editor):
+    version = apps.get_model('database', 'UsersTableVersionModel')
+    version.objects.using(schema_editor.connection.alias).get_or_create(id=1, defaults={'version': 0})
+
+
+def create_triggers(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute(f'''
+            CREATE OR REPLACE FUNCTION users_bump_table_version() RETURNS trigger AS $$
+            BEGIN
+                {BUMP};
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql
+        ''')
+        schema_editor.execute(
+            'CREATE TRIGGER users_bump_table_version '
+            'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON users '
+            'FOR EACH STATEMENT EXECUTE FUNCTION users_bump_table_version()'
+        )
+    elif vendor == 'sqlite':
+        for event in TRIGGER_EVENTS:
+            schema_editor.execute(
+                f'CREATE TRIGGER users_bump_table_version_{event.lower()} '
+                f'AFTER {event} ON users BEGIN {BUMP}; END'
+            )
+
+
+def drop_triggers(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP TRIGGER IF EXISTS users_bump_table_version ON users')
+        schema_editor.execute('DROP FUNCTION IF EXISTS users_bump_table_version()')
+    elif vendor == 'sqlite':
+        for event in TRIGGER_EVENTS:
+            schema_editor.execute(f'DROP TRIGGER IF EXISTS users_bump_table_version_{event.lower()}')
+
+
+class Migration(migrations.Migration):
+
+    replaces = [
+        ('database', '0005_users_changed_trigger'),
+        ('database', '0006_users_table_version'),
+    ]
+
+    dependencies = [
+        ('database', '0004_user_list_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UsersTableVersionModel',
+            fields=[
+                ('id', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+                ('version', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'users_table_version',
+            },
+        ),
+        migrations.RunPython(create_version_row, migrations.RunPython.noop),
+        migrations.RunPython(create_triggers, drop_triggers),
+    ]
@@ -4,26 +4,138 @@ Infrastructure layer - implements persistence
 """
 
 from django.db import models
+from django.db.models import Case, Q, Value, When
+from django.db.models.functions import Lower
+from domain.validation.user_validation import (
+    EMAIL_MAX_LENGTH,
+    NAME_MAX_LENGTH,
+    PHONE_MAX_LENGTH,
+    USERNAME_MAX_LENGTH,
+    WEBSITE_MAX_LENGTH
+)
+
+
+class UserQuerySet(models.QuerySet):
+    """Query helpers for users, shared by the repository and the admin"""
+
+    def search(self, text=None, email=None, username=None):
+        """
+        Case-insensitive user search, annotated with search_rank (0 is best).
+        text matches a substring of name, email or username; email and
+        username match as prefixes. Everything compares lower(column) so the
+        search indexes from migration 0002 apply.
+        """
+        queryset = self.alias(
+            name_lower=Lower('name'),
+            email_lower=Lower('email'),
+            username_lower=Lower('username')
+        )
+        if text:
+            text = text.lower()
+            queryset = queryset.filter(
+                Q(name_lower__contains=text)
+                | Q(email_lower__contains=text)
+                | Q(username_lower__contains=text)
+            )
+        if email:
+            queryset = queryset.filter(email_lower__startswith=email.lower())
+        if username:
+            queryset = queryset.filter(username_lower__startswith=username.lower())
+
+        # Exact username/email hits first, then prefix hits, then the rest
+        term = (text or username or email or '').lower()
+        return queryset.annotate(search_rank=Case(
+            When(Q(username_lower=term) | Q(email_lower=term), then=Value(0)),
+            When(
+                Q(username_lower__startswith=term)
+                | Q(email_lower__startswith=term)
+                | Q(name_lower__startswith=term),
+                then=Value(1)
+            ),
+            default=Value(2)
+        ))
 
 
 class UserModel(models.Model):
     """Django ORM model for User"""
     
-    name = models.CharField(max_length=255)
-    email = models.EmailField(unique=True, max_length=255)
-    username = models.CharField(max_length=150, unique=True)
-    phone = models.CharField(max_length=20, blank=True, null=True)
-    website = models.URLField(max_length=200, blank=True, null=True)
+    name = models.CharField(max_length=NAME_MAX_LENGTH)
+    email = models.EmailField(unique=True, max_length=EMAIL_MAX_LENGTH)
+    username = models.CharField(max_length=USERNAME_MAX_LENGTH, unique=True)
+    phone = models.CharField(max_length=PHONE_MAX_LENGTH, blank=True, null=True)
+    website = models.URLField(max_length=WEBSITE_MAX_LENGTH, blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserQuerySet.as_manager()
+
     class Meta:
         db_table = 'users'
-        ordering = ['-created_at']
+        # Matches the list keyset and users_created_desc_idx, so no sort is needed
+        ordering = ['-created_at', '-id']
+        # email and username need no extra index: unique=True already creates one
         indexes = [
-            models.Index(fields=['email']),
-            models.Index(fields=['username']),
+            # List pages and the admin changelist: ORDER BY created_at DESC, id DESC
+            models.Index(fields=['-created_at', '-id'], name='users_created_desc_idx'),
+            # Change feed keyset: updated_at > watermark, ordered by (updated_at, id)
+            models.Index(fields=['updated_at', 'id']),
         ]
 
     def __str__(self):
         return f"{self.username} ({self.email})"
+
+
+class UserTombstoneModel(models.Model):
+    """Records a deleted user so the change feed can report the deletion"""
+
+    user_id = models.BigIntegerField(primary_key=True)
+    deleted_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'user_tombstones'
+        indexes = [
+            models.Index(fields=['deleted_at', 'user_id']),
+        ]
+
+    def __str__(self):
+        return f"user {self.user_id} deleted at {self.deleted_at}"
+
+
+class UsersTableVersionModel(models.Model):
+    """
+    Single-row counter of writes to the users table. Database triggers
+    (migration 0006) increment it in the same transaction as every write,
+    raw SQL included, so cached list pages keyed by it are never stale.
+    """
+
+    id = models.PositiveSmallIntegerField(primary_key=True)
+    version = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'users_table_version'
+
+    def __str__(self):
+        return f"users table version {self.version}"
+
+
+class IdempotencyKeyModel(models.Model):
+    """
+    A write request's Idempotency-Key: held while the write runs (status_code
+    is null until then), then the stored response replayed for retries.
+    Kept in the database so every worker sees it.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True)
+    body = models.BinaryField(null=True)
+    headers = models.JSONField(default=list)
+    # Another request may take over an in-flight key once this passes
+    locked_until = models.DateTimeField(null=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        db_table = 'idempotency_keys'
+
+    def __str__(self):
+        return f"idempotency key {self.key}"
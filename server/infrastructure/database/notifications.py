@@ -0,0 +1,82 @@
+"""
+PostgreSQL LISTEN/NOTIFY listener
+One background thread per channel and process, holding its own connection
+and reconnecting after failures.
+"""
+
+import logging
+import select
+import threading
+from typing import Callable, List, Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresListener:
+    """
+    Calls on_notify(payloads) with each batch of notifications on `channel`,
+    and on_connect() every time LISTEN is (re-)established, since anything
+    sent while disconnected is lost. Needs psycopg2.
+    """
+
+    RECONNECT_SECONDS = 2.0
+    POLL_SECONDS = 5.0
+
+    def __init__(
+        self,
+        channel: str,
+        on_notify: Callable[[List[str]], None],
+        on_connect: Optional[Callable[[], None]] = None,
+        alias: str = DEFAULT_DB_ALIAS
+    ):
+        self.channel = channel
+        self.on_notify = on_notify
+        self.on_connect = on_connect
+        self.alias = alias
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the listener thread unless it is already running"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._listen_forever, name=f'pg-listen-{self.channel}', daemon=True
+                )
+                self._thread.start()
+
+    def _listen_forever(self) -> None:
+        while True:
+            connection = connections.create_connection(self.alias)
+            try:
+                connection.ensure_connection()
+                raw = connection.connection
+                raw.autocommit = True
+                with raw.cursor() as cursor:
+                    cursor.execute(f'LISTEN "{self.channel}"')
+                logger.info("Listening for notifications on channel %s", self.channel)
+                if self.on_connect is not None:
+                    self.on_connect()
+                self._drain(raw)
+            except Exception:
+                logger.exception("Listener on channel %s failed; reconnecting", self.channel)
+            finally:
+                try:
+                    connection.close()
+                except Exception:
+                    pass
+            threading.Event().wait(self.RECONNECT_SECONDS)
+
+    def _drain(self, raw) -> None:
+        """Block on the LISTEN socket and hand over notifications until it fails"""
+        while True:
+            if select.select([raw], [], [], self.POLL_SECONDS) == ([], [], []):
+                continue
+            raw.poll()
+            payloads = []
+            while raw.notifies:
+                payloads.append(raw.notifies.pop(0).payload)
+            if payloads:
+                self.on_notify(payloads)
@@ -0,0 +1,96 @@
+"""
+Database routing between the primary and read replicas
+Reads of the user tables go to a replica unless the current request has
+already written, is inside a transaction, or every replica is marked down.
+"""
+
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Callable, TypeVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections, router
+
+logger = logging.getLogger(__name__)
+
+# App labels whose models may be read from replicas; auth/sessions stay on the primary
+REPLICA_APP_LABELS = {'database'}
+
+T = TypeVar('T')
+
+_pinned: ContextVar[bool] = ContextVar('db_pinned_to_primary', default=False)
+_replica_down_until = {}
+
+
+def start_request():
+    """Reset primary pinning for a new request; returns a token for end_request()"""
+    return _pinned.set(False)
+
+
+def end_request(token) -> None:
+    _pinned.reset(token)
+
+
+def pin_to_primary() -> None:
+    """Send the rest of this request's reads to the primary (read-your-writes)"""
+    _pinned.set(True)
+
+
+def reads_use_primary() -> bool:
+    """Whether this request's reads must see its own writes (pinned or inside a transaction)"""
+    return _pinned.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block
+
+
+def mark_replica_failed(alias: str) -> None:
+    """Skip a replica for DATABASE_REPLICA_RETRY_SECONDS"""
+    _replica_down_until[alias] = time.monotonic() + settings.DATABASE_REPLICA_RETRY_SECONDS
+
+
+def read_alias() -> str:
+    """Pick the alias for a read of a replicated model"""
+    replicas = settings.DATABASE_REPLICAS
+    if not replicas or reads_use_primary():
+        return DEFAULT_DB_ALIAS
+    now = time.monotonic()
+    available = [alias for alias in replicas if _replica_down_until.get(alias, 0) <= now]
+    return random.choice(available) if available else DEFAULT_DB_ALIAS
+
+
+def read_with_fallback(model, query: Callable[[str], T]) -> T:
+    """
+    Run query(alias) on the alias the routers pick for reading model.
+    If it fails on a replica, mark that replica down and retry on the primary.
+    The query must be fully evaluated inside the callable.
+    """
+    alias = router.db_for_read(model)
+    try:
+        return query(alias)
+    except DatabaseError as e:
+        if alias == DEFAULT_DB_ALIAS:
+            raise
+        logger.warning("Read on replica %s failed, retrying on primary: %s", alias, e)
+        mark_replica_failed(alias)
+        connections[alias].close()
+        return query(DEFAULT_DB_ALIAS)
+
+
+class PrimaryReplicaRouter:
+    """Reads from replicas, writes to the primary, migrations on the primary only"""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in REPLICA_APP_LABELS:
+            return None
+        return read_alias()
+
+    def db_for_write(self, model, **hints):
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas mirror the primary, so objects from any alias can relate
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
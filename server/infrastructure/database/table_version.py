@@ -0,0 +1,33 @@
+"""
+Users table version
+A counter row that database triggers (migration 0006) increment in the
+same transaction as every write to the users table, raw SQL and admin
+edits included. A reader that sees a version also sees every write made
+before it, in any worker, so it can key cached pages on it.
+"""
+
+from typing import Optional
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from infrastructure.database.models import UsersTableVersionModel
+
+# Backends migration 0006 installs the triggers on
+TRIGGER_VENDORS = ('postgresql', 'sqlite')
+
+VERSION_ROW_ID = 1
+
+
+def users_table_version() -> Optional[int]:
+    """
+    The current version, read from the primary with one primary-key lookup.
+    None when the backend has no triggers, the row is missing (e.g. after a
+    flush) or a transaction is open: its bumps may still roll back and the
+    same number then go to a different write. Callers must not cache on None.
+    """
+    connection = connections[DEFAULT_DB_ALIAS]
+    if connection.vendor not in TRIGGER_VENDORS or connection.in_atomic_block:
+        return None
+    return UsersTableVersionModel.objects.using(DEFAULT_DB_ALIAS).filter(
+        id=VERSION_ROW_ID
+    ).values_list('version', flat=True).first()
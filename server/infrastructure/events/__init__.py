@@ -0,0 +1 @@
+"""Infrastructure events package"""
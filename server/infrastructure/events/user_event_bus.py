@@ -0,0 +1,260 @@
+"""
+User change event bus
+Fans each published change out to every connected subscriber (the
+server-sent events stream) from a single in-process buffer, so one write
+reaches any number of clients without extra queries. The in-memory bus
+only sees writes made by its own process; PostgresUserEventBus relays
+them through LISTEN/NOTIFY so every worker and host sees every write.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from domain.entities.user import USER_FIELDS, User, UserEvent
+from domain.repositories.user_event_publisher import IUserEventPublisher
+from infrastructure.database.notifications import PostgresListener
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class StreamEvent:
+    """One published change, encoded once as a server-sent event frame"""
+    id: str
+    type: str
+    data: str
+    frame: bytes
+
+
+def _stream_event(event_id: str, event_type: str, data: str) -> StreamEvent:
+    frame = f"id: {event_id}\nevent: user.{event_type}\ndata: {data}\n\n".encode()
+    return StreamEvent(id=event_id, type=event_type, data=data, frame=frame)
+
+
+def _event_data(event: UserEvent) -> str:
+    """JSON payload: the user as returned by GET, or just the ID for deletions"""
+    if event.user is None:
+        return json.dumps({'id': event.user_id}, separators=(',', ':'))
+    user: User = event.user
+    return json.dumps({field: getattr(user, field) for field in USER_FIELDS}, separators=(',', ':'))
+
+
+class Subscription:
+    """
+    One subscriber's bounded queue, owned by the event loop that created it.
+    A subscriber that falls more than max_pending events behind is marked
+    overflowed instead of buffering without limit; its stream ends and the
+    client resumes from its Last-Event-ID.
+    """
+
+    def __init__(self, bus: 'UserEventBus', max_pending: int):
+        self.bus = bus
+        self.max_pending = max_pending
+        self.loop = asyncio.get_running_loop()
+        self.backlog: List[StreamEvent] = []
+        # The requested Last-Event-ID is no longer buffered; events were lost
+        self.missed = False
+        self.overflowed = False
+        self._pending: Deque[StreamEvent] = deque()
+        self._ready = asyncio.Event()
+
+    def _offer(self, events: List[StreamEvent]) -> None:
+        """Queue events; runs on the subscriber's loop"""
+        if self.overflowed:
+            return
+        if len(self._pending) + len(events) > self.max_pending:
+            self.overflowed = True
+            self._pending.clear()
+        else:
+            self._pending.extend(events)
+        self._ready.set()
+
+    def _reset(self) -> None:
+        """The bus lost events (e.g. a dropped LISTEN connection)"""
+        self.missed = True
+        self._ready.set()
+
+    async def get(self, timeout: float) -> List[StreamEvent]:
+        """Wait up to timeout seconds and return everything queued so far"""
+        if not self._pending and not self.overflowed and not self.missed:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._ready.clear()
+        events = list(self._pending)
+        self._pending.clear()
+        return events
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+
+class UserEventBus(IUserEventPublisher):
+    """
+    In-process fan-out. Events get IDs "<node>-<sequence>" and the last
+    buffer_size of them are kept so reconnecting clients can resume.
+    """
+
+    def __init__(self, buffer_size: int = 1000, queue_size: int = 256):
+        self.node = uuid.uuid4().hex[:8]
+        self.queue_size = queue_size
+        self._sequence = itertools.count(1)
+        self._buffer: Deque[StreamEvent] = deque(maxlen=buffer_size)
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def _encode(self, events: List[UserEvent]) -> List[Tuple[str, str, str]]:
+        return [
+            (f"{self.node}-{next(self._sequence)}", event.type, _event_data(event))
+            for event in events
+        ]
+
+    def publish(self, events: List[UserEvent]) -> None:
+        self._deliver([_stream_event(*record) for record in self._encode(events)])
+
+    async def apublish(self, events: List[UserEvent]) -> None:
+        self.publish(events)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Register a subscriber on the running event loop. Events buffered
+        after last_event_id are returned in subscription.backlog.
+        """
+        subscription = Subscription(self, self.queue_size)
+        with self._lock:
+            if last_event_id:
+                ids = [event.id for event in self._buffer]
+                if last_event_id in ids:
+                    subscription.backlog = list(self._buffer)[ids.index(last_event_id) + 1:]
+                else:
+                    subscription.missed = True
+            self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def _deliver(self, events: List[StreamEvent]) -> None:
+        """Buffer events and hand them to every subscriber's loop; never blocks"""
+        if not events:
+            return
+        with self._lock:
+            self._buffer.extend(events)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._offer, events)
+            except RuntimeError:
+                # The subscriber's event loop is closed
+                self.unsubscribe(subscription)
+
+    def _reset_all(self) -> None:
+        """Forget buffered events and tell subscribers they may have missed some"""
+        with self._lock:
+            self._buffer.clear()
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._reset)
+            except RuntimeError:
+                self.unsubscribe(subscription)
+
+
+class PostgresUserEventBus(UserEventBus):
+    """
+    Relays events through PostgreSQL NOTIFY on `channel`. Publishing sends
+    one pg_notify per event in a single statement (inside a transaction
+    they are delivered on commit). The write has already happened by then,
+    so a failed NOTIFY is logged rather than raised. A listener thread,
+    started with the first subscriber, holds one LISTEN connection per
+    process and feeds the local fan-out, so events from every worker arrive
+    in the same order everywhere.
+    """
+
+    def __init__(self, channel: str = 'user_events', alias: str = DEFAULT_DB_ALIAS, **kwargs):
+        super().__init__(**kwargs)
+        self.channel = channel
+        self.alias = alias
+        self._connected_before = False
+        self._listener = PostgresListener(channel, self._on_notify, self._on_connect, alias)
+
+    def publish(self, events: List[UserEvent]) -> None:
+        payloads = [json.dumps(record, separators=(',', ':')) for record in self._encode(events)]
+        if not payloads:
+            return
+        try:
+            # A savepoint keeps an enclosing transaction usable if NOTIFY fails
+            with transaction.atomic(using=self.alias), connections[self.alias].cursor() as cursor:
+                cursor.execute(
+                    "SELECT pg_notify(%s, payload) FROM unnest(%s::text[]) AS payload",
+                    [self.channel, payloads]
+                )
+        except Exception:
+            logger.exception("Failed to publish %d user event(s) on channel %s", len(payloads), self.channel)
+
+    async def apublish(self, events: List[UserEvent]) -> None:
+        await sync_to_async(self.publish)(events)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        self._listener.start()
+        return super().subscribe(last_event_id)
+
+    def _on_connect(self) -> None:
+        if self._connected_before:
+            # Anything published while disconnected is gone
+            self._reset_all()
+        self._connected_before = True
+
+    def _on_notify(self, payloads: List[str]) -> None:
+        events = []
+        for payload in payloads:
+            try:
+                events.append(_stream_event(*json.loads(payload)))
+            except (TypeError, ValueError):
+                logger.warning("Ignoring malformed user event payload: %r", payload)
+        self._deliver(events)
+
+
+_bus: Optional[UserEventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_user_event_bus() -> UserEventBus:
+    """The process-wide bus, chosen by settings.USER_EVENTS_BACKEND"""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                options = {
+                    'buffer_size': settings.USER_EVENTS_BUFFER_SIZE,
+                    'queue_size': settings.USER_EVENTS_QUEUE_SIZE,
+                }
+                backend = settings.USER_EVENTS_BACKEND
+                if backend == 'postgres':
+                    _bus = PostgresUserEventBus(channel=settings.USER_EVENTS_CHANNEL, **options)
+                elif backend == 'memory':
+                    _bus = UserEventBus(**options)
+                else:
+                    raise ImproperlyConfigured(
+                        f"USER_EVENTS_BACKEND must be 'memory' or 'postgres', not {backend!r}"
+                    )
+    return _bus
@@ -0,0 +1 @@
+"""Infrastructure monitoring package"""
@@ -0,0 +1,103 @@
+"""
+Cached database readiness probe
+Runs a bounded SELECT 1 on a dedicated worker thread, at most once per
+interval, so frequent probe traffic costs no database round trips.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import dataclass
+from typing import Optional
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ProbeResult:
+    """Outcome of one database check"""
+    healthy: bool
+    detail: str
+    checked_at: float
+    latency_ms: Optional[float] = None
+    connection_age_s: Optional[float] = None
+
+
+class DatabaseProbe:
+    """
+    Checks one database alias with SELECT 1 and caches the result.
+    The check runs on a single worker thread that keeps its own persistent
+    connection, and the caller waits at most `timeout` seconds for it. While
+    a timed-out check is still stuck, no new one is started.
+    """
+
+    def __init__(self, alias: str = 'default', interval: float = 5.0, timeout: float = 1.0):
+        self.alias = alias
+        self.interval = interval
+        self.timeout = timeout
+        self._result: Optional[ProbeResult] = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'db-probe-{alias}')
+        self._pending = None
+        # Identity and open time of the worker's current DB-API connection
+        self._raw_connection = None
+        self._opened_at = None
+
+    def check(self) -> ProbeResult:
+        """Return the cached result, refreshing it when older than the interval"""
+        result = self._result
+        if result is not None and time.monotonic() - result.checked_at < self.interval:
+            return result
+        with self._lock:
+            result = self._result
+            if result is not None and time.monotonic() - result.checked_at < self.interval:
+                return result
+            result = self._refresh()
+            if self._result is None or result.healthy != self._result.healthy:
+                if result.healthy:
+                    logger.info("Database %s is reachable", self.alias)
+                else:
+                    logger.warning("Database %s check failed: %s", self.alias, result.detail)
+            self._result = result
+            return result
+
+    def _refresh(self) -> ProbeResult:
+        if self._pending is None or self._pending.done():
+            self._pending = self._executor.submit(self._select_one)
+        try:
+            return self._pending.result(timeout=self.timeout)
+        except TimeoutError:
+            return ProbeResult(
+                healthy=False,
+                detail=f"timed out after {self.timeout:g}s",
+                checked_at=time.monotonic()
+            )
+
+    def _select_one(self) -> ProbeResult:
+        """Runs on the worker thread"""
+        connection = connections[self.alias]
+        try:
+            connection.close_if_unusable_or_obsolete()
+            start = time.perf_counter()
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+                cursor.fetchone()
+            latency = time.perf_counter() - start
+        except Exception as e:
+            connection.close()
+            return ProbeResult(healthy=False, detail=f"disconnected: {e}", checked_at=time.monotonic())
+
+        if connection.connection is not self._raw_connection:
+            self._raw_connection = connection.connection
+            self._opened_at = time.monotonic()
+        now = time.monotonic()
+        return ProbeResult(
+            healthy=True,
+            detail="connected",
+            checked_at=now,
+            latency_ms=round(latency * 1000, 3),
+            connection_age_s=round(now - self._opened_at, 1)
+        )
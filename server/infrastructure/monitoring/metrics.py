@@ -0,0 +1,171 @@
+"""
+In-process metrics with Prometheus text exposition
+Counters and histograms are kept per process; each worker exposes its own.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+# Request latency buckets in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Queries-per-request buckets
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Tuple[str, ...], extra: str = '') -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return '{' + ','.join(parts) + '}' if parts else ''
+
+
+def _format_number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter keyed by label values"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labelvalues, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram keyed by label values.
+    observe() bumps a single bucket; cumulative counts are built at collect time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labelvalues -> [bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [0] * (len(self.buckets) + 1) + [0]
+            series[index] += 1
+            series[-1] += value
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((labelvalues, list(values)) for labelvalues, values in self._series.items())
+        for labelvalues, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), values[:-1]):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, labelvalues, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_number(values[-1])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_DURATION = REGISTRY.register(Histogram(
+    'http_request_duration_seconds',
+    'Time spent handling a request, by route',
+    ('route', 'method')
+))
+REQUEST_DB_DURATION = REGISTRY.register(Histogram(
+    'http_request_db_duration_seconds',
+    'Time spent in database queries per request, by route',
+    ('route', 'method')
+))
+REQUEST_QUERIES = REGISTRY.register(Histogram(
+    'http_request_queries',
+    'Database queries issued per request, by route',
+    ('route', 'method'),
+    buckets=QUERY_COUNT_BUCKETS
+))
+REQUEST_ERRORS = REGISTRY.register(Counter(
+    'http_request_errors_total',
+    'Requests answered with a 4xx/5xx status or an unhandled exception, by route',
+    ('route', 'method', 'status')
+))
+IDEMPOTENT_REQUESTS = REGISTRY.register(Counter(
+    'idempotent_requests_total',
+    'Writes carrying an Idempotency-Key, by method and outcome '
+    '(executed, replayed, mismatch, conflict)',
+    ('method', 'outcome')
+))
+SINGLE_FLIGHT_CALLS = REGISTRY.register(Counter(
+    'repository_single_flight_calls_total',
+    'Repository reads by method; outcome "executed" ran a query, '
+    '"coalesced" shared the result of an identical read already in flight',
+    ('method', 'outcome')
+))
+LIST_PAGE_CACHE_REQUESTS = REGISTRY.register(Counter(
+    'list_page_cache_requests_total',
+    'Cacheable list and search requests by outcome (hit, miss)',
+    ('outcome',)
+))
+USER_CACHE_REQUESTS = REGISTRY.register(Counter(
+    'user_cache_requests_total',
+    'User lookups by ID against the read-through cache, by outcome (hit, miss)',
+    ('outcome',)
+))
+USER_CACHE_EVICTIONS = REGISTRY.register(Counter(
+    'user_cache_evictions_total',
+    'Entries dropped from the in-process user cache, by reason (capacity, expired)',
+    ('reason',)
+))
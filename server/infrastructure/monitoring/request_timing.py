@@ -0,0 +1,82 @@
+"""
+Per-request timing state
+The current request's timings live in a context variable so query
+wrappers and phase timers can record into it from any layer, in sync
+and async code alike. Outside a request every hook is a no-op.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Dict, Optional
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """Query count, DB time and named phase durations (seconds) of one request"""
+    started_at: float
+    queries: int = 0
+    db_time: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def add_phase(self, name: str, duration: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + duration
+
+
+_current: ContextVar[Optional[RequestTimings]] = ContextVar('request_timings', default=None)
+
+
+def start_request() -> RequestTimings:
+    """Begin collecting timings for the current request"""
+    timings = RequestTimings(started_at=time.perf_counter())
+    _current.set(timings)
+    return timings
+
+
+def end_request() -> None:
+    _current.set(None)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _current.get()
+
+
+def timed(phase: str):
+    """Decorator adding the wrapped call's duration to a phase of the current request"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timings = _current.get()
+            if timings is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.add_phase(phase, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def query_timer(execute, sql, params, many, context):
+    """Database execute wrapper counting queries and DB time for the current request"""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db_time += time.perf_counter() - start
+        timings.queries += 1
+
+
+def install_query_timer(sender=None, connection=None, **kwargs) -> None:
+    """
+    Attach query_timer to a database connection once.
+    Connected to connection_created, so every connection (per thread,
+    per alias) carries the wrapper for its whole lifetime.
+    """
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
@@ -0,0 +1,250 @@
+"""
+Caching Repository Decorator
+Wraps any IUserRepository with a read-through cache for get_by_id, keyed
+by the users table version so no write anywhere can leave it stale
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from domain.entities.user import (
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    ProjectionPage,
+    ChangePage,
+    UserSearchCriteria
+)
+from domain.repositories.user_repository import IUserRepository
+from infrastructure.database.routers import pin_to_primary
+from infrastructure.monitoring.metrics import USER_CACHE_EVICTIONS, USER_CACHE_REQUESTS
+
+# Stands in for "not cached" so a cached None (missing user) can be told apart
+_ABSENT = object()
+
+
+class _LRUCache:
+    """Bounded, thread-safe LRU map whose entries expire after a TTL"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key, _ABSENT)
+            if entry is _ABSENT:
+                return _ABSENT
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                USER_CACHE_EVICTIONS.inc('expired')
+                return _ABSENT
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                USER_CACHE_EVICTIONS.inc('capacity')
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class CachingUserRepository(IUserRepository):
+    """
+    Read-through cache in front of another user repository.
+    Lookups by ID go to an in-process LRU first, then to an optional shared
+    Django cache, then to the wrapped repository. Missing IDs are cached too.
+    Keys include the users table version, which database triggers bump with
+    every write in any process (admin and raw SQL included), so a write
+    retires every cached user at once instead of being invalidated by ID.
+    Without a version (no triggers, or inside a transaction) lookups go
+    straight to the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        repository: IUserRepository,
+        version: Callable[[], Optional[int]],
+        max_entries: int = 10000,
+        ttl: float = 30,
+        shared_cache=None,
+        key_prefix: str = 'users:user'
+    ):
+        self.repository = repository
+        self.version = version
+        self.shared_cache = shared_cache
+        self.key_prefix = key_prefix
+        self._local = _LRUCache(max_entries, ttl)
+        self._ttl = ttl
+
+    def _key(self, version: int, user_id: int) -> str:
+        return f"{self.key_prefix}:{version}:{user_id}"
+
+    def _store(self, key: str, user: Optional[User]) -> None:
+        self._local.set(key, user)
+        if self.shared_cache is not None:
+            self.shared_cache.set(key, user, self._ttl)
+
+    def _fetch(self, call):
+        """
+        Read a miss from the primary: the version was read there first, so
+        the row is at least as new as the version it is stored under
+        """
+        pin_to_primary()
+        return call()
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID, serving repeated lookups from the cache"""
+        version = self.version()
+        if version is None:
+            return self.repository.get_by_id(user_id)
+
+        key = self._key(version, user_id)
+        user = self._local.get(key)
+        if user is _ABSENT and self.shared_cache is not None:
+            user = self.shared_cache.get(key, _ABSENT)
+            if user is not _ABSENT:
+                self._local.set(key, user)
+        if user is not _ABSENT:
+            USER_CACHE_REQUESTS.inc('hit')
+            return user
+
+        USER_CACHE_REQUESTS.inc('miss')
+        user = self._fetch(lambda: self.repository.get_by_id(user_id))
+        self._store(key, user)
+        return user
+
+    def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        """Serve cached IDs and fetch the rest from the wrapped repository in one call"""
+        version = self.version()
+        if version is None:
+            return self.repository.get_many(user_ids)
+
+        users = {}
+        pending = []
+        for user_id in user_ids:
+            user = self._local.get(self._key(version, user_id))
+            if user is _ABSENT:
+                pending.append(user_id)
+                continue
+            if user is not None:
+                users[user_id] = user
+
+        if pending and self.shared_cache is not None:
+            shared = self.shared_cache.get_many([self._key(version, user_id) for user_id in pending])
+            still_pending = []
+            for user_id in pending:
+                key = self._key(version, user_id)
+                if key not in shared:
+                    still_pending.append(user_id)
+                    continue
+                user = shared[key]
+                self._local.set(key, user)
+                if user is not None:
+                    users[user_id] = user
+            pending = still_pending
+
+        hits = len(user_ids) - len(pending)
+        if hits:
+            USER_CACHE_REQUESTS.inc('hit', amount=hits)
+        if pending:
+            USER_CACHE_REQUESTS.inc('miss', amount=len(pending))
+            fetched = self._fetch(lambda: self.repository.get_many(pending))
+            for user_id in pending:
+                user = fetched.get(user_id)
+                self._store(self._key(version, user_id), user)
+                if user is not None:
+                    users[user_id] = user
+        return users
+
+    def get_all(self) -> List[User]:
+        return self.repository.get_all()
+
+    def list_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        return self.repository.list_page(after_cursor, limit)
+
+    def list_page_projection(
+        self,
+        after_cursor: Optional[str],
+        limit: int,
+        fields: Sequence[str]
+    ) -> ProjectionPage:
+        return self.repository.list_page_projection(after_cursor, limit, fields)
+
+    def search(self, criteria: UserSearchCriteria, after_cursor: Optional[str], limit: int) -> UserPage:
+        return self.repository.search(criteria, after_cursor, limit)
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[User]:
+        return self.repository.iter_all(chunk_size)
+
+    def list_after_id(self, after_id: Optional[int], limit: int) -> List[User]:
+        return self.repository.list_after_id(after_id, limit)
+
+    def get_projection_by_id(self, user_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """Project from a cached user when possible; projections themselves are not cached"""
+        version = self.version()
+        user = self._local.get(self._key(version, user_id)) if version is not None else _ABSENT
+        if user is _ABSENT:
+            return self.repository.get_projection_by_id(user_id, fields)
+        USER_CACHE_REQUESTS.inc('hit')
+        if user is None:
+            return None
+        return {field: getattr(user, field) for field in fields}
+
+    def list_changes(self, after_watermark: Optional[str], limit: int, until: datetime) -> ChangePage:
+        return self.repository.list_changes(after_watermark, limit, until)
+
+    def get_last_modified(self, user_id: int) -> Optional[datetime]:
+        """Read updated_at from a cached user when possible"""
+        version = self.version()
+        user = self._local.get(self._key(version, user_id)) if version is not None else _ABSENT
+        if user is _ABSENT:
+            return self.repository.get_last_modified(user_id)
+        USER_CACHE_REQUESTS.inc('hit')
+        return user.updated_at if user is not None else None
+
+    def get_table_stamp(self) -> Tuple[Optional[datetime], int]:
+        return self.repository.get_table_stamp()
+
+    # Writes bump the table version themselves, which retires cached entries
+    def create(self, user_data: CreateUserDTO) -> User:
+        return self.repository.create(user_data)
+
+    def create_many(self, users_data: List[CreateUserDTO]) -> List[User]:
+        return self.repository.create_many(users_data)
+
+    def update(self, user_data: UpdateUserDTO) -> Optional[User]:
+        return self.repository.update(user_data)
+
+    def update_many(self, users_data: List[UpdateUserDTO]) -> List[Optional[User]]:
+        return self.repository.update_many(users_data)
+
+    def delete(self, user_id: int) -> bool:
+        return self.repository.delete(user_id)
+
+    def delete_many(self, user_ids: List[int]) -> Set[int]:
+        return self.repository.delete_many(user_ids)
+
+    def exists_by_email(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        return self.repository.exists_by_email(email, exclude_id)
+
+    def exists_by_username(self, username: str, exclude_id: Optional[int] = None) -> bool:
+        return self.repository.exists_by_username(username, exclude_id)
+
+    def find_taken(self, emails: List[str], usernames: List[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        return self.repository.find_taken(emails, usernames)
@@ -1,12 +1,234 @@
 """
 Repository Implementation using Django ORM
-Implements IUserRepository interface
+Implements IUserRepository and IAsyncUserRepository interfaces
 """
 
-from typing import List, Optional
-from domain.entities.user import User, CreateUserDTO, UpdateUserDTO
+import base64
+import json
+import re
+from collections import defaultdict
+from contextlib import nullcontext
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from asgiref.sync import sync_to_async
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connection, transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from domain.entities.user import (
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    ProjectionPage,
+    ChangePage,
+    UserSearchCriteria
+)
 from domain.repositories.user_repository import IUserRepository
-from infrastructure.database.models import UserModel
+from domain.repositories.async_user_repository import IAsyncUserRepository
+from infrastructure.database.models import UserModel, UserTombstoneModel
+from infrastructure.database.routers import pin_to_primary, read_with_fallback
+
+
+# Fields a partial update may change
+UPDATABLE_FIELDS = ('name', 'email', 'username', 'phone', 'website')
+
+# Columns that make up a domain User, in constructor order
+ENTITY_FIELDS = ('id',) + UPDATABLE_FIELDS + ('updated_at',)
+
+
+# SQLite reports the column instead of the constraint name
+_SQLITE_UNIQUE_COLUMN = re.compile(r'UNIQUE constraint failed: \w+\.(\w+)')
+
+
+def _duplicate_error(error: IntegrityError) -> ValueError:
+    """Map a unique-constraint violation to the use case's duplicate message"""
+    constraint = getattr(getattr(error.__cause__, 'diag', None), 'constraint_name', None)
+    if not constraint:
+        match = _SQLITE_UNIQUE_COLUMN.search(str(error))
+        constraint = match.group(1) if match else ''
+    for field in ('username', 'email'):
+        if field in constraint:
+            return ValueError(f"User with this {field} already exists")
+    return ValueError("User with this email or username already exists")
+
+
+def _supports_returning() -> bool:
+    """Whether the backend supports UPDATE/DELETE ... RETURNING"""
+    if connection.vendor == 'postgresql':
+        return True
+    # SQLite added RETURNING in 3.35, the same release Django keys this feature on
+    return connection.vendor == 'sqlite' and connection.features.can_return_rows_from_bulk_insert
+
+
+def _statement_guard():
+    """
+    Isolate a single write so an IntegrityError leaves the connection usable.
+    In autocommit mode the statement is already its own transaction, so the
+    extra BEGIN/COMMIT round trips are skipped; inside a transaction a
+    savepoint is needed.
+    """
+    return transaction.atomic() if connection.in_atomic_block else nullcontext()
+
+
+def _pack(values: list) -> str:
+    """Encode a keyset position as an opaque URL-safe token"""
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def _unpack(cursor: str) -> list:
+    """Decode a token produced by _pack()"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded))
+
+
+def _encode_cursor(created_at: datetime, user_id: int) -> str:
+    """Encode a (created_at, id) keyset position as an opaque token"""
+    return _pack([created_at.isoformat(), user_id])
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode an opaque cursor token back into a (created_at, id) position"""
+    try:
+        created_at, user_id = _unpack(cursor)
+        return datetime.fromisoformat(created_at), int(user_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[int, int]:
+    """Decode a search cursor back into a (search_rank, id) position"""
+    try:
+        rank, user_id = _unpack(cursor)
+        return int(rank), int(user_id)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+
+
+# Change feed event kinds; at equal timestamps updates sort before deletions
+_CHANGED = 0
+_DELETED = 1
+
+
+def _decode_watermark(watermark: str) -> Tuple[datetime, int, int]:
+    """
+    Decode a change feed watermark into a (timestamp, kind, id) position.
+    A plain ISO 8601 timestamp is accepted too and includes changes made at
+    exactly that instant.
+    """
+    try:
+        timestamp, kind, user_id = _unpack(watermark)
+        return datetime.fromisoformat(timestamp), int(kind), int(user_id)
+    except (ValueError, TypeError):
+        pass
+    try:
+        timestamp = datetime.fromisoformat(watermark)
+    except ValueError:
+        raise ValueError("Invalid watermark")
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=dt_timezone.utc)
+    return timestamp, _CHANGED - 1, 0
+
+
+def _after(position: Tuple[datetime, int, int], kind: int, time_field: str, id_field: str) -> Q:
+    """Rows of the given kind whose (time, kind, id) sorts after position"""
+    timestamp, after_kind, after_id = position
+    if kind > after_kind:
+        return Q(**{f'{time_field}__gte': timestamp})
+    if kind < after_kind:
+        return Q(**{f'{time_field}__gt': timestamp})
+    return Q(**{f'{time_field}__gt': timestamp}) | Q(**{time_field: timestamp, f'{id_field}__gt': after_id})
+
+
+def _delete_users(user_ids: List[int]) -> Set[int]:
+    """
+    Delete users and record a tombstone for each, returning the deleted IDs.
+    PostgreSQL does both in one statement; other backends use one short
+    transaction.
+    """
+    now = timezone.now()
+    # Raw SQL bypasses the router, so keep this request's reads on the primary
+    pin_to_primary()
+    users = UserModel._meta
+    tombstones = UserTombstoneModel._meta
+    quote = connection.ops.quote_name
+    placeholders = ', '.join(['%s'] * len(user_ids))
+    delete = f"DELETE FROM {quote(users.db_table)} WHERE {quote(users.pk.column)} IN ({placeholders})"
+
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH deleted AS ({delete} RETURNING {quote(users.pk.column)}) "
+                f"INSERT INTO {quote(tombstones.db_table)} (user_id, deleted_at) "
+                f"SELECT {quote(users.pk.column)}, %s FROM deleted "
+                f"ON CONFLICT (user_id) DO UPDATE SET deleted_at = EXCLUDED.deleted_at "
+                f"RETURNING user_id",
+                list(user_ids) + [now]
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    with transaction.atomic():
+        if _supports_returning():
+            with connection.cursor() as cursor:
+                cursor.execute(f"{delete} RETURNING {quote(users.pk.column)}", list(user_ids))
+                deleted = {row[0] for row in cursor.fetchall()}
+        else:
+            # Backends without DELETE ... RETURNING need to read the IDs first
+            queryset = UserModel.objects.filter(id__in=user_ids)
+            deleted = set(queryset.values_list('id', flat=True))
+            queryset.delete()
+        if deleted:
+            UserTombstoneModel.objects.bulk_create(
+                [UserTombstoneModel(user_id=user_id, deleted_at=now) for user_id in deleted],
+                update_conflicts=True,
+                unique_fields=['user_id'],
+                update_fields=['deleted_at']
+            )
+    return deleted
+
+
+def _page_queryset(after_cursor: Optional[str], fields: Sequence[str] = ENTITY_FIELDS):
+    """Rows after the cursor, newest first, as the given columns plus id and created_at"""
+    queryset = UserModel.objects.order_by('-created_at', '-id').values_list(*fields, 'id', 'created_at')
+    if after_cursor:
+        created_at, user_id = _decode_cursor(after_cursor)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=user_id)
+        )
+    return queryset
+
+
+def _page_cursor(rows: list, limit: int) -> Tuple[list, Optional[str]]:
+    """Trim up to limit + 1 rows of _page_queryset() and derive the next cursor"""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, _encode_cursor(rows[-1][-1], rows[-1][-2])
+
+
+def _to_page(rows: list, limit: int) -> UserPage:
+    """Build a page from up to limit + 1 rows of _page_queryset()"""
+    rows, next_cursor = _page_cursor(rows, limit)
+    return UserPage(
+        items=[User.from_row(row[:-2]) for row in rows],
+        next_cursor=next_cursor
+    )
+
+
+def _read(query):
+    """Run query(alias) on a read replica when configured, falling back to the primary"""
+    return read_with_fallback(UserModel, query)
+
+
+def _changes(user_data: UpdateUserDTO) -> dict:
+    """Column values for a partial update: provided fields plus updated_at"""
+    changes = {
+        field: getattr(user_data, field)
+        for field in UPDATABLE_FIELDS
+        if getattr(user_data, field) is not None
+    }
+    changes['updated_at'] = timezone.now()
+    return changes
 
 
 class DjangoUserRepository(IUserRepository):
@@ -14,80 +236,359 @@ class DjangoUserRepository(IUserRepository):
 
     def _to_entity(self, model: UserModel) -> User:
         """Convert Django model to domain entity"""
-        return User(
-            id=model.id,
-            name=model.name,
-            email=model.email,
-            username=model.username,
-            phone=model.phone,
-            website=model.website
-        )
+        return User.from_row((
+            model.id,
+            model.name,
+            model.email,
+            model.username,
+            model.phone,
+            model.website,
+            model.updated_at
+        ))
 
     def get_all(self) -> List[User]:
         """Get all users"""
-        users = UserModel.objects.all()
-        return [self._to_entity(user) for user in users]
+        rows = _read(lambda alias: list(UserModel.objects.using(alias).values_list(*ENTITY_FIELDS)))
+        return [User.from_row(row) for row in rows]
+
+    def list_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        """Get one page of users, keyset-paginated on (created_at, id)"""
+        # Fetch one extra row to learn whether another page follows
+        rows = _read(lambda alias: list(_page_queryset(after_cursor).using(alias)[:limit + 1]))
+        return _to_page(rows, limit)
+
+    def list_page_projection(
+        self,
+        after_cursor: Optional[str],
+        limit: int,
+        fields: Sequence[str]
+    ) -> ProjectionPage:
+        """Get one page selecting only the requested columns"""
+        rows = _read(lambda alias: list(_page_queryset(after_cursor, fields).using(alias)[:limit + 1]))
+        rows, next_cursor = _page_cursor(rows, limit)
+        return ProjectionPage(
+            items=[dict(zip(fields, row)) for row in rows],
+            next_cursor=next_cursor
+        )
+
+    def search(self, criteria: UserSearchCriteria, after_cursor: Optional[str], limit: int) -> UserPage:
+        """Ranked search, keyset-paginated on (search_rank, id)"""
+        queryset = UserModel.objects.search(
+            text=criteria.text,
+            email=criteria.email,
+            username=criteria.username
+        ).order_by('search_rank', 'id').values_list(*ENTITY_FIELDS, 'search_rank')
+        if after_cursor:
+            rank, user_id = _decode_search_cursor(after_cursor)
+            queryset = queryset.filter(
+                Q(search_rank__gt=rank) | Q(search_rank=rank, id__gt=user_id)
+            )
+
+        # Fetch one extra row to learn whether another page follows
+        rows = _read(lambda alias: list(queryset.using(alias)[:limit + 1]))
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _pack([last[-1], last[0]])
+        return UserPage(
+            items=[User.from_row(row[:-1]) for row in rows],
+            next_cursor=next_cursor
+        )
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[User]:
+        """Iterate over all users through a server-side cursor"""
+        queryset = UserModel.objects.order_by('id').values_list(*ENTITY_FIELDS)
+        for row in queryset.iterator(chunk_size=chunk_size):
+            yield User.from_row(row)
+
+    def list_after_id(self, after_id: Optional[int], limit: int) -> List[User]:
+        """Get one keyset chunk of users ordered by ID; no cursor stays open between chunks"""
+        def chunk(alias):
+            queryset = UserModel.objects.using(alias).order_by('id')
+            if after_id is not None:
+                queryset = queryset.filter(id__gt=after_id)
+            return list(queryset.values_list(*ENTITY_FIELDS)[:limit])
+
+        return [User.from_row(row) for row in _read(chunk)]
 
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID"""
-        try:
-            user = UserModel.objects.get(id=user_id)
-            return self._to_entity(user)
-        except UserModel.DoesNotExist:
-            return None
+        row = _read(lambda alias: UserModel.objects.using(alias).filter(id=user_id).values_list(*ENTITY_FIELDS).first())
+        return User.from_row(row) if row else None
 
-    def create(self, user_data: CreateUserDTO) -> User:
-        """Create a new user"""
-        user = UserModel.objects.create(
-            name=user_data.name,
-            email=user_data.email,
-            username=user_data.username,
-            phone=user_data.phone,
-            website=user_data.website
+    def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        """Get many users with a single IN query"""
+        rows = _read(lambda alias: list(
+            UserModel.objects.using(alias).filter(id__in=user_ids).order_by().values_list(*ENTITY_FIELDS)
+        ))
+        return {row[0]: User.from_row(row) for row in rows}
+
+    def get_projection_by_id(self, user_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """Get a user selecting only the requested columns"""
+        row = _read(lambda alias: UserModel.objects.using(alias).filter(id=user_id).values_list(*fields).first())
+        return dict(zip(fields, row)) if row else None
+
+    def get_last_modified(self, user_id: int) -> Optional[datetime]:
+        """Get a user's updated_at with a single-column lookup"""
+        return _read(
+            lambda alias: UserModel.objects.using(alias).filter(id=user_id).values_list('updated_at', flat=True).first()
         )
+
+    def get_table_stamp(self) -> Tuple[Optional[datetime], int]:
+        """
+        Get the latest of max(updated_at) and the newest tombstone's
+        deleted_at, so deletions move the stamp too, and count(*)
+        """
+        def stamp(alias):
+            users = UserModel.objects.using(alias).order_by().aggregate(
+                last_modified=Max('updated_at'),
+                count=Count('id')
+            )
+            # Served by the (deleted_at, user_id) index
+            deleted_at = UserTombstoneModel.objects.using(alias).order_by('-deleted_at').values_list(
+                'deleted_at', flat=True
+            ).first()
+            return max(filter(None, (users['last_modified'], deleted_at)), default=None), users['count']
+
+        return _read(stamp)
+
+    def list_changes(self, after_watermark: Optional[str], limit: int, until: datetime) -> ChangePage:
+        """
+        Merge changed users and tombstones after the watermark, ordered by
+        (timestamp, kind, id). Each side is one indexed keyset query.
+        """
+        position = _decode_watermark(after_watermark) if after_watermark else None
+
+        def changes(alias):
+            users = UserModel.objects.using(alias).filter(updated_at__lte=until)
+            tombstones = UserTombstoneModel.objects.using(alias).filter(deleted_at__lte=until)
+            if position:
+                users = users.filter(_after(position, _CHANGED, 'updated_at', 'id'))
+                tombstones = tombstones.filter(_after(position, _DELETED, 'deleted_at', 'user_id'))
+            # Fetch one extra row per side to learn whether another page follows
+            return (
+                list(users.order_by('updated_at', 'id').values_list('updated_at', *ENTITY_FIELDS)[:limit + 1]),
+                list(tombstones.order_by('deleted_at', 'user_id').values_list('deleted_at', 'user_id')[:limit + 1])
+            )
+
+        user_rows, tombstone_rows = _read(changes)
+        events = sorted(
+            [(row[0], _CHANGED, row[1], row) for row in user_rows]
+            + [(deleted_at, _DELETED, user_id, None) for deleted_at, user_id in tombstone_rows],
+            key=lambda event: event[:3]
+        )
+        has_more = len(events) > limit
+        events = events[:limit]
+        if not events:
+            return ChangePage(changed=[], deleted=[], watermark=after_watermark, has_more=False)
+
+        last_time, last_kind, last_id, _ = events[-1]
+        return ChangePage(
+            changed=[User.from_row(row[1:]) for _, kind, _, row in events if kind == _CHANGED],
+            deleted=[user_id for _, kind, user_id, _ in events if kind == _DELETED],
+            watermark=_pack([last_time.isoformat(), last_kind, last_id]),
+            has_more=has_more
+        )
+
+    def create(self, user_data: CreateUserDTO) -> User:
+        """
+        Create a new user with a single INSERT.
+        Raises ValueError when the email or username is already taken.
+        """
+        try:
+            with _statement_guard():
+                user = UserModel.objects.create(
+                    name=user_data.name,
+                    email=user_data.email,
+                    username=user_data.username,
+                    phone=user_data.phone,
+                    website=user_data.website
+                )
+        except IntegrityError as e:
+            raise _duplicate_error(e)
         return self._to_entity(user)
 
+    def create_many(self, users_data: List[CreateUserDTO]) -> List[User]:
+        """Create many users with a single bulk INSERT"""
+        models = [
+            UserModel(
+                name=user_data.name,
+                email=user_data.email,
+                username=user_data.username,
+                phone=user_data.phone,
+                website=user_data.website
+            )
+            for user_data in users_data
+        ]
+        try:
+            with transaction.atomic():
+                created = UserModel.objects.bulk_create(models)
+        except IntegrityError as e:
+            raise _duplicate_error(e)
+        return [self._to_entity(user) for user in created]
+
     def update(self, user_data: UpdateUserDTO) -> Optional[User]:
-        """Update an existing user"""
+        """
+        Update an existing user with a single UPDATE of the provided fields.
+        Returns None if the user does not exist.
+        Raises ValueError when the new email or username is already taken.
+        """
+        changes = _changes(user_data)
+        pin_to_primary()
         try:
-            user = UserModel.objects.get(id=user_data.id)
-            
-            # Update only provided fields
-            if user_data.name is not None:
-                user.name = user_data.name
-            if user_data.email is not None:
-                user.email = user_data.email
-            if user_data.username is not None:
-                user.username = user_data.username
-            if user_data.phone is not None:
-                user.phone = user_data.phone
-            if user_data.website is not None:
-                user.website = user_data.website
-            
-            user.save()
-            return self._to_entity(user)
-        except UserModel.DoesNotExist:
-            return None
+            with _statement_guard():
+                if _supports_returning():
+                    return self._update_returning(user_data.id, changes)
+                updated = UserModel.objects.filter(id=user_data.id).update(**changes)
+        except IntegrityError as e:
+            raise _duplicate_error(e)
 
-    def delete(self, user_id: int) -> bool:
-        """Delete a user by ID"""
+        # Without RETURNING the row has to be read back
+        return self.get_by_id(user_data.id) if updated else None
+
+    def _update_returning(self, user_id: int, changes: dict) -> Optional[User]:
+        """UPDATE ... SET <changes> WHERE id = %s RETURNING <entity columns>"""
+        opts = UserModel._meta
+        quote = connection.ops.quote_name
+        assignments = []
+        params = []
+        for name, value in changes.items():
+            field = opts.get_field(name)
+            assignments.append(f"{quote(field.column)} = %s")
+            params.append(field.get_db_prep_save(value, connection))
+        # updated_at is the value just written; raw cursors skip type conversion
+        returning = ', '.join(quote(opts.get_field(name).column) for name in ENTITY_FIELDS[:-1])
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {quote(opts.db_table)} SET {', '.join(assignments)} "
+                f"WHERE {quote(opts.pk.column)} = %s RETURNING {returning}",
+                params + [user_id]
+            )
+            row = cursor.fetchone()
+        return User.from_row(row + (changes['updated_at'],)) if row else None
+
+    def update_many(self, users_data: List[UpdateUserDTO]) -> List[Optional[User]]:
+        """
+        Apply partial updates with one locking SELECT and one CASE-based bulk
+        UPDATE per set of changed fields, all in one transaction
+        """
+        # Read-modify-write: the SELECT must see the primary, not a lagging replica
+        pin_to_primary()
+        now = timezone.now()
         try:
-            user = UserModel.objects.get(id=user_id)
-            user.delete()
-            return True
-        except UserModel.DoesNotExist:
-            return False
+            with transaction.atomic():
+                # Locked until commit, so a concurrent write cannot land between
+                # the read and the write and be overwritten by stale values;
+                # locking in ID order keeps overlapping batches from deadlocking
+                users = UserModel.objects.select_for_update().order_by('id').in_bulk(
+                    [user_data.id for user_data in users_data]
+                )
+                changed_fields = {}
+                for user_data in users_data:
+                    user = users.get(user_data.id)
+                    if user is None:
+                        continue
+                    fields = changed_fields.setdefault(user.id, {'updated_at'})
+                    for field in UPDATABLE_FIELDS:
+                        value = getattr(user_data, field)
+                        if value is not None:
+                            setattr(user, field, value)
+                            fields.add(field)
+                    # bulk_update() skips auto_now, so stamp the row explicitly
+                    user.updated_at = now
+
+                # Each row only writes the fields its update set
+                groups = defaultdict(list)
+                for user_id, fields in changed_fields.items():
+                    groups[tuple(sorted(fields))].append(users[user_id])
+                for fields, group in groups.items():
+                    UserModel.objects.bulk_update(group, fields)
+        except IntegrityError as e:
+            raise _duplicate_error(e)
+
+        return [
+            self._to_entity(users[user_data.id]) if user_data.id in users else None
+            for user_data in users_data
+        ]
+
+    def delete(self, user_id: int) -> bool:
+        """Delete a user by ID and leave a tombstone for the change feed"""
+        return bool(_delete_users([user_id]))
+
+    def delete_many(self, user_ids: List[int]) -> Set[int]:
+        """Delete users with a single DELETE ... WHERE id IN (...) and leave tombstones"""
+        if not user_ids:
+            return set()
+        return _delete_users(user_ids)
 
     def exists_by_email(self, email: str, exclude_id: Optional[int] = None) -> bool:
         """Check if user exists by email"""
-        queryset = UserModel.objects.filter(email=email)
+        queryset = UserModel.objects.using(DEFAULT_DB_ALIAS).filter(email=email)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
 
     def exists_by_username(self, username: str, exclude_id: Optional[int] = None) -> bool:
         """Check if user exists by username"""
-        queryset = UserModel.objects.filter(username=username)
+        queryset = UserModel.objects.using(DEFAULT_DB_ALIAS).filter(username=username)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
+
+    def find_taken(self, emails: List[str], usernames: List[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Find taken emails and usernames with a single query, on the primary"""
+        rows = UserModel.objects.using(DEFAULT_DB_ALIAS).filter(
+            Q(email__in=emails) | Q(username__in=usernames)
+        ).order_by().values_list('id', 'email', 'username')
+        emails = set(emails)
+        usernames = set(usernames)
+        taken_emails = {}
+        taken_usernames = {}
+        for user_id, email, username in rows:
+            if email in emails:
+                taken_emails[email] = user_id
+            if username in usernames:
+                taken_usernames[username] = user_id
+        return taken_emails, taken_usernames
+
+
+class AsyncDjangoUserRepository(IAsyncUserRepository):
+    """Django async ORM implementation of User repository"""
+
+    async def alist_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        """Get one page of users, keyset-paginated on (created_at, id)"""
+        rows = [row async for row in _page_queryset(after_cursor)[:limit + 1]]
+        return _to_page(rows, limit)
+
+    async def aget_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID"""
+        row = await UserModel.objects.filter(id=user_id).values_list(*ENTITY_FIELDS).afirst()
+        return User.from_row(row) if row else None
+
+    async def acreate(self, user_data: CreateUserDTO) -> User:
+        """Create a new user with a single INSERT"""
+        try:
+            user = await UserModel.objects.acreate(
+                name=user_data.name,
+                email=user_data.email,
+                username=user_data.username,
+                phone=user_data.phone,
+                website=user_data.website
+            )
+        except IntegrityError as e:
+            raise _duplicate_error(e)
+        return User.from_row((user.id, user.name, user.email, user.username, user.phone, user.website, user.updated_at))
+
+    async def aupdate(self, user_data: UpdateUserDTO) -> Optional[User]:
+        """Update the provided fields of a user, then read it back"""
+        try:
+            updated = await UserModel.objects.filter(id=user_data.id).aupdate(**_changes(user_data))
+        except IntegrityError as e:
+            raise _duplicate_error(e)
+        return await self.aget_by_id(user_data.id) if updated else None
+
+    async def adelete(self, user_id: int) -> bool:
+        """Delete a user by ID and leave a tombstone for the change feed"""
+        return bool(await sync_to_async(_delete_users)([user_id]))
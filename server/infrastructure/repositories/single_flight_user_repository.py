@@ -0,0 +1,256 @@
+"""
+Single-flight Repository Decorators
+Concurrent identical reads share one in-flight query and its result:
+threads of a gthread worker through SingleFlightUserRepository, tasks on
+an ASGI event loop through AsyncSingleFlightUserRepository.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+from domain.entities.user import (
+    User,
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserPage,
+    ProjectionPage,
+    ChangePage,
+    UserSearchCriteria
+)
+from domain.repositories.user_repository import IUserRepository
+from domain.repositories.async_user_repository import IAsyncUserRepository
+from infrastructure.database.routers import reads_use_primary
+from infrastructure.monitoring.metrics import SINGLE_FLIGHT_CALLS
+
+T = TypeVar('T')
+
+
+class _Call:
+    """One in-flight read and the outcome its followers wait for"""
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time; callers arriving while it runs
+    wait and get the same result (or exception). Keys start with the method
+    name, which labels the metrics. forget() makes later callers start a new
+    flight instead of joining one that began before a write.
+    """
+
+    def __init__(self):
+        self._calls: Dict[tuple, _Call] = {}
+        self._tasks: Dict[tuple, asyncio.Task] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def forget(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+    def do(self, key: tuple, call: Callable[[], T]) -> T:
+        with self._lock:
+            key = (self._generation,) + key
+            flight = self._calls.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._calls[key] = _Call()
+
+        if not leader:
+            SINGLE_FLIGHT_CALLS.inc(key[1], 'coalesced')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        SINGLE_FLIGHT_CALLS.inc(key[1], 'executed')
+        try:
+            flight.result = call()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._calls.get(key) is flight:
+                    del self._calls[key]
+            flight.done.set()
+
+    async def ado(self, key: tuple, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Async variant: the read runs as its own task, so a caller that is
+        cancelled (e.g. a client disconnect) does not cancel it for the others
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            key = (id(loop), self._generation) + key
+            task = self._tasks.get(key)
+            leader = task is None
+            if leader:
+                task = self._tasks[key] = loop.create_task(call())
+
+        if leader:
+            SINGLE_FLIGHT_CALLS.inc(key[2], 'executed')
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            SINGLE_FLIGHT_CALLS.inc(key[2], 'coalesced')
+        return await asyncio.shield(task)
+
+    def _finish(self, key: tuple, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+
+class SingleFlightUserRepository(IUserRepository):
+    """
+    Coalesces concurrent identical reads on another user repository.
+    Results are shared between callers and must be treated as read-only.
+    Reads that must see the request's own writes (pinned to the primary or
+    inside a transaction) always run on their own.
+    """
+
+    def __init__(self, repository: IUserRepository, flights: Optional[SingleFlight] = None):
+        self.repository = repository
+        self.flights = flights or SingleFlight()
+
+    def _read(self, key: tuple, call: Callable[[], T]) -> T:
+        if reads_use_primary():
+            return call()
+        return self.flights.do(key, call)
+
+    def _write(self, call: Callable[[], T]) -> T:
+        try:
+            return call()
+        finally:
+            self.flights.forget()
+
+    def get_all(self) -> List[User]:
+        return self._read(('get_all',), self.repository.get_all)
+
+    def list_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        return self._read(
+            ('list_page', after_cursor, limit),
+            lambda: self.repository.list_page(after_cursor, limit)
+        )
+
+    def list_page_projection(
+        self,
+        after_cursor: Optional[str],
+        limit: int,
+        fields: Sequence[str]
+    ) -> ProjectionPage:
+        return self._read(
+            ('list_page_projection', after_cursor, limit, tuple(fields)),
+            lambda: self.repository.list_page_projection(after_cursor, limit, fields)
+        )
+
+    def search(self, criteria: UserSearchCriteria, after_cursor: Optional[str], limit: int) -> UserPage:
+        return self._read(
+            ('search', criteria.text, criteria.email, criteria.username, after_cursor, limit),
+            lambda: self.repository.search(criteria, after_cursor, limit)
+        )
+
+    def iter_all(self, chunk_size: int = 2000) -> Iterator[User]:
+        # A stream cannot be shared between consumers
+        return self.repository.iter_all(chunk_size)
+
+    def list_after_id(self, after_id: Optional[int], limit: int) -> List[User]:
+        # Export chunks are read once per stream; sharing them saves nothing
+        return self.repository.list_after_id(after_id, limit)
+
+    def get_by_id(self, user_id: int) -> Optional[User]:
+        return self._read(('get_by_id', user_id), lambda: self.repository.get_by_id(user_id))
+
+    def get_many(self, user_ids: List[int]) -> Dict[int, User]:
+        return self._read(('get_many', tuple(user_ids)), lambda: self.repository.get_many(user_ids))
+
+    def get_projection_by_id(self, user_id: int, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        return self._read(
+            ('get_projection_by_id', user_id, tuple(fields)),
+            lambda: self.repository.get_projection_by_id(user_id, fields)
+        )
+
+    def list_changes(self, after_watermark: Optional[str], limit: int, until: datetime) -> ChangePage:
+        return self._read(
+            ('list_changes', after_watermark, limit, until),
+            lambda: self.repository.list_changes(after_watermark, limit, until)
+        )
+
+    def get_last_modified(self, user_id: int) -> Optional[datetime]:
+        return self._read(('get_last_modified', user_id), lambda: self.repository.get_last_modified(user_id))
+
+    def get_table_stamp(self) -> Tuple[Optional[datetime], int]:
+        return self._read(('get_table_stamp',), self.repository.get_table_stamp)
+
+    def create(self, user_data: CreateUserDTO) -> User:
+        return self._write(lambda: self.repository.create(user_data))
+
+    def create_many(self, users_data: List[CreateUserDTO]) -> List[User]:
+        return self._write(lambda: self.repository.create_many(users_data))
+
+    def update(self, user_data: UpdateUserDTO) -> Optional[User]:
+        return self._write(lambda: self.repository.update(user_data))
+
+    def update_many(self, users_data: List[UpdateUserDTO]) -> List[Optional[User]]:
+        return self._write(lambda: self.repository.update_many(users_data))
+
+    def delete(self, user_id: int) -> bool:
+        return self._write(lambda: self.repository.delete(user_id))
+
+    def delete_many(self, user_ids: List[int]) -> Set[int]:
+        return self._write(lambda: self.repository.delete_many(user_ids))
+
+    # Uniqueness checks guard writes and read the primary; never shared
+    def exists_by_email(self, email: str, exclude_id: Optional[int] = None) -> bool:
+        return self.repository.exists_by_email(email, exclude_id)
+
+    def exists_by_username(self, username: str, exclude_id: Optional[int] = None) -> bool:
+        return self.repository.exists_by_username(username, exclude_id)
+
+    def find_taken(self, emails: List[str], usernames: List[str]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        return self.repository.find_taken(emails, usernames)
+
+
+class AsyncSingleFlightUserRepository(IAsyncUserRepository):
+    """Coalesces concurrent identical reads on an async user repository"""
+
+    def __init__(self, repository: IAsyncUserRepository, flights: Optional[SingleFlight] = None):
+        self.repository = repository
+        self.flights = flights or SingleFlight()
+
+    async def alist_page(self, after_cursor: Optional[str], limit: int) -> UserPage:
+        return await self.flights.ado(
+            ('alist_page', after_cursor, limit),
+            lambda: self.repository.alist_page(after_cursor, limit)
+        )
+
+    async def aget_by_id(self, user_id: int) -> Optional[User]:
+        return await self.flights.ado(('aget_by_id', user_id), lambda: self.repository.aget_by_id(user_id))
+
+    async def acreate(self, user_data: CreateUserDTO) -> User:
+        try:
+            return await self.repository.acreate(user_data)
+        finally:
+            self.flights.forget()
+
+    async def aupdate(self, user_data: UpdateUserDTO) -> Optional[User]:
+        try:
+            return await self.repository.aupdate(user_data)
+        finally:
+            self.flights.forget()
+
+    async def adelete(self, user_id: int) -> bool:
+        try:
+            return await self.repository.adelete(user_id)
+        finally:
+            self.flights.forget()
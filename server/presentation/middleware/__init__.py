@@ -0,0 +1 @@
+"""Presentation middleware package"""
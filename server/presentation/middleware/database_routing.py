@@ -0,0 +1,35 @@
+"""
+Database routing middleware
+Scopes read-your-writes primary pinning to a single request.
+"""
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from infrastructure.database.routers import end_request, start_request
+
+
+class PrimaryPinMiddleware:
+    """Clears the "wrote in this request" flag before and after every request"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = start_request()
+        try:
+            return self.get_response(request)
+        finally:
+            end_request(token)
+
+    async def __acall__(self, request):
+        token = start_request()
+        try:
+            return await self.get_response(request)
+        finally:
+            end_request(token)
@@ -0,0 +1,127 @@
+"""
+Request metrics middleware
+Counts queries and DB time, times the view and rendering phases, emits a
+Server-Timing header and feeds the per-route Prometheus metrics.
+"""
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from infrastructure.monitoring.metrics import (
+    REQUEST_DB_DURATION,
+    REQUEST_DURATION,
+    REQUEST_ERRORS,
+    REQUEST_QUERIES
+)
+from infrastructure.monitoring.request_timing import (
+    current_timings,
+    end_request,
+    install_query_timer,
+    start_request
+)
+
+# Route label for requests that did not resolve to a view
+UNMATCHED_ROUTE = 'unmatched'
+
+
+def _server_timing(timings, total: float) -> str:
+    """Build a Server-Timing header value; durations are in milliseconds"""
+    entries = [f'db;dur={timings.db_time * 1000:.2f};desc="{timings.queries} queries"']
+    for name, duration in timings.phases.items():
+        entries.append(f'{name};dur={duration * 1000:.2f}')
+    entries.append(f'total;dur={total * 1000:.2f}')
+    return ', '.join(entries)
+
+
+class RequestMetricsMiddleware:
+    """
+    Place first in MIDDLEWARE so the total covers the whole stack.
+    Phases: "view" runs from process_view until the view returns, "render"
+    from then until the rendered response reaches this middleware, and
+    "serialize" is recorded by the serializers themselves. Streaming
+    bodies are produced after the response leaves, so they are not timed.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'REQUEST_METRICS_ENABLED', True)
+        self.server_timing = getattr(settings, 'SERVER_TIMING_ENABLED', True)
+        if self.enabled:
+            connection_created.connect(install_query_timer, dispatch_uid='request_metrics_query_timer')
+            for connection in connections.all(initialized_only=True):
+                install_query_timer(connection=connection)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.enabled:
+            return self.get_response(request)
+        timings = start_request()
+        try:
+            response = self.get_response(request)
+        except Exception:
+            self._record(request, timings, None)
+            raise
+        finally:
+            end_request()
+        return self._record(request, timings, response)
+
+    async def __acall__(self, request):
+        if not self.enabled:
+            return await self.get_response(request)
+        timings = start_request()
+        try:
+            response = await self.get_response(request)
+        except Exception:
+            self._record(request, timings, None)
+            raise
+        finally:
+            end_request()
+        return self._record(request, timings, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        timings = current_timings()
+        if timings is not None:
+            request._metrics_view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # Called after the view returns and before the response is rendered
+        started = getattr(request, '_metrics_view_started', None)
+        if started is not None:
+            request._metrics_view_finished = time.perf_counter()
+            current_timings().add_phase('view', request._metrics_view_finished - started)
+        return response
+
+    def _record(self, request, timings, response):
+        finished = time.perf_counter()
+        total = finished - timings.started_at
+
+        view_started = getattr(request, '_metrics_view_started', None)
+        view_finished = getattr(request, '_metrics_view_finished', None)
+        if view_finished is not None:
+            timings.add_phase('render', finished - view_finished)
+        elif view_started is not None:
+            timings.add_phase('view', finished - view_started)
+
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match is not None else UNMATCHED_ROUTE
+        method = request.method
+        REQUEST_DURATION.observe(total, route, method)
+        REQUEST_DB_DURATION.observe(timings.db_time, route, method)
+        REQUEST_QUERIES.observe(timings.queries, route, method)
+
+        status_code = response.status_code if response is not None else 500
+        if status_code >= 400:
+            REQUEST_ERRORS.inc(route, method, str(status_code))
+
+        if response is not None and self.server_timing:
+            response['Server-Timing'] = _server_timing(timings, total)
+        return response
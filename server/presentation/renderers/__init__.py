@@ -0,0 +1 @@
+"""Presentation renderers package"""
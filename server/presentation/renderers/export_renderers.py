@@ -0,0 +1,161 @@
+"""
+Streaming renderers for bulk user export
+Encode rows incrementally so the response never holds the full table
+"""
+
+import csv
+import json
+import zlib
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List
+
+from rest_framework.renderers import BaseRenderer
+
+# Column order matches UserSerializer
+EXPORT_FIELDS = ('id', 'name', 'email', 'username', 'phone', 'website')
+
+# Rows buffered into a single chunk before it is written to the socket
+ROWS_PER_CHUNK = 500
+
+
+class _Echo:
+    """File-like object whose write() returns the value instead of storing it"""
+
+    def write(self, value):
+        return value
+
+
+def _batches(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Renderer that can also encode rows incrementally, one batch at a time.
+    stream() consumes a sync iterable (WSGI); astream() consumes batches
+    from an async iterable, so an ASGI server can send them as they arrive.
+    """
+
+    @classmethod
+    def encode(cls, rows: List[dict], first: bool) -> str:
+        """Encode one batch of rows; first is True for the batch that opens the stream"""
+        raise NotImplementedError
+
+    @classmethod
+    def stream(cls, rows: Iterable[dict]) -> Iterator[str]:
+        """Yield one chunk per ROWS_PER_CHUNK rows"""
+        first = True
+        for batch in _batches(rows, ROWS_PER_CHUNK):
+            yield cls.encode(batch, first)
+            first = False
+        if first and cls.encode([], True):
+            yield cls.encode([], True)
+
+    @classmethod
+    async def astream(cls, batches: AsyncIterable[List[dict]]) -> AsyncIterator[str]:
+        """Yield one chunk per batch"""
+        first = True
+        async for batch in batches:
+            yield cls.encode(batch, first)
+            first = False
+        if first and cls.encode([], True):
+            yield cls.encode([], True)
+
+
+class NDJSONRenderer(StreamingRenderer):
+    """Newline-delimited JSON, one object per line"""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows = data if isinstance(data, list) else [data]
+        return self.encode(rows, True).encode()
+
+    @classmethod
+    def encode(cls, rows: List[dict], first: bool) -> str:
+        return ''.join(json.dumps(row) + '\n' for row in rows)
+
+
+class CSVRenderer(StreamingRenderer):
+    """Comma-separated values with a header row"""
+    media_type = 'text/csv'
+    format = 'csv'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        rows = data if isinstance(data, list) else [data]
+        fields = list(rows[0].keys()) if rows else []
+        return ''.join(self._lines(fields, (
+            [row.get(field) for field in fields] for row in rows
+        ))).encode()
+
+    @staticmethod
+    def _lines(fields, values: Iterable[list], header: bool = True) -> Iterator[str]:
+        writer = csv.writer(_Echo())
+        if header:
+            yield writer.writerow(fields)
+        for row in values:
+            yield writer.writerow(row)
+
+    @classmethod
+    def encode(cls, rows: List[dict], first: bool) -> str:
+        """Export columns in EXPORT_FIELDS order, with the header in the first batch"""
+        values = ([row[field] for field in EXPORT_FIELDS] for row in rows)
+        return ''.join(cls._lines(EXPORT_FIELDS, values, header=first))
+
+
+def gzip_stream(chunks: Iterable[str]) -> Iterator[bytes]:
+    """Gzip-compress a stream of text chunks on the fly"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def agzip_stream(chunks: AsyncIterable[str]) -> AsyncIterator[bytes]:
+    """gzip_stream() for an async stream of text chunks"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """
+    Whether an Accept-Encoding header allows gzip, honouring q-values:
+    "gzip;q=0" refuses it, and "*" covers it unless gzip is listed itself
+    """
+    qualities = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    for coding in ('gzip', 'x-gzip', '*'):
+        if coding in qualities:
+            return qualities[coding] > 0
+    return False
@@ -2,8 +2,22 @@
 DRF Serializers for API requests/responses
 """
 
+from typing import Iterable, List
+
 from rest_framework import serializers
 
+from domain.entities.user import User
+from domain.validation.user_validation import (
+    EMAIL_MAX_LENGTH,
+    NAME_MAX_LENGTH,
+    PHONE_MAX_LENGTH,
+    USERNAME_MAX_LENGTH,
+    WEBSITE_MAX_LENGTH,
+    is_valid_email,
+    is_valid_url
+)
+from infrastructure.monitoring.request_timing import timed
+
 
 class UserSerializer(serializers.Serializer):
     """Serializer for User entity"""
@@ -16,21 +30,62 @@ class UserSerializer(serializers.Serializer):
     website = serializers.URLField(max_length=200, required=False, allow_blank=True, allow_null=True)
 
 
-class CreateUserSerializer(serializers.Serializer):
+def _represent(user: User) -> dict:
+    return {
+        'id': user.id,
+        'name': user.name,
+        'email': user.email,
+        'username': user.username,
+        'phone': user.phone,
+        'website': user.website,
+    }
+
+
+@timed('serialize')
+def user_to_representation(user: User) -> dict:
+    """
+    Fast equivalent of UserSerializer(asdict(user)).data for read paths.
+    Builds the output dict straight from the entity, skipping the deep
+    copy in asdict() and DRF's per-field to_representation().
+    """
+    return _represent(user)
+
+
+@timed('serialize')
+def users_to_representation(users: Iterable[User]) -> List[dict]:
+    """Fast equivalent of UserSerializer([asdict(u) ...], many=True).data"""
+    return [_represent(user) for user in users]
+
+
+class _UserFormatsMixin:
+    """Email and website formats checked by the domain rules the use cases apply"""
+
+    def validate_email(self, value):
+        if not is_valid_email(value):
+            raise serializers.ValidationError("Enter a valid email address.")
+        return value
+
+    def validate_website(self, value):
+        if value and not is_valid_url(value):
+            raise serializers.ValidationError("Enter a valid URL.")
+        return value
+
+
+class CreateUserSerializer(_UserFormatsMixin, serializers.Serializer):
     """Serializer for creating a user"""
     
-    name = serializers.CharField(max_length=255, required=True)
-    email = serializers.EmailField(max_length=255, required=True)
-    username = serializers.CharField(max_length=150, required=True)
-    phone = serializers.CharField(max_length=20, required=False, allow_blank=True, allow_null=True)
-    website = serializers.URLField(max_length=200, required=False, allow_blank=True, allow_null=True)
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH, required=True)
+    email = serializers.CharField(max_length=EMAIL_MAX_LENGTH, required=True)
+    username = serializers.CharField(max_length=USERNAME_MAX_LENGTH, required=True)
+    phone = serializers.CharField(max_length=PHONE_MAX_LENGTH, required=False, allow_blank=True, allow_null=True)
+    website = serializers.CharField(max_length=WEBSITE_MAX_LENGTH, required=False, allow_blank=True, allow_null=True)
 
 
-class UpdateUserSerializer(serializers.Serializer):
+class UpdateUserSerializer(_UserFormatsMixin, serializers.Serializer):
     """Serializer for updating a user"""
     
-    name = serializers.CharField(max_length=255, required=False)
-    email = serializers.EmailField(max_length=255, required=False)
-    username = serializers.CharField(max_length=150, required=False)
-    phone = serializers.CharField(max_length=20, required=False, allow_blank=True, allow_null=True)
-    website = serializers.URLField(max_length=200, required=False, allow_blank=True, allow_null=True)
+    name = serializers.CharField(max_length=NAME_MAX_LENGTH, required=False)
+    email = serializers.CharField(max_length=EMAIL_MAX_LENGTH, required=False)
+    username = serializers.CharField(max_length=USERNAME_MAX_LENGTH, required=False)
+    phone = serializers.CharField(max_length=PHONE_MAX_LENGTH, required=False, allow_blank=True, allow_null=True)
+    website = serializers.CharField(max_length=WEBSITE_MAX_LENGTH, required=False, allow_blank=True, allow_null=True)
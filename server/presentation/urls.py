@@ -3,11 +3,34 @@ URL Configuration for User API
 """
 
 from django.urls import path
-from presentation.views.user_views import UserListView, UserDetailView
-from presentation.views.health_views import HealthCheckView
+from presentation.views.user_views import (
+    UserListView,
+    UserDetailView,
+    UserSearchView,
+    UserBulkView,
+    UserExportView
+)
+from presentation.views.async_user_views import (
+    AsyncUserListView,
+    AsyncUserDetailView,
+    AsyncUserEventStreamView
+)
+from presentation.views.health_views import HealthCheckView, LivenessView, ReadinessView
+from presentation.views.metrics_views import MetricsView
 
 urlpatterns = [
     path('health/', HealthCheckView.as_view(), name='health-check'),
+    path('health/live/', LivenessView.as_view(), name='health-live'),
+    path('health/ready/', ReadinessView.as_view(), name='health-ready'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
     path('users/', UserListView.as_view(), name='user-list'),
+    path('users/search/', UserSearchView.as_view(), name='user-search'),
+    path('users/bulk/', UserBulkView.as_view(), name='user-bulk'),
+    path('users/export/', UserExportView.as_view(), name='user-export'),
     path('users/<int:pk>/', UserDetailView.as_view(), name='user-detail'),
+
+    # Native async variants, for deployments serving config.asgi:application
+    path('async/users/', AsyncUserListView.as_view(), name='async-user-list'),
+    path('async/users/events/', AsyncUserEventStreamView.as_view(), name='async-user-events'),
+    path('async/users/<int:pk>/', AsyncUserDetailView.as_view(), name='async-user-detail'),
 ]
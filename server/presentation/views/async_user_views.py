@@ -0,0 +1,214 @@
+"""
+Async API Views
+Presentation layer for the native async stack, served under ASGI
+"""
+
+import json
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+
+from config import dependencies
+from domain.entities.user import CreateUserDTO, UpdateUserDTO
+from presentation.renderers.json_renderers import FastJSONRenderer
+from presentation.serializers.user_serializers import (
+    CreateUserSerializer,
+    UpdateUserSerializer,
+    user_to_representation,
+    users_to_representation
+)
+
+
+# Dependency Injection
+user_events = dependencies.user_events
+user_usecases = dependencies.async_user_usecases
+
+renderer = FastJSONRenderer()
+
+
+def _json_response(data, status_code):
+    """Render with the same encoder as the sync API"""
+    return HttpResponse(
+        renderer.render(data),
+        status=status_code,
+        content_type=renderer.media_type
+    )
+
+
+def _parse_body(request):
+    """Decode a JSON request body; returns (data, error_response)"""
+    try:
+        return json.loads(request.body or b'{}'), None
+    except ValueError as e:
+        return None, _json_response(
+            {"detail": f"JSON parse error - {e}"},
+            status.HTTP_400_BAD_REQUEST
+        )
+
+
+class AsyncAPIView(View):
+    """Async class-based view; CSRF-exempt like DRF's APIView"""
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+
+class AsyncUserListView(AsyncAPIView):
+    """
+    GET /api/v1/async/users/?cursor=&limit= - List one page of users
+    POST /api/v1/async/users/ - Create a new user
+    """
+
+    async def get(self, request):
+        """Get one keyset-paginated page of users"""
+        try:
+            limit = request.GET.get('limit')
+            if limit and not limit.isdigit():
+                raise ValueError("Limit must be a positive integer")
+            page = await user_usecases.alist_users_page(
+                cursor=request.GET.get('cursor'),
+                limit=int(limit) if limit else None
+            )
+            return _json_response(
+                {"results": users_to_representation(page.items), "next_cursor": page.next_cursor},
+                status.HTTP_200_OK
+            )
+        except ValueError as e:
+            return _json_response({"detail": str(e)}, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return _json_response({"detail": str(e)}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    async def post(self, request):
+        """Create a new user"""
+        data, error = _parse_body(request)
+        if error:
+            return error
+
+        serializer = CreateUserSerializer(data=data)
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        try:
+            user = await user_usecases.acreate_user(CreateUserDTO(**serializer.validated_data))
+            return _json_response(user_to_representation(user), status.HTTP_201_CREATED)
+        except ValueError as e:
+            return _json_response({"detail": str(e)}, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return _json_response({"detail": str(e)}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncUserDetailView(AsyncAPIView):
+    """
+    GET /api/v1/async/users/{id}/ - Get user by ID
+    PUT /api/v1/async/users/{id}/ - Update user
+    PATCH /api/v1/async/users/{id}/ - Partial update user
+    DELETE /api/v1/async/users/{id}/ - Delete user
+    """
+
+    async def get(self, request, pk):
+        """Get user by ID"""
+        try:
+            user = await user_usecases.aget_user_by_id(pk)
+            if not user:
+                return _json_response({"detail": "User not found"}, status.HTTP_404_NOT_FOUND)
+            return _json_response(user_to_representation(user), status.HTTP_200_OK)
+        except ValueError as e:
+            return _json_response({"detail": str(e)}, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return _json_response({"detail": str(e)}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    async def put(self, request, pk):
+        """Full update of user"""
+        return await self._update(request, pk, CreateUserSerializer)
+
+    async def patch(self, request, pk):
+        """Partial update of user"""
+        return await self._update(request, pk, UpdateUserSerializer)
+
+    async def delete(self, request, pk):
+        """Delete user"""
+        try:
+            deleted = await user_usecases.adelete_user(pk)
+            if not deleted:
+                return _json_response({"detail": "User not found"}, status.HTTP_404_NOT_FOUND)
+            return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+        except ValueError as e:
+            return _json_response({"detail": str(e)}, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return _json_response({"detail": str(e)}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    async def _update(self, request, pk, serializer_class):
+        data, error = _parse_body(request)
+        if error:
+            return error
+
+        serializer = serializer_class(data=data)
+        if not serializer.is_valid():
+            return _json_response(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+        try:
+            user = await user_usecases.aupdate_user(UpdateUserDTO(id=pk, **serializer.validated_data))
+            if not user:
+                return _json_response({"detail": "User not found"}, status.HTTP_404_NOT_FOUND)
+            return _json_response(user_to_representation(user), status.HTTP_200_OK)
+        except ValueError as e:
+            return _json_response({"detail": str(e)}, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return _json_response({"detail": str(e)}, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncUserEventStreamView(AsyncAPIView):
+    """
+    GET /api/v1/async/users/events/ - Server-sent events of user changes
+
+    Events are user.created, user.updated (data: the user) and user.deleted
+    (data: {"id": ...}). Reconnecting clients send Last-Event-ID (or
+    ?last_event_id=) to resume; an "event: reset" means events were missed
+    and the client should catch up through GET /users/?updated_since=.
+    Holds the connection open, so it is only served through
+    config.asgi:application; under WSGI it answers 501.
+    """
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            # WSGI would buffer the endless stream into memory and never respond
+            return _json_response(
+                {"detail": "The event stream requires an ASGI server"},
+                status.HTTP_501_NOT_IMPLEMENTED
+            )
+        last_event_id = request.headers.get('Last-Event-ID') or request.GET.get('last_event_id')
+        subscription = user_events.subscribe(last_event_id or None)
+        response = StreamingHttpResponse(
+            self._stream(subscription),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Stop nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def _stream(self, subscription):
+        try:
+            yield f"retry: {settings.USER_EVENTS_RETRY_MS}\n\n".encode()
+            if subscription.backlog:
+                yield b''.join(event.frame for event in subscription.backlog)
+            while True:
+                if subscription.missed:
+                    subscription.missed = False
+                    yield b"event: reset\ndata: {}\n\n"
+                events = await subscription.get(settings.USER_EVENTS_HEARTBEAT_SECONDS)
+                if subscription.overflowed:
+                    # Too far behind; the client reconnects with its Last-Event-ID
+                    return
+                if events:
+                    yield b''.join(event.frame for event in events)
+                elif not subscription.missed:
+                    yield b": keepalive\n\n"
+        finally:
+            subscription.close()
@@ -2,38 +2,72 @@
 Health check views
 """
 
+import time
+
+from django.conf import settings
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.db import connections
-from django.db.utils import OperationalError
-import logging
 
-logger = logging.getLogger(__name__)
+from infrastructure.monitoring.database_probe import DatabaseProbe
+
+database_probe = DatabaseProbe(
+    interval=settings.HEALTH_READY_CACHE_SECONDS,
+    timeout=settings.HEALTH_DB_TIMEOUT
+)
+
+
+def _readiness():
+    """Readiness payload and status code from the cached database probe"""
+    result = database_probe.check()
+    data = {
+        "status": "healthy" if result.healthy else "unhealthy",
+        # Kept a plain string for probes that match on it
+        "database": result.detail,
+        "database_details": {
+            "latency_ms": result.latency_ms,
+            "connection_age_s": result.connection_age_s,
+            "checked_s_ago": round(time.monotonic() - result.checked_at, 1),
+        },
+    }
+    if result.healthy:
+        return data, status.HTTP_200_OK
+    return data, status.HTTP_503_SERVICE_UNAVAILABLE
+
 
 class HealthCheckView(APIView):
     """
-    GET /api/v1/health/ - Check API and Database health
+    GET /api/v1/health/ - Check API and Database health (same as /health/ready/)
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        data, status_code = _readiness()
+        return Response(data, status=status_code)
+
+
+class LivenessView(APIView):
+    """
+    GET /api/v1/health/live/ - The process is up and serving requests; touches no dependencies
+    """
+
+    authentication_classes = []
+    permission_classes = []
+
+    def get(self, request):
+        return Response({"status": "alive"}, status=status.HTTP_200_OK)
+
+
+class ReadinessView(APIView):
+    """
+    GET /api/v1/health/ready/ - Ready to serve traffic; database status is cached
     """
 
+    authentication_classes = []
+    permission_classes = []
+
     def get(self, request):
-        health_status = {
-            "status": "healthy",
-            "database": "unknown"
-        }
-        
-        db_conn = connections['default']
-        try:
-            # Try to acquire a connection
-            db_conn.cursor()
-            health_status["database"] = "connected"
-            print("Successfully connected to the database.")
-            logger.info("Health check: Database connection is successful.")
-        except OperationalError as e:
-            health_status["status"] = "unhealthy"
-            health_status["database"] = f"disconnected: {str(e)}"
-            print(f"Failed to connect to the database: {str(e)}")
-            logger.error(f"Health check: Database connection failed: {str(e)}")
-            return Response(health_status, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-
-        return Response(health_status, status=status.HTTP_200_OK)
+        data, status_code = _readiness()
+        return Response(data, status=status_code)
@@ -0,0 +1,227 @@
+"""
+Idempotency-Key support for write endpoints
+The first response to a key is stored in the database and replayed for
+retries without running the view again. Concurrent requests with the same
+key wait for the one in flight instead of repeating the write, whichever
+worker or host they reach.
+"""
+
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, transaction
+from django.db.models import Q
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from infrastructure.database.models import IdempotencyKeyModel
+from infrastructure.monitoring.metrics import IDEMPOTENT_REQUESTS
+from presentation.renderers.json_renderers import FastJSONRenderer
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+renderer = FastJSONRenderer()
+
+
+@dataclass(slots=True)
+class StoredResponse:
+    """A response kept for replay, with a hash of the request that produced it"""
+    fingerprint: str
+    status_code: int
+    body: bytes
+    headers: List[Tuple[str, str]]
+
+
+class IdempotencyStore:
+    """
+    Stored responses and in-flight claims in the idempotency_keys table on
+    the primary. A claim is a row INSERT, so the primary key coalesces
+    requests across workers; waiters in the holder's own process are woken
+    directly instead of polling.
+    """
+
+    POLL_INITIAL = 0.01
+    POLL_MAX = 0.25
+    # Share of releases that also delete expired keys
+    PURGE_PROBABILITY = 0.01
+
+    def __init__(self, ttl: float, lock_seconds: float, wait_seconds: float, using: str = DEFAULT_DB_ALIAS):
+        self.ttl = ttl
+        self.lock_seconds = lock_seconds
+        self.wait_seconds = wait_seconds
+        self.using = using
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+    def _keys(self):
+        return IdempotencyKeyModel.objects.using(self.using)
+
+    def get(self, key: str) -> Optional[StoredResponse]:
+        row = self._keys().filter(
+            key=key, status_code__isnull=False, expires_at__gt=timezone.now()
+        ).values_list('fingerprint', 'status_code', 'body', 'headers').first()
+        if row is None:
+            return None
+        fingerprint, status_code, body, headers = row
+        return StoredResponse(fingerprint, status_code, bytes(body), [tuple(header) for header in headers])
+
+    def acquire(self, key: str) -> bool:
+        """Claim the key; False while another request holds it or its response is stored"""
+        now = timezone.now()
+        claim = {
+            'fingerprint': '',
+            'status_code': None,
+            'body': None,
+            'headers': [],
+            'locked_until': now + timedelta(seconds=self.lock_seconds),
+            'expires_at': now + timedelta(seconds=self.ttl),
+        }
+        try:
+            with transaction.atomic(using=self.using):
+                self._keys().create(key=key, **claim)
+        except IntegrityError:
+            # Take over an expired response or a claim whose holder overran its lock
+            taken = self._keys().filter(
+                Q(expires_at__lte=now) | Q(status_code__isnull=True, locked_until__lte=now),
+                key=key
+            ).update(**claim)
+            if not taken:
+                return False
+        with self._lock:
+            self._inflight[key] = threading.Event()
+        return True
+
+    def release(self, key: str, stored: Optional[StoredResponse] = None) -> None:
+        """Store the response, if any, then free the key and wake local waiters"""
+        try:
+            if stored is not None:
+                self._keys().filter(key=key).update(
+                    fingerprint=stored.fingerprint,
+                    status_code=stored.status_code,
+                    body=stored.body,
+                    headers=[list(header) for header in stored.headers],
+                    locked_until=None,
+                    expires_at=timezone.now() + timedelta(seconds=self.ttl)
+                )
+            else:
+                self._keys().filter(key=key, status_code__isnull=True).delete()
+            if random.random() < self.PURGE_PROBABILITY:
+                self._keys().filter(expires_at__lte=timezone.now()).delete()
+        finally:
+            with self._lock:
+                event = self._inflight.pop(key, None)
+            if event is not None:
+                event.set()
+
+    def wait(self, key: str) -> bool:
+        """Wait for the holder of key to finish; False on timeout"""
+        with self._lock:
+            event = self._inflight.get(key)
+        if event is not None:
+            return event.wait(self.wait_seconds)
+
+        deadline = time.monotonic() + self.wait_seconds
+        delay = self.POLL_INITIAL
+        while time.monotonic() < deadline:
+            time.sleep(delay)
+            if not self._keys().filter(key=key, status_code__isnull=True).exists():
+                return True
+            delay = min(delay * 2, self.POLL_MAX)
+        return False
+
+
+_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    global _store
+    if _store is None:
+        _store = IdempotencyStore(
+            ttl=settings.IDEMPOTENCY_TTL,
+            lock_seconds=settings.IDEMPOTENCY_LOCK_SECONDS,
+            wait_seconds=settings.IDEMPOTENCY_WAIT_SECONDS
+        )
+    return _store
+
+
+def _replay(stored: StoredResponse, fingerprint: str, method: str):
+    if stored.fingerprint != fingerprint:
+        IDEMPOTENT_REQUESTS.inc(method, 'mismatch')
+        return Response(
+            {"detail": f"{IDEMPOTENCY_HEADER} was already used with a different request"},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    IDEMPOTENT_REQUESTS.inc(method, 'replayed')
+    response = HttpResponse(stored.body, status=stored.status_code, content_type=renderer.media_type)
+    for name, value in stored.headers:
+        response[name] = value
+    response['Idempotent-Replayed'] = 'true'
+    return response
+
+
+def _to_stored(response, fingerprint: str) -> StoredResponse:
+    return StoredResponse(
+        fingerprint=fingerprint,
+        status_code=response.status_code,
+        body=renderer.render(response.data) if hasattr(response, 'data') else response.content,
+        headers=[(name, value) for name, value in response.items() if name.lower() != 'content-type']
+    )
+
+
+def idempotent(handler):
+    """
+    Honour an Idempotency-Key header on an APIView write method.
+    Responses below 500 are stored for IDEMPOTENCY_TTL seconds, keyed by
+    method, path and key; a retry with the same key and body gets the stored
+    response back, with a different body it gets 422. Server errors are not
+    stored, so the next retry runs the write again.
+    """
+    @wraps(handler)
+    def wrapper(view, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return handler(view, request, *args, **kwargs)
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {"detail": f"{IDEMPOTENCY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        store = get_idempotency_store()
+        scope = hashlib.sha256(f"{request.method} {request.path} {key}".encode()).hexdigest()
+        fingerprint = hashlib.sha256(request.body).hexdigest()
+        while True:
+            stored = store.get(scope)
+            if stored is not None:
+                return _replay(stored, fingerprint, request.method)
+            if store.acquire(scope):
+                # acquire() never claims a key whose response is still stored
+                break
+            if not store.wait(scope):
+                IDEMPOTENT_REQUESTS.inc(request.method, 'conflict')
+                return Response(
+                    {"detail": f"A request with this {IDEMPOTENCY_HEADER} is still in progress"},
+                    status=status.HTTP_409_CONFLICT
+                )
+
+        stored = None
+        try:
+            response = handler(view, request, *args, **kwargs)
+            if response.status_code < 500:
+                stored = _to_stored(response, fingerprint)
+            IDEMPOTENT_REQUESTS.inc(request.method, 'executed')
+            return response
+        finally:
+            store.release(scope, stored)
+
+    return wrapper
@@ -0,0 +1,19 @@
+"""
+Metrics views
+"""
+
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from infrastructure.monitoring.metrics import REGISTRY
+
+PROMETHEUS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsView(APIView):
+    """
+    GET /api/v1/metrics/ - Request metrics in Prometheus text format
+    """
+
+    def get(self, request):
+        return HttpResponse(REGISTRY.render(), content_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,70 @@
+"""
+Pre-rendered list pages
+Final JSON bytes of list and search responses, keyed by path and query
+string plus the users table version. Every committed write changes the
+version, so a page is never served after the table changed; while it is
+unchanged, reads cost one primary-key lookup and no serialization.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+
+from infrastructure.database.routers import pin_to_primary
+from infrastructure.database.table_version import users_table_version
+from infrastructure.monitoring.metrics import LIST_PAGE_CACHE_REQUESTS
+
+@dataclass(slots=True)
+class CachedPage:
+    """A rendered 200 response body, its validators and any extra headers"""
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[datetime] = None
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+class ListPageCache:
+    """Rendered pages in a Django cache; entries larger than max_bytes are not kept"""
+
+    def __init__(self, cache, ttl: float, max_bytes: int, key_prefix: str = 'users:page'):
+        self.cache = cache
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.key_prefix = key_prefix
+
+    def key(self, request) -> Optional[str]:
+        """
+        Cache key for the request at the current table version. Read it
+        before querying; misses are filled from the primary, so a page holds
+        rows at least as new as the version it is stored under.
+        """
+        version = users_table_version()
+        if version is None:
+            return None
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        digest = hashlib.sha256(f"{request.path}?{query}".encode()).hexdigest()
+        return f"{self.key_prefix}:{version}:{digest}"
+
+    def get(self, key: str) -> Optional[CachedPage]:
+        """The cached page, or None after pinning the request to the primary to fill it"""
+        page = self.cache.get(key)
+        LIST_PAGE_CACHE_REQUESTS.inc('hit' if page is not None else 'miss')
+        if page is None:
+            # A lagging replica could hold rows older than the version
+            pin_to_primary()
+        return page
+
+    def store(
+        self,
+        key: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+        headers: Tuple[Tuple[str, str], ...] = ()
+    ) -> None:
+        """Keep a rendered body when it is small enough"""
+        if len(body) <= self.max_bytes:
+            page = CachedPage(body=body, etag=etag, last_modified=last_modified, headers=headers)
+            self.cache.set(key, page, self.ttl)
@@ -3,46 +3,287 @@ API Views using Django REST Framework
 Presentation layer - handles HTTP requests/responses
 """
 
+import hashlib
+
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import caches
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
 from dataclasses import asdict
 
-from domain.entities.user import CreateUserDTO, UpdateUserDTO
-from domain.usecases.user_usecases import UserUseCases
-from infrastructure.repositories.django_user_repository import DjangoUserRepository
+from config import dependencies
+
+from domain.entities.user import CreateUserDTO, UpdateUserDTO, UserSearchCriteria
+from domain.usecases.user_usecases import DEFAULT_PAGE_SIZE, normalize_fields
 from presentation.serializers.user_serializers import (
     UserSerializer,
     CreateUserSerializer,
-    UpdateUserSerializer
+    UpdateUserSerializer,
+    user_to_representation,
+    users_to_representation
+)
+from presentation.renderers.json_renderers import FastJSONRenderer
+from presentation.renderers.export_renderers import (
+    NDJSONRenderer,
+    CSVRenderer,
+    ROWS_PER_CHUNK,
+    accepts_gzip,
+    agzip_stream,
+    gzip_stream
 )
+from presentation.views.idempotency import idempotent
+from presentation.views.page_cache import CachedPage, ListPageCache
 
 
 # Dependency Injection
-user_repository = DjangoUserRepository()
-user_usecases = UserUseCases(user_repository)
+user_usecases = dependencies.user_usecases
+
+json_renderer = FastJSONRenderer()
+
+list_page_cache = None
+if settings.USER_LIST_CACHE_ENABLED:
+    list_page_cache = ListPageCache(
+        caches[settings.USER_LIST_CACHE_ALIAS],
+        ttl=settings.USER_LIST_CACHE_TTL,
+        max_bytes=settings.USER_LIST_CACHE_MAX_BYTES
+    )
+
+
+def _check_conditional(request, etag, last_modified):
+    """
+    Evaluate If-None-Match / If-Modified-Since against the current validators.
+    Returns a 304 response when the client's copy is fresh, otherwise None.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+    if response is not None:
+        _set_validators(response, etag, last_modified)
+    return response
+
+
+def _is_conditional(request):
+    """Whether the request carries validators that could turn it into a 304"""
+    return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+
+def _set_validators(response, etag, last_modified):
+    """Attach ETag and Last-Modified headers to a response"""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    return response
+
+
+def _cached_response(request, page: CachedPage):
+    """Answer from a pre-rendered page, honouring its validators"""
+    if page.etag:
+        not_modified = _check_conditional(request, page.etag, page.last_modified)
+        if not_modified is not None:
+            return not_modified
+    response = HttpResponse(page.body, content_type=FastJSONRenderer.media_type)
+    if page.etag:
+        _set_validators(response, page.etag, page.last_modified)
+    for name, value in page.headers:
+        response[name] = value
+    return response
+
+
+def _deprecate_full_list(request, response):
+    """Point clients of the unpaginated list at the cursor API that replaces it"""
+    response['Deprecation'] = 'true'
+    response['Link'] = f'<{request.path}?limit={DEFAULT_PAGE_SIZE}>; rel="successor-version"'
+    return response
+
+
+def _parse_limit(request):
+    """Read ?limit= as an int, or None when absent"""
+    limit = request.query_params.get('limit')
+    if not limit:
+        return None
+    if not limit.isdigit():
+        raise ValueError("Limit must be a positive integer")
+    return int(limit)
+
+
+def _parse_fields(request):
+    """Read ?fields=a,b,c as a list, or None when absent"""
+    fields = request.query_params.get('fields')
+    return fields.split(',') if fields is not None else None
+
+
+def _user_etag(user_id, last_modified):
+    return f'W/"user-{user_id}-{last_modified.timestamp():.6f}"'
+
+
+def _users_etag(last_modified, count):
+    version = f"{last_modified.timestamp():.6f}" if last_modified else "0"
+    return f'W/"users-{count}-{version}"'
+
+
+def _body_etag(body: bytes):
+    return f'W/"users-{hashlib.sha256(body).hexdigest()[:32]}"'
 
 
 class UserListView(APIView):
     """
-    GET /api/v1/users/ - List all users
-    POST /api/v1/users/ - Create a new user
+    GET /api/v1/users/ - List all users, up to USER_LIST_ALL_MAX (deprecated)
+    GET /api/v1/users/?cursor=&limit=&fields= - List one page of users
+    GET /api/v1/users/?ids=1,2,3 - Get many users by ID
+    GET /api/v1/users/?updated_since=&limit= - Users changed or deleted since a watermark
+    POST /api/v1/users/ - Create a new user (honours Idempotency-Key)
     """
+    renderer_classes = [FastJSONRenderer]
 
     def get(self, request):
-        """Get all users"""
+        """Get all users, or a single page when cursor/limit is given"""
         try:
-            users = user_usecases.get_all_users()
-            # Convert domain entities to dicts
-            users_data = [asdict(user) for user in users]
-            serializer = UserSerializer(users_data, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # The change feed depends on the clock as well as the table, so it
+            # gets no validators and is never cached
+            if 'updated_since' in request.query_params:
+                return self._get_changes(request)
+
+            full_list = not any(
+                param in request.query_params for param in ('ids', 'cursor', 'limit', 'fields')
+            )
+            response = self._get_list(request)
+            return _deprecate_full_list(request, response) if full_list else response
         except Exception as e:
             return Response(
                 {"detail": str(e)},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _get_list(self, request):
+        """Get a page, a batch or the capped full list, through the page cache"""
+        cache_key = None
+        # ?ids= batches are assembled from the user cache, not kept whole
+        if list_page_cache is not None and 'ids' not in request.query_params:
+            cache_key = list_page_cache.key(request)
+            page = list_page_cache.get(cache_key) if cache_key else None
+            if page is not None:
+                return _cached_response(request, page)
+
+        etag = last_modified = None
+        headers = ()
+        if 'ids' in request.query_params:
+            response = self._get_batch(request)
+        elif any(param in request.query_params for param in ('cursor', 'limit', 'fields')):
+            response = self._get_page(request)
+        else:
+            # Whole-table validators: a cheap aggregate first, so a fresh
+            # client copy skips the listing entirely
+            last_modified, count = user_usecases.get_users_stamp()
+            etag = _users_etag(last_modified, count)
+            not_modified = _check_conditional(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            users = user_usecases.get_all_users(limit=settings.USER_LIST_ALL_MAX)
+            response = Response(users_to_representation(users), status=status.HTTP_200_OK)
+            # The array alone cannot say it was cut off at the cap
+            headers = (('X-Total-Count', str(count)),)
+            if count > settings.USER_LIST_ALL_MAX:
+                headers += (('X-Truncated', 'true'),)
+
+        if response.status_code != status.HTTP_200_OK:
+            return response
+        body = json_renderer.render(response.data)
+        if etag is None:
+            # Pages and ?ids= batches are validated by their own content,
+            # so a table-wide aggregate is not needed to answer them
+            etag = _body_etag(body)
+        if cache_key:
+            list_page_cache.store(cache_key, body, etag, last_modified, headers)
+        return _cached_response(request, CachedPage(body, etag, last_modified, headers))
+
+    def _get_page(self, request):
+        """Get one keyset-paginated page of users, optionally reduced to ?fields="""
+        try:
+            fields = _parse_fields(request)
+            if fields is not None:
+                # Projected rows are already plain dicts; no entity or serializer
+                page = user_usecases.list_user_fields_page(
+                    fields,
+                    cursor=request.query_params.get('cursor'),
+                    limit=_parse_limit(request)
+                )
+                results = page.items
+            else:
+                page = user_usecases.list_users_page(
+                    cursor=request.query_params.get('cursor'),
+                    limit=_parse_limit(request)
+                )
+                results = users_to_representation(page.items)
+            return Response(
+                {"results": results, "next_cursor": page.next_cursor},
+                status=status.HTTP_200_OK
+            )
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _get_changes(self, request):
+        """Get users changed or deleted since ?updated_since= and the next watermark"""
+        try:
+            page = user_usecases.list_changes(
+                watermark=request.query_params.get('updated_since'),
+                limit=_parse_limit(request)
+            )
+            return Response(
+                {
+                    "changed": users_to_representation(page.changed),
+                    "deleted": page.deleted,
+                    "watermark": page.watermark,
+                    "has_more": page.has_more,
+                },
+                status=status.HTTP_200_OK
+            )
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    def _get_batch(self, request):
+        """Get the users listed in ?ids= in request order, reporting missing IDs"""
+        try:
+            raw_ids = [value.strip() for value in request.query_params['ids'].split(',') if value.strip()]
+            if not all(value.isdigit() for value in raw_ids):
+                raise ValueError("IDs must be positive integers")
+            users, missing = user_usecases.get_users_by_ids([int(value) for value in raw_ids])
+            return Response(
+                {"results": users_to_representation(users), "missing": missing},
+                status=status.HTTP_200_OK
+            )
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @idempotent
     def post(self, request):
         """Create a new user"""
         serializer = CreateUserSerializer(data=request.data)
@@ -74,28 +315,260 @@ class UserListView(APIView):
             )
 
 
+class UserSearchView(APIView):
+    """
+    GET /api/v1/users/search/?q=&email=&username=&cursor=&limit= - Search users
+    """
+    renderer_classes = [FastJSONRenderer]
+
+    def get(self, request):
+        """Get one page of ranked search results"""
+        try:
+            cache_key = list_page_cache.key(request) if list_page_cache is not None else None
+            cached = list_page_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return _cached_response(request, cached)
+
+            page = user_usecases.search_users(
+                UserSearchCriteria(
+                    text=request.query_params.get('q'),
+                    email=request.query_params.get('email'),
+                    username=request.query_params.get('username')
+                ),
+                cursor=request.query_params.get('cursor'),
+                limit=_parse_limit(request)
+            )
+            data = {"results": users_to_representation(page.items), "next_cursor": page.next_cursor}
+            if cache_key:
+                body = json_renderer.render(data)
+                list_page_cache.store(cache_key, body)
+                return HttpResponse(body, content_type=FastJSONRenderer.media_type)
+            return Response(data, status=status.HTTP_200_OK)
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class UserBulkView(APIView):
+    """
+    POST /api/v1/users/bulk/ - Create many users from a JSON array
+    PATCH /api/v1/users/bulk/ - Partially update many users from a JSON array
+    DELETE /api/v1/users/bulk/ - Delete many users by ID
+    """
+
+    def post(self, request):
+        """Create a batch of users and report the outcome of each item"""
+        if not isinstance(request.data, list):
+            return Response(
+                {"detail": "Expected a list of users"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Field-level validation per item; invalid items never reach the use case
+        items = []
+        valid = []
+        for index, item in enumerate(request.data):
+            serializer = CreateUserSerializer(data=item)
+            if serializer.is_valid():
+                items.append({"index": index})
+                valid.append((items[-1], CreateUserDTO(**serializer.validated_data)))
+            else:
+                items.append({"index": index, "status": "error", "errors": serializer.errors})
+
+        return self._run(
+            user_usecases.create_many,
+            [user_data for _, user_data in valid],
+            [item for item, _ in valid],
+            items,
+            "created",
+            status.HTTP_201_CREATED
+        )
+
+    def patch(self, request):
+        """Partially update a batch of users and report the outcome per ID"""
+        if not isinstance(request.data, list):
+            return Response(
+                {"detail": "Expected a list of users"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        items = []
+        valid = []
+        for index, item in enumerate(request.data):
+            user_id = item.get("id") if isinstance(item, dict) else None
+            if not isinstance(user_id, int) or isinstance(user_id, bool):
+                items.append({"index": index, "status": "error", "errors": {"id": ["A valid integer is required."]}})
+                continue
+            serializer = UpdateUserSerializer(data=item)
+            if serializer.is_valid():
+                items.append({"index": index, "id": user_id})
+                valid.append((items[-1], UpdateUserDTO(id=user_id, **serializer.validated_data)))
+            else:
+                items.append({"index": index, "id": user_id, "status": "error", "errors": serializer.errors})
+
+        return self._run(
+            user_usecases.update_many,
+            [user_data for _, user_data in valid],
+            [item for item, _ in valid],
+            items,
+            "updated",
+            status.HTTP_200_OK
+        )
+
+    def delete(self, request):
+        """Delete a batch of users and report the outcome per ID"""
+        user_ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        if not isinstance(user_ids, list) or not all(
+            isinstance(user_id, int) and not isinstance(user_id, bool) for user_id in user_ids
+        ):
+            return Response(
+                {"detail": "Expected {\"ids\": [...]} with integer IDs"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        items = [{"index": index, "id": user_id} for index, user_id in enumerate(user_ids)]
+        return self._run(
+            user_usecases.delete_many,
+            user_ids,
+            items,
+            items,
+            "deleted",
+            status.HTTP_200_OK
+        )
+
+    def _run(self, operation, batch, batch_items, items, success, success_status):
+        """Run a bulk use case and merge its per-item results into the response"""
+        try:
+            results = operation(batch, chunk_size=settings.USER_BULK_CHUNK_SIZE)
+        except ValueError as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            return Response(
+                {"detail": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        for item, result in zip(batch_items, results):
+            if result.error:
+                item.update(status="error", detail=result.error)
+            elif result.not_found:
+                item.update(status="not_found")
+            else:
+                item["status"] = success
+                if result.user:
+                    item["user"] = UserSerializer(asdict(result.user)).data
+
+        succeeded = sum(1 for item in items if item["status"] == success)
+        return Response(
+            {success: succeeded, "failed": len(items) - succeeded, "results": items},
+            status=success_status if succeeded == len(items) else status.HTTP_207_MULTI_STATUS
+        )
+
+
+async def _export_batches():
+    """Every user as representations, one keyset chunk of ROWS_PER_CHUNK at a time"""
+    export_chunk = sync_to_async(user_usecases.export_users_after)
+    after_id = None
+    while True:
+        users = await export_chunk(after_id, ROWS_PER_CHUNK)
+        if users:
+            yield users_to_representation(users)
+        if len(users) < ROWS_PER_CHUNK:
+            return
+        after_id = users[-1].id
+
+
+class UserExportView(APIView):
+    """
+    GET /api/v1/users/export/ - Stream all users as NDJSON or CSV
+    Format is chosen by the Accept header or ?format=ndjson|csv
+    """
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    def get(self, request):
+        """Stream every user without buffering the table in memory"""
+        renderer = request.accepted_renderer
+        gzip = accepts_gzip(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if isinstance(request._request, ASGIRequest):
+            # ASGI would drain a sync iterator into memory before sending it,
+            # so the rows are fetched in keyset chunks off the event loop
+            chunks = renderer.astream(_export_batches())
+            content = agzip_stream(chunks) if gzip else chunks
+        else:
+            rows = (user_to_representation(user) for user in user_usecases.export_users())
+            chunks = renderer.stream(rows)
+            content = gzip_stream(chunks) if gzip else chunks
+
+        response = StreamingHttpResponse(
+            content,
+            content_type=f"{renderer.media_type}; charset=utf-8"
+        )
+        if gzip:
+            response['Content-Encoding'] = 'gzip'
+        patch_vary_headers(response, ('Accept', 'Accept-Encoding'))
+        response['Content-Disposition'] = f'attachment; filename="users.{renderer.format}"'
+        return response
+
+
 class UserDetailView(APIView):
     """
-    GET /api/v1/users/{id}/ - Get user by ID
+    GET /api/v1/users/{id}/?fields= - Get user by ID
     PUT /api/v1/users/{id}/ - Update user
     PATCH /api/v1/users/{id}/ - Partial update user
     DELETE /api/v1/users/{id}/ - Delete user
+
+    Writes honour an Idempotency-Key header.
     """
+    renderer_classes = [FastJSONRenderer]
 
     def get(self, request, pk):
         """Get user by ID"""
         try:
-            user = user_usecases.get_user_by_id(pk)
-            
-            if not user:
+            fields = _parse_fields(request)
+            if fields is not None:
+                fields = normalize_fields(fields)
+
+            if fields is not None or _is_conditional(request):
+                # A single-column lookup answers revalidations without loading the user
+                last_modified = user_usecases.get_user_last_modified(pk)
+                if last_modified is None:
+                    return Response(
+                        {"detail": "User not found"},
+                        status=status.HTTP_404_NOT_FOUND
+                    )
+                not_modified = _check_conditional(request, _user_etag(pk, last_modified), last_modified)
+                if not_modified is not None:
+                    return not_modified
+
+            if fields is not None:
+                # Only the requested columns are read. The validators were read
+                # first, so they are never newer than the projection they label
+                data = user_usecases.get_user_fields(pk, fields)
+            else:
+                # Validators sent with a full body come from the same (possibly
+                # cached) entity, so the ETag describes exactly that representation
+                user = user_usecases.get_user_by_id(pk)
+                data = user_to_representation(user) if user else None
+                last_modified = user.updated_at if user else None
+            if data is None:
                 return Response(
                     {"detail": "User not found"},
                     status=status.HTTP_404_NOT_FOUND
                 )
-            
-            user_dict = asdict(user)
-            serializer = UserSerializer(user_dict)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+
+            etag = _user_etag(pk, last_modified) if last_modified else None
+            response = Response(data, status=status.HTTP_200_OK)
+            return _set_validators(response, etag, last_modified) if etag else response
         
         except ValueError as e:
             return Response(
@@ -108,6 +581,7 @@ class UserDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @idempotent
     def put(self, request, pk):
         """Full update of user"""
         serializer = CreateUserSerializer(data=request.data)
@@ -143,6 +617,7 @@ class UserDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @idempotent
     def patch(self, request, pk):
         """Partial update of user"""
         serializer = UpdateUserSerializer(data=request.data)
@@ -178,6 +653,7 @@ class UserDetailView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    @idempotent
     def delete(self, request, pk):
         """Delete user"""
         try:
@@ -0,0 +1,43 @@
+"""
+Shared helpers for the API tests
+"""
+
+import itertools
+import json
+
+from django.test import TransactionTestCase
+
+from infrastructure.database.models import UsersTableVersionModel
+from infrastructure.database.table_version import VERSION_ROW_ID
+
+# Far enough apart that no test writes its way into the next one's range
+_table_versions = itertools.count(10 ** 6, 10 ** 6)
+
+
+class UserAPITestCase(TransactionTestCase):
+    """
+    Runs outside a transaction, as requests do, so the user and page caches
+    are in play. The flush between tests drops the table version row; each
+    test recreates it at a version no earlier test used, so entries cached
+    by one test can never be served in the next.
+    """
+
+    def setUp(self):
+        UsersTableVersionModel.objects.update_or_create(
+            id=VERSION_ROW_ID,
+            defaults={'version': next(_table_versions)}
+        )
+
+    def create_user(self, username, **fields):
+        data = {"name": username.title(), "email": f"{username}@example.com", "username": username}
+        data.update(fields)
+        response = self.client.post('/api/v1/users/', json.dumps(data), content_type='application/json')
+        self.assertEqual(response.status_code, 201, response.content)
+        return response.json()
+
+    def patch_user(self, user_id, **changes):
+        return self.client.patch(
+            f'/api/v1/users/{user_id}/',
+            json.dumps(changes),
+            content_type='application/json'
+        )
@@ -0,0 +1,110 @@
+"""
+Bulk create, update and delete of users
+"""
+
+import json
+from unittest import mock
+
+from django.db import connection
+from django.db.models import QuerySet
+
+from domain.entities.user import UpdateUserDTO
+from infrastructure.repositories.django_user_repository import DjangoUserRepository
+from tests.base import UserAPITestCase
+
+
+class BulkAPITestCase(UserAPITestCase):
+
+    def bulk(self, method, data):
+        response = getattr(self.client, method)('/api/v1/users/bulk/', json.dumps(data), content_type='application/json')
+        return response.status_code, response.json()
+
+    def statuses(self, body):
+        return [item['status'] for item in body['results']]
+
+
+class BulkCreateTests(BulkAPITestCase):
+
+    def test_valid_batch_is_created_in_order(self):
+        code, body = self.bulk('post', [
+            {"name": "Alice", "email": "alice@example.com", "username": "alice"},
+            {"name": "Bob", "email": "bob@example.com", "username": "bob"},
+        ])
+        self.assertEqual(code, 201)
+        self.assertEqual(body['created'], 2)
+        self.assertEqual([item['user']['username'] for item in body['results']], ['alice', 'bob'])
+
+    def test_each_item_reports_its_own_failure(self):
+        self.create_user('alice')
+        code, body = self.bulk('post', [
+            {"name": "Carol", "email": "carol@example.com", "username": "carol"},
+            {"name": "Alice", "email": "alice@example.com", "username": "alice2"},
+            {"name": "Eve", "email": "eve@example.com", "username": "carol"},
+            {"name": "Mallory", "email": "not-an-email", "username": "mallory"},
+        ])
+        self.assertEqual(code, 207)
+        self.assertEqual((body['created'], body['failed']), (1, 3))
+        self.assertEqual(self.statuses(body), ['created', 'error', 'error', 'error'])
+        self.assertEqual(body['results'][1]['detail'], 'User with this email already exists')
+        self.assertEqual(body['results'][2]['detail'], 'Duplicate username in batch')
+        self.assertIn('email', body['results'][3]['errors'])
+
+    def test_body_must_be_a_list(self):
+        code, _ = self.bulk('post', {"name": "Alice"})
+        self.assertEqual(code, 400)
+
+
+class BulkUpdateTests(BulkAPITestCase):
+
+    def test_updates_report_per_id_outcomes(self):
+        alice = self.create_user('alice')
+        bob = self.create_user('bob')
+        code, body = self.bulk('patch', [
+            {"id": alice['id'], "name": "Alice Cooper"},
+            {"id": 999999, "name": "Nobody"},
+            {"id": bob['id'], "username": "alice"},
+            {"name": "No ID"},
+        ])
+        self.assertEqual(code, 207)
+        self.assertEqual(self.statuses(body), ['updated', 'not_found', 'error', 'error'])
+        self.assertEqual(body['results'][0]['user']['name'], 'Alice Cooper')
+        self.assertEqual(body['results'][2]['detail'], 'User with this username already exists')
+        self.assertEqual(self.client.get(f"/api/v1/users/{bob['id']}/").json()['username'], 'bob')
+
+    def test_rows_only_write_the_fields_they_change(self):
+        alice = self.create_user('alice')
+        bob = self.create_user('bob')
+        in_bulk = QuerySet.in_bulk
+
+        def read_then_race(queryset, *args, **kwargs):
+            users = in_bulk(queryset, *args, **kwargs)
+            # Another writer changes alice's email after the batch read her row
+            with connection.cursor() as cursor:
+                cursor.execute("UPDATE users SET email = 'alice@elsewhere.com' WHERE id = %s", [alice['id']])
+            return users
+
+        with mock.patch.object(QuerySet, 'in_bulk', read_then_race):
+            DjangoUserRepository().update_many([
+                UpdateUserDTO(id=alice['id'], name='Alice Cooper'),
+                UpdateUserDTO(id=bob['id'], email='bob@elsewhere.com'),
+            ])
+
+        alice = self.client.get(f"/api/v1/users/{alice['id']}/").json()
+        bob = self.client.get(f"/api/v1/users/{bob['id']}/").json()
+        self.assertEqual((alice['name'], alice['email']), ('Alice Cooper', 'alice@elsewhere.com'))
+        self.assertEqual(bob['email'], 'bob@elsewhere.com')
+
+
+class BulkDeleteTests(BulkAPITestCase):
+
+    def test_deletes_report_per_id_outcomes(self):
+        alice = self.create_user('alice')
+        code, body = self.bulk('delete', {"ids": [alice['id'], 999999]})
+
+        self.assertEqual(code, 207)
+        self.assertEqual(self.statuses(body), ['deleted', 'not_found'])
+        self.assertEqual(self.client.get(f"/api/v1/users/{alice['id']}/").status_code, 404)
+
+    def test_ids_must_be_integers(self):
+        code, _ = self.bulk('delete', {"ids": ["1"]})
+        self.assertEqual(code, 400)
@@ -0,0 +1,60 @@
+"""
+Watermark paging of the ?updated_since= change feed
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from tests.base import UserAPITestCase
+
+# Let the feed include rows written a moment ago
+no_settle = mock.patch('domain.usecases.user_usecases.CHANGE_FEED_SETTLE', timedelta(0))
+
+
+@no_settle
+class ChangeFeedTests(UserAPITestCase):
+
+    def changes(self, watermark='', limit=None):
+        url = f'/api/v1/users/?updated_since={watermark}'
+        if limit:
+            url += f'&limit={limit}'
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_pages_follow_the_watermark_without_gaps_or_repeats(self):
+        for username in ('alice', 'bob', 'carol'):
+            self.create_user(username)
+
+        first = self.changes(limit=2)
+        self.assertEqual([user['username'] for user in first['changed']], ['alice', 'bob'])
+        self.assertTrue(first['has_more'])
+
+        second = self.changes(first['watermark'], limit=2)
+        self.assertEqual([user['username'] for user in second['changed']], ['carol'])
+        self.assertFalse(second['has_more'])
+
+    def test_caught_up_feed_keeps_its_watermark(self):
+        self.create_user('alice')
+        page = self.changes()
+
+        idle = self.changes(page['watermark'])
+        self.assertEqual(idle['changed'], [])
+        self.assertEqual(idle['deleted'], [])
+        self.assertEqual(idle['watermark'], page['watermark'])
+
+    def test_updates_and_deletes_appear_after_the_watermark(self):
+        alice = self.create_user('alice')
+        bob = self.create_user('bob')
+        watermark = self.changes()['watermark']
+
+        self.patch_user(alice['id'], name='Alice Cooper')
+        self.client.delete(f"/api/v1/users/{bob['id']}/")
+
+        page = self.changes(watermark)
+        self.assertEqual([user['name'] for user in page['changed']], ['Alice Cooper'])
+        self.assertEqual(page['deleted'], [bob['id']])
+
+    def test_invalid_watermark_is_rejected(self):
+        response = self.client.get('/api/v1/users/?updated_since=not-a-watermark')
+        self.assertEqual(response.status_code, 400)
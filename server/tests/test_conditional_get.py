@@ -0,0 +1,112 @@
+"""
+ETag / Last-Modified validators on the user read endpoints
+"""
+
+from unittest import mock
+
+from django.utils.http import parse_http_date
+
+from presentation.views import user_views
+from tests.base import UserAPITestCase
+
+
+class DetailConditionalGetTests(UserAPITestCase):
+
+    def test_matching_etag_returns_304_from_the_cache(self):
+        user = self.create_user('alice')
+        first = self.client.get(f"/api/v1/users/{user['id']}/")
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('ETag', first)
+        self.assertIn('Last-Modified', first)
+
+        # The user is cached by the first read; only the version is looked up
+        with self.assertNumQueries(1):
+            second = self.client.get(f"/api/v1/users/{user['id']}/", HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b'')
+
+    def test_revalidation_does_not_load_the_user(self):
+        user = self.create_user('alice')
+        first = self.client.get(f"/api/v1/users/{user['id']}/")
+
+        with mock.patch.object(user_views.user_usecases, 'get_user_by_id') as get_user_by_id:
+            second = self.client.get(f"/api/v1/users/{user['id']}/", HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 304)
+        get_user_by_id.assert_not_called()
+
+    def test_update_changes_the_etag(self):
+        user = self.create_user('alice')
+        before = self.client.get(f"/api/v1/users/{user['id']}/")
+
+        self.assertEqual(self.patch_user(user['id'], name='Alice Cooper').status_code, 200)
+
+        after = self.client.get(f"/api/v1/users/{user['id']}/", HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, 200)
+        self.assertEqual(after.json()['name'], 'Alice Cooper')
+        self.assertNotEqual(after['ETag'], before['ETag'])
+
+    def test_field_projection_is_revalidated(self):
+        user = self.create_user('alice')
+        projected = self.client.get(f"/api/v1/users/{user['id']}/?fields=username")
+
+        self.assertEqual(projected.status_code, 200)
+        self.assertEqual(projected.json(), {"username": "alice"})
+        self.assertEqual(
+            self.client.get(
+                f"/api/v1/users/{user['id']}/?fields=username",
+                HTTP_IF_NONE_MATCH=projected['ETag']
+            ).status_code,
+            304
+        )
+
+    def test_field_projection_does_not_load_the_user(self):
+        user = self.create_user('alice')
+
+        with mock.patch.object(user_views.user_usecases, 'get_user_by_id') as get_user_by_id:
+            projected = self.client.get(f"/api/v1/users/{user['id']}/?fields=email,username")
+        self.assertEqual(projected.json(), {"email": "alice@example.com", "username": "alice"})
+        get_user_by_id.assert_not_called()
+
+
+class ListConditionalGetTests(UserAPITestCase):
+
+    def test_full_list_returns_304_until_a_write(self):
+        self.create_user('alice')
+        first = self.client.get('/api/v1/users/')
+        self.assertEqual(first.status_code, 200)
+
+        repeat = self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(repeat.status_code, 304)
+
+        self.create_user('bob')
+        changed = self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(len(changed.json()), 2)
+
+    def test_delete_changes_the_full_list_validators(self):
+        self.create_user('alice')
+        bob = self.create_user('bob')
+        before = self.client.get('/api/v1/users/')
+
+        self.assertEqual(self.client.delete(f"/api/v1/users/{bob['id']}/").status_code, 204)
+
+        after = self.client.get('/api/v1/users/', HTTP_IF_NONE_MATCH=before['ETag'])
+        self.assertEqual(after.status_code, 200)
+        self.assertNotEqual(after['ETag'], before['ETag'])
+        self.assertGreaterEqual(parse_http_date(after['Last-Modified']), parse_http_date(before['Last-Modified']))
+
+    def test_page_is_validated_by_its_content(self):
+        self.create_user('alice')
+        page = self.client.get('/api/v1/users/?limit=10')
+        self.assertEqual(page.status_code, 200)
+        self.assertNotIn('Last-Modified', page)
+
+        repeat = self.client.get('/api/v1/users/?limit=10', HTTP_IF_NONE_MATCH=page['ETag'])
+        self.assertEqual(repeat.status_code, 304)
+
+    def test_change_feed_has_no_validators(self):
+        self.create_user('alice')
+        response = self.client.get('/api/v1/users/?updated_since=')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
@@ -0,0 +1,106 @@
+"""
+Unique-constraint violations reported as duplicate email or username, and
+the single-statement writes that rely on them
+"""
+
+import json
+from types import SimpleNamespace
+
+from django.db import IntegrityError, connection
+from django.test import SimpleTestCase
+
+from domain.entities.user import CreateUserDTO, UpdateUserDTO
+from infrastructure.database.models import UserModel
+from infrastructure.repositories.django_user_repository import DjangoUserRepository, _duplicate_error
+from tests.base import UserAPITestCase
+
+
+class DriverError(Exception):
+    """Stands in for a psycopg2 error, which exposes the violated constraint"""
+
+    def __init__(self, constraint):
+        super().__init__(constraint)
+        self.diag = SimpleNamespace(constraint_name=constraint)
+
+
+def integrity_error(message, constraint=None):
+    error = IntegrityError(message)
+    if constraint is not None:
+        error.__cause__ = DriverError(constraint)
+    return error
+
+
+class DuplicateErrorMappingTests(SimpleTestCase):
+
+    def test_postgres_constraint_names(self):
+        self.assertEqual(
+            str(_duplicate_error(integrity_error('duplicate key', 'users_email_key'))),
+            'User with this email already exists'
+        )
+        self.assertEqual(
+            str(_duplicate_error(integrity_error('duplicate key', 'users_username_key'))),
+            'User with this username already exists'
+        )
+
+    def test_sqlite_messages(self):
+        self.assertEqual(
+            str(_duplicate_error(integrity_error('UNIQUE constraint failed: users.username'))),
+            'User with this username already exists'
+        )
+
+    def test_unknown_constraint_falls_back_to_both_fields(self):
+        self.assertEqual(
+            str(_duplicate_error(integrity_error('something else'))),
+            'User with this email or username already exists'
+        )
+
+
+class DuplicateCreateTests(UserAPITestCase):
+
+    def post_user(self, email, username):
+        data = {"name": "Alice", "email": email, "username": username}
+        return self.client.post('/api/v1/users/', json.dumps(data), content_type='application/json')
+
+    def test_taken_email_and_username_are_rejected_by_the_database(self):
+        self.create_user('alice')
+
+        email = self.post_user('alice@example.com', 'alice2')
+        username = self.post_user('alice2@example.com', 'alice')
+        self.assertEqual((email.status_code, email.json()['detail']), (400, 'User with this email already exists'))
+        self.assertEqual(
+            (username.status_code, username.json()['detail']),
+            (400, 'User with this username already exists')
+        )
+        self.assertEqual(UserModel.objects.count(), 1)
+
+    def test_create_is_a_single_insert(self):
+        # No pre-check SELECTs: the unique constraints decide
+        with self.assertNumQueries(1):
+            DjangoUserRepository().create(CreateUserDTO(name="Bob", email="bob@example.com", username="bob"))
+
+
+class SingleStatementWriteTests(UserAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.repository = DjangoUserRepository()
+        self.alice = self.repository.create(CreateUserDTO(name="Alice", email="alice@example.com", username="alice"))
+
+    def test_update_returns_the_new_row_from_one_statement(self):
+        queries = 1 if connection.features.can_return_rows_from_bulk_insert else 2
+        with self.assertNumQueries(queries):
+            user = self.repository.update(UpdateUserDTO(id=self.alice.id, name="Alice Cooper"))
+        self.assertEqual((user.name, user.email), ("Alice Cooper", "alice@example.com"))
+        self.assertGreater(user.updated_at, self.alice.updated_at)
+
+    def test_update_of_a_missing_user_returns_none(self):
+        self.assertIsNone(self.repository.update(UpdateUserDTO(id=999999, name="Nobody")))
+
+    def test_update_to_a_taken_username_is_a_duplicate(self):
+        bob = self.repository.create(CreateUserDTO(name="Bob", email="bob@example.com", username="bob"))
+        with self.assertRaisesMessage(ValueError, 'User with this username already exists'):
+            self.repository.update(UpdateUserDTO(id=bob.id, username="alice"))
+
+    def test_delete_reports_whether_a_row_was_removed(self):
+        self.assertTrue(self.repository.delete(self.alice.id))
+        self.assertFalse(self.repository.delete(self.alice.id))
@@ -0,0 +1,59 @@
+"""
+Streaming NDJSON and CSV export of every user
+"""
+
+import gzip
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+
+from tests.base import UserAPITestCase
+
+
+class ExportTests(UserAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create_user('alice', phone='+1 555 0100')
+        self.create_user('bob', website='https://bob.example.com')
+
+    def export(self, query='', **headers):
+        response = self.client.get(f'/api/v1/users/export/{query}', **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        return response, b''.join(response.streaming_content)
+
+    def test_ndjson_has_one_user_per_line_in_id_order(self):
+        response, body = self.export()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson; charset=utf-8')
+        users = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([user['username'] for user in users], ['alice', 'bob'])
+        self.assertEqual(users[0]['phone'], '+1 555 0100')
+
+    def test_csv_has_a_header_and_a_row_per_user(self):
+        response, body = self.export('?format=csv')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="users.csv"')
+        lines = body.decode().splitlines()
+        self.assertEqual(lines[0], 'id,name,email,username,phone,website')
+        self.assertTrue(lines[2].endswith(',bob,,https://bob.example.com'))
+        self.assertEqual(len(lines), 3)
+
+    def test_gzip_follows_accept_encoding_q_values(self):
+        plain, body = self.export()
+
+        response, compressed = self.export(HTTP_ACCEPT_ENCODING='gzip;q=0.5, br')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(compressed), body)
+
+        refused, _ = self.export(HTTP_ACCEPT_ENCODING='gzip;q=0')
+        self.assertNotIn('Content-Encoding', refused)
+        self.assertIn('Accept-Encoding', plain['Vary'])
+
+    async def test_asgi_export_streams_the_same_rows_asynchronously(self):
+        response = await self.async_client.get('/api/v1/users/export/?format=csv')
+        self.assertTrue(response.is_async)
+        body = b''.join([chunk async for chunk in response.streaming_content])
+
+        _, sync_body = await sync_to_async(self.export)('?format=csv')
+        self.assertEqual(body, sync_body)
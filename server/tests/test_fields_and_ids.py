@@ -0,0 +1,53 @@
+"""
+Sparse fieldsets (?fields=) and batch lookups (?ids=) on the user list
+"""
+
+from tests.base import UserAPITestCase
+
+
+class FieldsTests(UserAPITestCase):
+
+    def test_list_returns_only_the_requested_fields_in_order(self):
+        self.create_user('alice')
+        response = self.client.get('/api/v1/users/?fields=username,id')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()['results'][0]), ['id', 'username'])
+
+    def test_projection_selects_only_those_columns(self):
+        self.create_user('alice')
+        with self.assertNumQueries(2) as queries:
+            self.client.get('/api/v1/users/?fields=email&limit=5')
+        select = queries.captured_queries[-1]['sql']
+        self.assertIn('"email"', select)
+        self.assertNotIn('"name"', select)
+
+    def test_unknown_or_empty_fields_are_rejected(self):
+        self.assertEqual(self.client.get('/api/v1/users/?fields=password').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/users/?fields=').status_code, 400)
+        user = self.create_user('alice')
+        self.assertEqual(self.client.get(f"/api/v1/users/{user['id']}/?fields=password").status_code, 400)
+
+
+class BatchGetTests(UserAPITestCase):
+
+    def test_found_users_keep_request_order_and_missing_ids_are_listed(self):
+        alice = self.create_user('alice')
+        bob = self.create_user('bob')
+        response = self.client.get(f"/api/v1/users/?ids={bob['id']},999999,{alice['id']},{bob['id']}")
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([user['username'] for user in body['results']], ['bob', 'alice'])
+        self.assertEqual(body['missing'], [999999])
+
+    def test_batch_is_one_in_query(self):
+        alice = self.create_user('alice')
+        bob = self.create_user('bob')
+        # The table version, then a single IN (...) for both users
+        with self.assertNumQueries(2):
+            self.client.get(f"/api/v1/users/?ids={alice['id']},{bob['id']}")
+
+    def test_invalid_ids_are_rejected(self):
+        self.assertEqual(self.client.get('/api/v1/users/?ids=a,b').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/users/?ids=').status_code, 400)
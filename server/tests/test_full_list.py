@@ -0,0 +1,31 @@
+"""
+The capped, deprecated unpaginated user list
+"""
+
+from django.test import override_settings
+
+from tests.base import UserAPITestCase
+
+
+class FullListTests(UserAPITestCase):
+
+    def test_list_under_the_cap_is_not_truncated(self):
+        self.create_user('alice')
+        response = self.client.get('/api/v1/users/')
+
+        self.assertEqual(response['Deprecation'], 'true')
+        self.assertEqual(response['X-Total-Count'], '1')
+        self.assertNotIn('X-Truncated', response)
+
+    @override_settings(USER_LIST_ALL_MAX=2)
+    def test_list_over_the_cap_says_it_was_truncated(self):
+        for username in ('alice', 'bob', 'carol'):
+            self.create_user(username)
+
+        first = self.client.get('/api/v1/users/')
+        # Served from the page cache the second time
+        second = self.client.get('/api/v1/users/')
+        for response in (first, second):
+            self.assertEqual(len(response.json()), 2)
+            self.assertEqual(response['X-Total-Count'], '3')
+            self.assertEqual(response['X-Truncated'], 'true')
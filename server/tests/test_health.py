@@ -0,0 +1,43 @@
+"""
+Readiness payload of the health endpoints
+"""
+
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from infrastructure.monitoring.database_probe import ProbeResult
+from presentation.views import health_views
+
+
+def probe_returns(result):
+    return mock.patch.object(health_views.database_probe, 'check', return_value=result)
+
+
+class ReadinessTests(SimpleTestCase):
+
+    def test_database_stays_a_string_with_details_alongside(self):
+        result = ProbeResult(healthy=True, detail="connected", checked_at=time.monotonic(), latency_ms=0.5)
+        with probe_returns(result):
+            for url in ('/api/v1/health/', '/api/v1/health/ready/'):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, 200)
+                body = response.json()
+                self.assertEqual(body['status'], 'healthy')
+                self.assertEqual(body['database'], 'connected')
+                self.assertEqual(body['database_details']['latency_ms'], 0.5)
+
+    def test_failed_check_returns_503(self):
+        result = ProbeResult(healthy=False, detail="disconnected: refused", checked_at=time.monotonic())
+        with probe_returns(result):
+            response = self.client.get('/api/v1/health/ready/')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['status'], 'unhealthy')
+        self.assertEqual(response.json()['database'], 'disconnected: refused')
+
+    def test_liveness_touches_no_dependencies(self):
+        with mock.patch.object(health_views.database_probe, 'check') as check:
+            response = self.client.get('/api/v1/health/live/')
+        self.assertEqual(response.json(), {"status": "alive"})
+        check.assert_not_called()
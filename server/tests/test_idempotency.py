@@ -0,0 +1,72 @@
+"""
+Idempotency-Key replay on write endpoints
+"""
+
+import json
+
+from infrastructure.database.models import IdempotencyKeyModel, UserModel
+from tests.base import UserAPITestCase
+
+
+class IdempotencyTests(UserAPITestCase):
+
+    def post_user(self, key, username):
+        data = {"name": "Alice", "email": f"{username}@example.com", "username": username}
+        return self.client.post(
+            '/api/v1/users/',
+            json.dumps(data),
+            content_type='application/json',
+            HTTP_IDEMPOTENCY_KEY=key
+        )
+
+    def test_retry_replays_the_stored_response(self):
+        first = self.post_user('key-1', 'alice')
+        retry = self.post_user('key-1', 'alice')
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.content, first.content)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertNotIn('Idempotent-Replayed', first)
+        self.assertEqual(UserModel.objects.count(), 1)
+
+    def test_reusing_a_key_with_another_body_is_rejected(self):
+        self.post_user('key-1', 'alice')
+        mismatch = self.post_user('key-1', 'bob')
+
+        self.assertEqual(mismatch.status_code, 422)
+        self.assertFalse(UserModel.objects.filter(username='bob').exists())
+
+    def test_client_errors_are_replayed_too(self):
+        first = self.client.post(
+            '/api/v1/users/', json.dumps({"name": "Alice"}),
+            content_type='application/json', HTTP_IDEMPOTENCY_KEY='key-1'
+        )
+        retry = self.client.post(
+            '/api/v1/users/', json.dumps({"name": "Alice"}),
+            content_type='application/json', HTTP_IDEMPOTENCY_KEY='key-1'
+        )
+        self.assertEqual(first.status_code, 400)
+        self.assertEqual(retry.status_code, 400)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+
+    def test_keys_are_scoped_to_method_and_path(self):
+        user = self.post_user('key-1', 'alice').json()
+        response = self.client.patch(
+            f"/api/v1/users/{user['id']}/",
+            json.dumps({"name": "Alice Cooper"}),
+            content_type='application/json',
+            HTTP_IDEMPOTENCY_KEY='key-1'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(IdempotencyKeyModel.objects.count(), 2)
+
+    def test_overlong_key_is_rejected(self):
+        response = self.post_user('k' * 256, 'alice')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(UserModel.objects.exists())
+
+    def test_request_without_a_key_is_not_stored(self):
+        self.create_user('alice')
+        self.assertFalse(IdempotencyKeyModel.objects.exists())
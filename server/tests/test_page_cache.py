@@ -0,0 +1,76 @@
+"""
+Pre-rendered list pages keyed by the users table version
+"""
+
+from django.db import connection
+
+from infrastructure.database.table_version import users_table_version
+from infrastructure.monitoring.metrics import LIST_PAGE_CACHE_REQUESTS
+from tests.base import UserAPITestCase
+
+
+def cache_hits():
+    return LIST_PAGE_CACHE_REQUESTS._values.get(('hit',), 0)
+
+
+class TableVersionTests(UserAPITestCase):
+
+    def test_every_write_bumps_the_version(self):
+        before = users_table_version()
+        user = self.create_user('alice')
+        after_create = users_table_version()
+        self.patch_user(user['id'], name='Alice Cooper')
+        after_update = users_table_version()
+        self.client.delete(f"/api/v1/users/{user['id']}/")
+        after_delete = users_table_version()
+
+        self.assertIsNotNone(before)
+        self.assertLess(before, after_create)
+        self.assertLess(after_create, after_update)
+        self.assertLess(after_update, after_delete)
+
+    def test_raw_sql_writes_bump_the_version(self):
+        self.create_user('alice')
+        before = users_table_version()
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE users SET name = 'Changed'")
+        self.assertGreater(users_table_version(), before)
+
+
+class ListPageCacheTests(UserAPITestCase):
+
+    def test_repeat_request_is_served_from_the_cache(self):
+        self.create_user('alice')
+        first = self.client.get('/api/v1/users/?limit=10')
+        hits = cache_hits()
+
+        # Only the table version lookup runs on a hit
+        with self.assertNumQueries(1):
+            second = self.client.get('/api/v1/users/?limit=10')
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(cache_hits(), hits + 1)
+
+    def test_write_outside_the_api_is_never_served_stale(self):
+        self.create_user('alice')
+        self.client.get('/api/v1/users/?limit=10')
+
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE users SET name = 'Changed'")
+
+        page = self.client.get('/api/v1/users/?limit=10').json()
+        self.assertEqual([user['name'] for user in page['results']], ['Changed'])
+
+    def test_query_strings_are_cached_separately(self):
+        self.create_user('alice')
+        self.create_user('bob')
+        one = self.client.get('/api/v1/users/?limit=1').json()
+        two = self.client.get('/api/v1/users/?limit=2').json()
+        self.assertEqual(len(one['results']), 1)
+        self.assertEqual(len(two['results']), 2)
+
+    def test_ids_batches_are_left_to_the_user_cache(self):
+        user = self.create_user('alice')
+        before = dict(LIST_PAGE_CACHE_REQUESTS._values)
+        self.client.get(f"/api/v1/users/?ids={user['id']}")
+        self.client.get(f"/api/v1/users/?ids={user['id']}")
+        self.assertEqual(LIST_PAGE_CACHE_REQUESTS._values, before)
@@ -0,0 +1,47 @@
+"""
+Keyset (cursor) pagination of GET /api/v1/users/
+"""
+
+from unittest import mock
+
+from tests.base import UserAPITestCase
+
+
+class CursorPaginationTests(UserAPITestCase):
+
+    def page(self, query):
+        response = self.client.get(f'/api/v1/users/?{query}')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def test_cursors_walk_every_user_once_newest_first(self):
+        for username in ('alice', 'bob', 'carol'):
+            self.create_user(username)
+
+        first = self.page('limit=2')
+        second = self.page(f"limit=2&cursor={first['next_cursor']}")
+
+        self.assertEqual([user['username'] for user in first['results']], ['carol', 'bob'])
+        self.assertEqual([user['username'] for user in second['results']], ['alice'])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_insert_between_pages_does_not_shift_the_next_page(self):
+        for username in ('alice', 'bob', 'carol'):
+            self.create_user(username)
+        first = self.page('limit=2')
+
+        self.create_user('dave')
+        second = self.page(f"limit=2&cursor={first['next_cursor']}")
+        self.assertEqual([user['username'] for user in second['results']], ['alice'])
+
+    @mock.patch('domain.usecases.user_usecases.MAX_PAGE_SIZE', 1)
+    def test_limit_is_capped(self):
+        self.create_user('alice')
+        self.create_user('bob')
+        page = self.page('limit=100000')
+        self.assertEqual(len(page['results']), 1)
+        self.assertIsNotNone(page['next_cursor'])
+
+    def test_invalid_cursor_and_limit_are_rejected(self):
+        self.assertEqual(self.client.get('/api/v1/users/?cursor=garbage').status_code, 400)
+        self.assertEqual(self.client.get('/api/v1/users/?limit=-1').status_code, 400)
@@ -0,0 +1,201 @@
+"""
+Query plan regression tests: run every DjangoUserRepository query against a
+seeded database, EXPLAIN each statement that touches the user tables and
+fail if any of them falls back to a sequential scan or a sort over more
+rows than QUERY_PLAN_THRESHOLD.
+
+On SQLite the plans come from EXPLAIN QUERY PLAN; on PostgreSQL from
+EXPLAIN (FORMAT JSON), using the planner's row estimates.
+"""
+
+import json
+import re
+from datetime import datetime, timedelta, timezone
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from domain.entities.user import CreateUserDTO, UpdateUserDTO, UserSearchCriteria
+from infrastructure.database.models import UserModel
+from infrastructure.repositories.django_user_repository import DjangoUserRepository
+
+SEEDED_USERS = 3000
+QUERY_PLAN_THRESHOLD = 1000
+TABLES = ('users', 'user_tombstones')
+PREFIX = 'plan_'
+
+# Queries that read the whole table by design; their plans are not checked
+WHOLE_TABLE = {
+    'get_all': "returns every user",
+    'iter_all': "streams every user",
+    'get_table_stamp': "count(*) reads every row",
+}
+
+# Known plan shapes that only a PostgreSQL-specific index can avoid
+ALLOWED = {
+    'sqlite': {
+        'search': "substring and lower() prefix search use pg_trgm indexes on PostgreSQL only (migration 0002)",
+    },
+}
+
+_EXPLAINABLE = re.compile(r'^\s*(SELECT|UPDATE|DELETE|WITH)\b', re.IGNORECASE)
+
+
+def touches_user_tables(sql):
+    return any(re.search(rf'\b"?{table}"?\b', sql) for table in TABLES)
+
+
+def table_rows():
+    """Current row count of each checked table"""
+    with connection.cursor() as cursor:
+        counts = {}
+        for table in TABLES:
+            cursor.execute(f'SELECT COUNT(*) FROM {connection.ops.quote_name(table)}')
+            counts[table] = cursor.fetchone()[0]
+    return counts
+
+
+def sqlite_problems(sql, rows, threshold):
+    """Plan lines showing a full table scan or a temp B-tree sort on a large table"""
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+        plan = [row[-1] for row in cursor.fetchall()]
+    problems = []
+    for line in plan:
+        scan = re.match(r'SCAN (\w+)$', line)
+        if scan and rows.get(scan.group(1), 0) > threshold:
+            problems.append(line)
+        elif line.startswith('USE TEMP B-TREE') and max(rows.values()) > threshold:
+            problems.append(line)
+    return problems
+
+
+def postgres_problems(sql, rows, threshold):
+    """Seq Scan nodes on large user tables and Sort nodes over more than threshold rows"""
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}')
+        document = cursor.fetchone()[0]
+    if isinstance(document, str):
+        document = json.loads(document)
+
+    problems = []
+
+    def walk(node):
+        line = node['Node Type']
+        if 'Relation Name' in node:
+            line += f" on {node['Relation Name']}"
+        line += f" (rows={node.get('Plan Rows')})"
+        if node['Node Type'] == 'Seq Scan' and rows.get(node.get('Relation Name'), 0) > threshold:
+            problems.append(line)
+        elif node['Node Type'] in ('Sort', 'Incremental Sort') and node.get('Plan Rows', 0) > threshold:
+            problems.append(line)
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(document[0]['Plan'])
+    return problems
+
+
+def seed(users):
+    """Bulk insert users with spread-out timestamps, then delete a tenth of them"""
+    start = datetime.now(timezone.utc) - timedelta(days=30)
+    UserModel.objects.bulk_create([
+        UserModel(name=f"Plan User {i}", email=f"{PREFIX}{i}@example.com", username=f"{PREFIX}{i}")
+        for i in range(users)
+    ])
+    ids = list(UserModel.objects.order_by('id').values_list('id', flat=True))
+    # auto_now_add/auto_now stamp every row alike; spread them out like real data
+    for index, user_id in enumerate(ids):
+        if index % 97 == 0:
+            stamp = start + timedelta(minutes=index)
+            UserModel.objects.filter(id=user_id).update(created_at=stamp, updated_at=stamp)
+    DjangoUserRepository().delete_many(ids[::10])
+    return [user_id for index, user_id in enumerate(ids) if index % 10]
+
+
+def cases(ids):
+    """(name, operation) pairs covering every DjangoUserRepository query, in run order"""
+    repository = DjangoUserRepository()
+    middle = ids[len(ids) // 2]
+    state = {}
+
+    def deep_page():
+        cursor = None
+        for _ in range(3):
+            cursor = repository.list_page(cursor, 200).next_cursor
+        return repository.list_page(cursor, 50)
+
+    def changes_after_midpoint():
+        until = datetime.now(timezone.utc)
+        page = repository.list_changes(None, len(ids) // 2, until)
+        return repository.list_changes(page.watermark, 50, until)
+
+    def create():
+        state['user'] = repository.create(CreateUserDTO(
+            name="Plan Check", email=f"{PREFIX}new@example.com", username=f"{PREFIX}new"
+        ))
+
+    def create_many():
+        state['users'] = repository.create_many([
+            CreateUserDTO(name="Plan Check", email=f"{PREFIX}bulk{i}@example.com", username=f"{PREFIX}bulk{i}")
+            for i in range(5)
+        ])
+
+    return [
+        ('get_all', repository.get_all),
+        ('iter_all', lambda: list(repository.iter_all())),
+        ('list_after_id', lambda: repository.list_after_id(middle, 500)),
+        ('get_table_stamp', repository.get_table_stamp),
+        ('list_page', lambda: repository.list_page(None, 50)),
+        ('list_page (cursor)', deep_page),
+        ('list_page_projection', lambda: repository.list_page_projection(None, 50, ('id', 'username'))),
+        ('search', lambda: repository.search(UserSearchCriteria(username=f"{PREFIX}{len(ids) // 2}"), None, 50)),
+        ('get_by_id', lambda: repository.get_by_id(middle)),
+        ('get_many', lambda: repository.get_many(ids[:50])),
+        ('get_projection_by_id', lambda: repository.get_projection_by_id(middle, ('id', 'email'))),
+        ('get_last_modified', lambda: repository.get_last_modified(middle)),
+        ('list_changes', lambda: repository.list_changes(None, 50, datetime.now(timezone.utc))),
+        ('list_changes (watermark)', changes_after_midpoint),
+        ('exists_by_email', lambda: repository.exists_by_email(f"{PREFIX}1@example.com", exclude_id=middle)),
+        ('exists_by_username', lambda: repository.exists_by_username(f"{PREFIX}1", exclude_id=middle)),
+        ('find_taken', lambda: repository.find_taken([f"{PREFIX}1@example.com"], [f"{PREFIX}2"])),
+        ('create', create),
+        ('create_many', create_many),
+        ('update', lambda: repository.update(UpdateUserDTO(id=state['user'].id, name="Renamed"))),
+        ('update_many', lambda: repository.update_many([
+            UpdateUserDTO(id=user.id, name="Renamed") for user in state['users']
+        ])),
+        ('delete', lambda: repository.delete(state['user'].id)),
+        ('delete_many', lambda: repository.delete_many([user.id for user in state['users']])),
+    ]
+
+
+class QueryPlanTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.ids = seed(SEEDED_USERS)
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_no_query_scans_or_sorts_a_large_table(self):
+        explain = postgres_problems if connection.vendor == 'postgresql' else sqlite_problems
+        allowed = ALLOWED.get(connection.vendor, {})
+        rows = table_rows()
+
+        for name, operation in cases(self.ids):
+            with CaptureQueriesContext(connection) as queries:
+                operation()
+            method = name.split(' ')[0]
+            if method in WHOLE_TABLE or method in allowed:
+                continue
+
+            with self.subTest(name):
+                problems = [
+                    problem
+                    for query in queries.captured_queries
+                    if _EXPLAINABLE.match(query['sql']) and touches_user_tables(query['sql'])
+                    for problem in explain(query['sql'], rows, QUERY_PLAN_THRESHOLD)
+                ]
+                self.assertEqual(problems, [], f"{name} uses a sequential scan or sort")
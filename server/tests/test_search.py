@@ -0,0 +1,42 @@
+"""
+Ranked, keyset-paginated user search
+"""
+
+from tests.base import UserAPITestCase
+
+
+class SearchTests(UserAPITestCase):
+
+    def search(self, query):
+        response = self.client.get(f'/api/v1/users/search/?{query}')
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()
+
+    def usernames(self, page):
+        return [user['username'] for user in page['results']]
+
+    def test_exact_then_prefix_then_substring_matches(self):
+        self.create_user('mark', name='Bookmark Keeper')
+        self.create_user('markus')
+        self.create_user('ann', name='Mark Anthony', email='ann@example.com')
+
+        self.assertEqual(self.usernames(self.search('q=MARK')), ['mark', 'markus', 'ann'])
+
+    def test_email_and_username_are_prefix_filters(self):
+        self.create_user('alice', email='alice@example.com')
+        self.create_user('malice', email='malice@example.com')
+
+        self.assertEqual(self.usernames(self.search('username=ali')), ['alice'])
+        self.assertEqual(self.usernames(self.search('email=mal')), ['malice'])
+
+    def test_pages_follow_the_cursor(self):
+        for username in ('ann', 'anna', 'annabel'):
+            self.create_user(username)
+
+        first = self.search('q=ann&limit=2')
+        second = self.search(f"q=ann&limit=2&cursor={first['next_cursor']}")
+        self.assertEqual(self.usernames(first) + self.usernames(second), ['ann', 'anna', 'annabel'])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_a_filter_is_required(self):
+        self.assertEqual(self.client.get('/api/v1/users/search/').status_code, 400)
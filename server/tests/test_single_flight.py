@@ -0,0 +1,142 @@
+"""
+Coalescing of concurrent identical reads
+"""
+
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+
+from infrastructure.repositories.single_flight_user_repository import (
+    AsyncSingleFlightUserRepository,
+    SingleFlight,
+    SingleFlightUserRepository
+)
+
+
+class BlockingRepository:
+    """Stub repository whose reads block until released, counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_by_id(self, user_id):
+        self.calls += 1
+        self.started.set()
+        self.release.wait(5)
+        return {"id": user_id, "call": self.calls}
+
+    def delete(self, user_id):
+        return True
+
+
+class AsyncRepository:
+    """Async stub whose reads wait for an event, counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def aget_by_id(self, user_id):
+        self.calls += 1
+        await self.release.wait()
+        return {"id": user_id}
+
+
+def run_concurrently(count, target):
+    results = [None] * count
+    errors = [None] * count
+
+    def call(index):
+        try:
+            results[index] = target()
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+class SingleFlightTests(SimpleTestCase):
+
+    def test_concurrent_identical_reads_share_one_call(self):
+        inner = BlockingRepository()
+        repository = SingleFlightUserRepository(inner)
+
+        threads, results, errors = run_concurrently(5, lambda: repository.get_by_id(1))
+        inner.started.wait(5)
+        inner.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [None] * 5)
+        self.assertEqual(inner.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_errors_are_shared_and_not_cached(self):
+        flights = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("database down")
+
+        threads, results, errors = run_concurrently(3, lambda: flights.do(('get_by_id', 1), failing))
+        started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertTrue(all(isinstance(error, RuntimeError) for error in errors))
+        # The failed flight is over, so the next caller runs its own
+        self.assertEqual(flights.do(('get_by_id', 1), lambda: 'ok'), 'ok')
+
+    def test_write_starts_a_new_flight(self):
+        inner = BlockingRepository()
+        repository = SingleFlightUserRepository(inner)
+
+        threads, results, errors = run_concurrently(1, lambda: repository.get_by_id(1))
+        inner.started.wait(5)
+        # A read that began before the write must not be shared after it
+        repository.delete(1)
+        after_write, _, _ = run_concurrently(1, lambda: repository.get_by_id(1))
+        inner.release.set()
+        for thread in threads + after_write:
+            thread.join(5)
+
+        self.assertEqual(inner.calls, 2)
+
+    def test_async_reads_share_one_task(self):
+        inner = AsyncRepository()
+        repository = AsyncSingleFlightUserRepository(inner)
+
+        async def scenario():
+            readers = [asyncio.ensure_future(repository.aget_by_id(1)) for _ in range(5)]
+            await asyncio.sleep(0)
+            inner.release.set()
+            return await asyncio.gather(*readers)
+
+        results = asyncio.run(scenario())
+        self.assertEqual(inner.calls, 1)
+        self.assertEqual(results, [{"id": 1}] * 5)
+
+    def test_cancelled_async_caller_does_not_cancel_the_others(self):
+        inner = AsyncRepository()
+        repository = AsyncSingleFlightUserRepository(inner)
+
+        async def scenario():
+            first = asyncio.ensure_future(repository.aget_by_id(1))
+            second = asyncio.ensure_future(repository.aget_by_id(1))
+            await asyncio.sleep(0)
+            first.cancel()
+            inner.release.set()
+            return await second
+
+        self.assertEqual(asyncio.run(scenario()), {"id": 1})
+        self.assertEqual(inner.calls, 1)
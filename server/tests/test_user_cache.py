@@ -0,0 +1,37 @@
+"""
+Read-through user cache keyed by the users table version
+"""
+
+from django.db import connection
+
+from infrastructure.monitoring.metrics import USER_CACHE_REQUESTS
+from tests.base import UserAPITestCase
+
+
+def cache_hits():
+    return USER_CACHE_REQUESTS._values.get(('hit',), 0)
+
+
+class UserCacheTests(UserAPITestCase):
+
+    def test_repeat_lookup_is_a_hit(self):
+        user = self.create_user('alice')
+        self.client.get(f"/api/v1/users/{user['id']}/")
+        hits = cache_hits()
+
+        self.client.get(f"/api/v1/users/{user['id']}/")
+        self.assertEqual(cache_hits(), hits + 1)
+
+    def test_write_outside_the_api_is_never_served_stale(self):
+        user = self.create_user('alice')
+        self.client.get(f"/api/v1/users/{user['id']}/")
+        self.client.get(f"/api/v1/users/?ids={user['id']}")
+
+        # What another worker, the admin or a migration would do
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE users SET name = 'Changed'")
+
+        detail = self.client.get(f"/api/v1/users/{user['id']}/").json()
+        batch = self.client.get(f"/api/v1/users/?ids={user['id']}").json()
+        self.assertEqual(detail['name'], 'Changed')
+        self.assertEqual([found['name'] for found in batch['results']], ['Changed'])
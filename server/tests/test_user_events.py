@@ -0,0 +1,108 @@
+"""
+Server-sent events stream of user changes
+"""
+
+import asyncio
+import json
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
+
+from config import dependencies
+
+from domain.entities.user import USER_CREATED, USER_DELETED, User, UserEvent
+from infrastructure.database.models import UserModel
+from infrastructure.events.user_event_bus import UserEventBus
+from tests.base import UserAPITestCase
+
+
+def created(user_id):
+    user = User(id=user_id, name="Alice", email="alice@example.com", username=f"alice{user_id}")
+    return UserEvent(type=USER_CREATED, user_id=user_id, user=user)
+
+
+class UserEventBusTests(SimpleTestCase):
+
+    def test_subscribers_receive_published_frames(self):
+        async def scenario():
+            bus = UserEventBus()
+            subscription = bus.subscribe()
+            bus.publish([created(1), UserEvent(type=USER_DELETED, user_id=2)])
+            return await subscription.get(1)
+
+        events = asyncio.run(scenario())
+        self.assertEqual([event.type for event in events], ['created', 'deleted'])
+        self.assertEqual(json.loads(events[0].data)['username'], 'alice1')
+        self.assertTrue(events[1].frame.startswith(f"id: {events[1].id}\nevent: user.deleted\n".encode()))
+
+    def test_reconnect_resumes_after_last_event_id(self):
+        async def scenario():
+            bus = UserEventBus()
+            bus.publish([created(1), created(2), created(3)])
+            first_id = bus._buffer[0].id
+            return bus.subscribe(first_id), bus.subscribe('unknown-1')
+
+        resumed, lost = asyncio.run(scenario())
+        self.assertEqual([json.loads(event.data)['id'] for event in resumed.backlog], [2, 3])
+        self.assertFalse(resumed.missed)
+        self.assertTrue(lost.missed)
+
+    def test_slow_subscriber_overflows_instead_of_buffering(self):
+        async def scenario():
+            bus = UserEventBus(queue_size=2)
+            subscription = bus.subscribe()
+            bus.publish([created(user_id) for user_id in range(1, 4)])
+            await subscription.get(1)
+            return subscription
+
+        self.assertTrue(asyncio.run(scenario()).overflowed)
+
+
+class EventStreamViewTests(UserAPITestCase):
+
+    def test_wsgi_is_refused(self):
+        self.assertEqual(self.client.get('/api/v1/async/users/events/').status_code, 501)
+
+    async def test_asgi_stream_delivers_writes(self):
+        response = await self.async_client.get('/api/v1/async/users/events/')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        try:
+            self.assertTrue((await anext(stream)).startswith(b'retry: '))
+
+            await self.async_client.post(
+                '/api/v1/async/users/',
+                {"name": "Alice", "email": "alice@example.com", "username": "alice"},
+                content_type='application/json'
+            )
+            frame = (await asyncio.wait_for(anext(stream), 5)).decode()
+        finally:
+            await stream.aclose()
+
+        self.assertIn('event: user.created\n', frame)
+        self.assertEqual(json.loads(frame.split('data: ', 1)[1])['username'], 'alice')
+
+
+class AdminEventTests(UserAPITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(get_user_model().objects.create_superuser('admin', 'admin@example.com', 'secret'))
+
+    def published_types(self, publish):
+        return [event.type for call in publish.call_args_list for event in call.args[0]]
+
+    def test_admin_writes_are_published(self):
+        with mock.patch.object(dependencies.user_events, 'publish') as publish:
+            self.client.post('/admin/database/usermodel/add/', {
+                'name': 'Alice', 'email': 'alice@example.com', 'username': 'alice', 'phone': '', 'website': ''
+            })
+            user = UserModel.objects.get(username='alice')
+            self.client.post(f'/admin/database/usermodel/{user.pk}/change/', {
+                'name': 'Alice Cooper', 'email': 'alice@example.com', 'username': 'alice', 'phone': '', 'website': ''
+            })
+            self.client.post(f'/admin/database/usermodel/{user.pk}/delete/', {'post': 'yes'})
+
+        self.assertEqual(self.published_types(publish), ['created', 'updated', 'deleted'])
+        self.assertFalse(UserModel.objects.exists())
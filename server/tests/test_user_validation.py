@@ -0,0 +1,50 @@
+"""
+Framework-free user field validation shared by every entry point
+"""
+
+from django.core.exceptions import ValidationError
+from django.core.validators import EmailValidator, URLValidator
+from django.test import SimpleTestCase
+
+from domain.entities.user import User
+from domain.validation.user_validation import is_valid_email, is_valid_url, user_field_errors
+from presentation.serializers.user_serializers import CreateUserSerializer
+
+EMAILS = (
+    'a@b.com', 'a+tag@b.io', 'a@localhost', 'a@b', 'a..b@c.com', '"a b"@c.com',
+    'a@[127.0.0.1]', 'a@[1.2.3]', 'a@exämple.com', '@b.com', 'a@-b.com', 'a@b_c.com',
+)
+URLS = (
+    'http://a.com', 'https://a.com/x?y#z', 'ftp://a.b', 'mailto:a@b.com', 'http://localhost:8000/',
+    'http://256.0.0.1', 'http://[::1]:80/', 'http://[::zz]', 'http://exämple.com', 'http://a',
+    'http://-a.com', 'http://a.com\n', 'a.com',
+)
+
+
+def django_accepts(validator, value):
+    try:
+        validator(value)
+    except ValidationError:
+        return False
+    return True
+
+
+class UserValidationTests(SimpleTestCase):
+
+    def test_formats_match_djangos_validators(self):
+        for email in EMAILS:
+            with self.subTest(email=email):
+                self.assertEqual(is_valid_email(email), django_accepts(EmailValidator(), email))
+        for url in URLS:
+            with self.subTest(url=url):
+                self.assertEqual(is_valid_url(url), django_accepts(URLValidator(), url))
+
+    def test_every_entry_point_rejects_the_same_email(self):
+        data = {"name": "Alice", "email": "alice@-example.com", "username": "alice"}
+
+        serializer = CreateUserSerializer(data=data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('email', serializer.errors)
+        self.assertIn('email', user_field_errors(data))
+        with self.assertRaises(ValueError):
+            User(id=None, **data)